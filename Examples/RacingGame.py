@@ -76,24 +76,29 @@ class Scene:
 
 class LoadAssetsScene(Scene):
     def initialize(self):
-        self.has_one_frame_been_processed = False
-        loading_label = Label(self.ui_manager, Position(DockType.CENTER, Vector2.zero()), Colors.WHITE, "Loading...", 100)
-        loading_label.position.offset = -Vector2(loading_label.screen_size.width, loading_label.screen_size.height) / 2
-        self.ui_manager.add_element("loadingText", loading_label)
+        self.loading_label = Label(self.ui_manager, Position(DockType.CENTER, Vector2.zero()), Colors.WHITE, "Loading...", 100)
+        self.center_loading_label()
+        self.ui_manager.add_element("loadingText", self.loading_label)
 
-    def draw(self):
-        if self.has_one_frame_been_processed:
-            self.load_assets()
+        # The textures load in the background, so the loading screen keeps drawing (and showing progress) meanwhile.
+        self.textures = {
+            "racecar": Texture.load_async("Assets/racecar.png"),
+            "highway": Texture.load_async("Assets/highway.png")
+        }
+
+    def update(self):
+        super().update()
+        self.loading_label.text = f"Loading... {int(TextureLoader.progress() * 100)}%"
+        self.center_loading_label()
+
+        if all(handle.done for handle in self.textures.values()):
+            for name, handle in self.textures.items():
+                self.game.assets[name] = handle.texture
             #self.game.change_scene(MenuScene(self.game))
             self.game.change_scene(MainScene(self.game))
-        else:
-            self.has_one_frame_been_processed = True
-
-        super().draw()
 
-    def load_assets(self):
-        self.game.assets["racecar"] = Texture("Assets/racecar.png")
-        self.game.assets["highway"] = Texture("Assets/highway.png")
+    def center_loading_label(self):
+        self.loading_label.position.offset = -Vector2(self.loading_label.screen_size.width, self.loading_label.screen_size.height) / 2
 
 
 class MenuScene(Scene):
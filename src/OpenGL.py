@@ -13,12 +13,26 @@ import OpenGL.GL as _gl
 import glfw as _glfw
 import abc as _abc
 from PIL import Image as _img
+import numpy as _np
+import math as _math
+import ctypes as _ctypes
+import os as _os
+import hashlib as _hashlib
+import time as _time
+import concurrent.futures as _futures
 from enum import IntEnum as _enum
 import sys as _sys
 
 
 class Vector2:
-    """Represents a 2-dimensional vector, with an x and y position."""
+    """Represents a 2-dimensional vector, with an x and y position.
+
+    The in-place operators (+=, -=, *= and /=) and set() change this Vector2 rather than creating a new one, so every
+    reference to it sees the change. Sprites copy the vectors they're given, but copy() a Vector2 before keeping it
+    anywhere else it shouldn't move with the original."""
+
+    __slots__ = ("x", "y")
+
     @staticmethod
     def zero():
         """Returns a Vector2 with values (0, 0)."""
@@ -50,8 +64,23 @@ class Vector2:
         :param other: The Vector2 to add.
         :return: The added values.
         """
+        if not isinstance(other, Vector2):
+            return NotImplemented
         return Vector2(self.x + other.x, self.y + other.y)
 
+    def __iadd__(self, other: 'Vector2') -> 'Vector2':
+        """
+        Adds the other Vector2's x and y values to this Vector2's, in place, without creating a new Vector2.
+
+        :param other: The Vector2 to add.
+        :return: This Vector2.
+        """
+        if not isinstance(other, Vector2):
+            return NotImplemented
+        self.x += other.x
+        self.y += other.y
+        return self
+
     def __sub__(self, other: 'Vector2') -> 'Vector2':
         """
         Subtracts the two x-values, and two y-values, from the Vector2s.
@@ -59,8 +88,23 @@ class Vector2:
         :param other: The Vector2 to subtract.
         :return: The subtracted values.
         """
+        if not isinstance(other, Vector2):
+            return NotImplemented
         return Vector2(self.x - other.x, self.y - other.y)
 
+    def __isub__(self, other: 'Vector2') -> 'Vector2':
+        """
+        Subtracts the other Vector2's x and y values from this Vector2's, in place, without creating a new Vector2.
+
+        :param other: The Vector2 to subtract.
+        :return: This Vector2.
+        """
+        if not isinstance(other, Vector2):
+            return NotImplemented
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
     def __mul__(self, other) -> 'Vector2':
         """
         Multiplies the two x-values, and two y-values, of the Vector2s together.
@@ -68,12 +112,12 @@ class Vector2:
         :param other: The Vector2 to multiply.
         :return: THe multiplied values.
         """
-        if type(other) == Vector2:
+        if isinstance(other, Vector2):
             return Vector2(self.x * other.x, self.y * other.y)
         elif type(other) == float or type(other) == int:
             return Vector2(self.x * other, self.y * other)
         else:
-            raise TypeError(f"unsupported operand type(s) for *: 'Vector2' and '{type(other).__name__}'")
+            return NotImplemented
 
     def __rmul__(self, other) -> 'Vector2':
         """
@@ -82,11 +126,29 @@ class Vector2:
         :param other: The Vector2 to multiply.
         :return: The multiplied values.
         """
-        if (type(other) != Vector2 and type(other) != int and type(other) != float):
-            raise TypeError(f"unsupported operand type(s) for *: '{type(other).__name__}' and 'Vector2'")
+        if (not isinstance(other, Vector2) and type(other) != int and type(other) != float):
+            return NotImplemented
         else:
             return self * other
 
+    def __imul__(self, other) -> 'Vector2':
+        """
+        Multiplies this Vector2's x and y values by the other Vector2's (or a number), in place, without creating a new
+        Vector2.
+
+        :param other: The Vector2 or number to multiply by.
+        :return: This Vector2.
+        """
+        if isinstance(other, Vector2):
+            self.x *= other.x
+            self.y *= other.y
+        elif type(other) == float or type(other) == int:
+            self.x *= other
+            self.y *= other
+        else:
+            return NotImplemented
+        return self
+
     def __truediv__(self, other) -> 'Vector2':
         """
         Divides the two x-values, and two y-values, of the Vector2s together.
@@ -94,12 +156,30 @@ class Vector2:
         :param other: The Vector2 to divide.
         :return: The divided value.
         """
-        if type(other) == Vector2:
+        if isinstance(other, Vector2):
             return Vector2(self.x / other.x, self.y / other.y)
         elif type(other) == float or type(other) == int:
             return Vector2(self.x / other, self.y / other)
         else:
-            raise TypeError(f"unsupported operand type(s) for /: 'Vector2' and '{type(other).__name__}'")
+            return NotImplemented
+
+    def __itruediv__(self, other) -> 'Vector2':
+        """
+        Divides this Vector2's x and y values by the other Vector2's (or a number), in place, without creating a new
+        Vector2.
+
+        :param other: The Vector2 or number to divide by.
+        :return: This Vector2.
+        """
+        if isinstance(other, Vector2):
+            self.x /= other.x
+            self.y /= other.y
+        elif type(other) == float or type(other) == int:
+            self.x /= other
+            self.y /= other
+        else:
+            return NotImplemented
+        return self
 
     def __floordiv__(self, other) -> 'Vector2':
         """
@@ -129,23 +209,325 @@ class Vector2:
         """
         return f"Vector2(x: {self.x}, y: {self.y})"
 
-    #@staticmethod
-    #def lerp(value1: 'Vector2', value2: 'Vector2', amount: float) -> 'Vector2':
-    #    """
-    #    Linearly interpolate between two Vector2s with the given amount (0-1).
+    def set(self, x: float, y: float) -> 'Vector2':
+        """
+        Set the x and y values of this Vector2, without creating a new Vector2.
+
+        :param x: The new x-coordinate.
+        :param y: The new y-coordinate.
+        :return: This Vector2.
+        """
+        self.x = x
+        self.y = y
+        return self
+
+    def copy(self) -> 'Vector2':
+        """
+        Get a new Vector2 with the same values as this one.
+
+        :return: The copied Vector2.
+        """
+        return Vector2(self.x, self.y)
+
+    @staticmethod
+    def lerp(value1: 'Vector2', value2: 'Vector2', amount: float) -> 'Vector2':
+        """
+        Linearly interpolate between two Vector2s with the given amount (0-1).
+
+        :param value1: The first Vector2.
+        :param value2: The second Vector2.
+        :param amount: The amount to lerp by. This value should be between 0 and 1, however can be outside those values.
+        :return: The lerped Vector2.
+        """
+        return Vector2(value1.x + (value2.x - value1.x) * amount, value1.y + (value2.y - value1.y) * amount)
+
+
+class Vector2Array:
+    """Represents an array of Vector2s, stored as two contiguous NumPy columns (one for x, one for y).
+    Maths on a Vector2Array is done on every element at once by NumPy, which is far faster than updating thousands of
+    separate Vector2s. Indexing a single element gives a Vector2 that reads and writes straight into the array."""
+
+    def __init__(self, size: int = 0, dtype=_np.float32):
+        """
+        Create a new Vector2Array, with every element set to (0, 0).
+
+        :param size: The number of elements in the array.
+        :param dtype: The NumPy type to store the values as. This should be either float32 or float64.
+        """
+        self._data: _np.ndarray = _np.zeros((2, size), dtype=dtype)
+
+    @staticmethod
+    def from_arrays(x, y, dtype=_np.float32) -> 'Vector2Array':
+        """
+        Create a new Vector2Array from the given x and y values.
+
+        :param x: The x values, as anything NumPy can turn into an array.
+        :param y: The y values. This must be the same length as x.
+        :param dtype: The NumPy type to store the values as.
+        :return: The Vector2Array.
+        """
+        x = _np.asarray(x, dtype=dtype).reshape(-1)
+        y = _np.asarray(y, dtype=dtype).reshape(-1)
+        if len(x) != len(y):
+            raise ValueError(f"The x and y values must be the same length, got {len(x)} and {len(y)}.")
+        return Vector2Array._wrap(_np.stack((x, y)))
+
+    @staticmethod
+    def from_vectors(vectors: list, dtype=_np.float32) -> 'Vector2Array':
+        """
+        Create a new Vector2Array from the given list of Vector2s.
+
+        :param vectors: The Vector2s to copy into the array.
+        :param dtype: The NumPy type to store the values as.
+        :return: The Vector2Array.
+        """
+        return Vector2Array.from_arrays([vector.x for vector in vectors], [vector.y for vector in vectors], dtype)
 
-    #    :param value1: The first Vector2.
-    #    :param value2: The second Vector2.
-    #    :param amount: The amount to lerp by. This value should be between 0 and 1, however can be outside those values.
-    #    :return: The lerped Vector2.
-    #    """
-    #    lerp_val = _mg.Vector2.Lerp(_mg.Vector2(float(value1.x), float(value1.y)), _mg.Vector2(float(value2.x), float(value2.y)), float(amount))
-    #    return Vector2(lerp_val.X, lerp_val.Y)
+    @staticmethod
+    def full(size: int, value: Vector2, dtype=_np.float32) -> 'Vector2Array':
+        """
+        Create a new Vector2Array with every element set to the given value.
+
+        :param size: The number of elements in the array.
+        :param value: The Vector2 to set every element to.
+        :param dtype: The NumPy type to store the values as.
+        :return: The Vector2Array.
+        """
+        array = Vector2Array(size, dtype)
+        array._data[0] = value.x
+        array._data[1] = value.y
+        return array
+
+    @staticmethod
+    def lerp(value1: 'Vector2Array', value2, amount) -> 'Vector2Array':
+        """
+        Linearly interpolate every element between two Vector2Arrays with the given amount (0-1).
+
+        :param value1: The first Vector2Array.
+        :param value2: The second Vector2Array, or a Vector2 to lerp every element towards.
+        :param amount: The amount to lerp by, either as one value, or as an array with one value per element.
+        :return: The lerped Vector2Array.
+        """
+        return value1 + (value2 - value1) * amount
+
+    @property
+    def x(self) -> _np.ndarray:
+        """
+        Get the x values. This is a view into the array, so changing it will change the array.
+        """
+        return self._data[0]
+
+    @x.setter
+    def x(self, value):
+        self._data[0] = value
+
+    @property
+    def y(self) -> _np.ndarray:
+        """
+        Get the y values. This is a view into the array, so changing it will change the array.
+        """
+        return self._data[1]
+
+    @y.setter
+    def y(self, value):
+        self._data[1] = value
+
+    @property
+    def dtype(self):
+        """
+        Get the NumPy type the values are stored as.
+        """
+        return self._data.dtype
+
+    def __len__(self) -> int:
+        return self._data.shape[1]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield _Vector2ArrayElement(self._data, i)
+
+    def __getitem__(self, index):
+        """
+        Get an element, or a range of elements, of this array.
+
+        :param index: The index of the element, or a slice, index array, or boolean mask for many elements.
+        :return: A Vector2 that reads and writes into this array for a single index, otherwise a Vector2Array. Slices
+                 share their memory with this array, index arrays and masks are copies (the same as NumPy).
+        """
+        if isinstance(index, (int, _np.integer)):
+            length = len(self)
+            if index < 0:
+                index += length
+            if index < 0 or index >= length:
+                raise IndexError(f"Index {index} is out of range for a Vector2Array of length {length}.")
+            return _Vector2ArrayElement(self._data, index)
+        return Vector2Array._wrap(self._data[:, index])
+
+    def __setitem__(self, index, value):
+        if isinstance(value, Vector2Array):
+            self._data[:, index] = value._data
+        else:
+            self._data[0, index] = value.x
+            self._data[1, index] = value.y
+
+    def __add__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._data + self._operand(other))
+
+    def __radd__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._operand(other) + self._data)
+
+    def __iadd__(self, other) -> 'Vector2Array':
+        self._data += self._operand(other)
+        return self
+
+    def __sub__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._data - self._operand(other))
+
+    def __rsub__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._operand(other) - self._data)
+
+    def __isub__(self, other) -> 'Vector2Array':
+        self._data -= self._operand(other)
+        return self
+
+    def __mul__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._data * self._operand(other))
+
+    def __rmul__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._operand(other) * self._data)
+
+    def __imul__(self, other) -> 'Vector2Array':
+        self._data *= self._operand(other)
+        return self
+
+    def __truediv__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._data / self._operand(other))
+
+    def __rtruediv__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._operand(other) / self._data)
+
+    def __itruediv__(self, other) -> 'Vector2Array':
+        self._data /= self._operand(other)
+        return self
+
+    def __neg__(self) -> 'Vector2Array':
+        return Vector2Array._wrap(-self._data)
+
+    def __str__(self):
+        return f"Vector2Array(length: {len(self)}, x: {self.x}, y: {self.y})"
+
+    def copy(self) -> 'Vector2Array':
+        """
+        Get a copy of this array, that doesn't share any memory with it.
+
+        :return: The copied array.
+        """
+        return Vector2Array._wrap(self._data.copy())
+
+    def length(self) -> _np.ndarray:
+        """
+        Get the length of every element.
+
+        :return: The lengths, as a NumPy array.
+        """
+        return _np.hypot(self._data[0], self._data[1])
+
+    def length_squared(self) -> _np.ndarray:
+        """
+        Get the squared length of every element. This is faster than length(), so use it for comparisons if you can.
+
+        :return: The squared lengths, as a NumPy array.
+        """
+        return self._data[0] * self._data[0] + self._data[1] * self._data[1]
+
+    def normalize(self) -> 'Vector2Array':
+        """
+        Get every element scaled to a length of 1. Elements with a length of 0 are left as (0, 0).
+
+        :return: The normalized array.
+        """
+        length = self.length()
+        return Vector2Array._wrap(_np.divide(self._data, length, out=_np.zeros_like(self._data), where=length != 0))
+
+    def rotate(self, radians) -> 'Vector2Array':
+        """
+        Get every element rotated around (0, 0) by the given amount.
+
+        :param radians: The amount to rotate by in radians, either as one value, or as an array with one value per element.
+        :return: The rotated array.
+        """
+        cos = _np.cos(radians)
+        sin = _np.sin(radians)
+        x, y = self._data
+        return Vector2Array._wrap(_np.stack((x * cos - y * sin, x * sin + y * cos)).astype(self.dtype, copy=False))
+
+    def clamp(self, min: Vector2, max: Vector2) -> 'Vector2Array':
+        """
+        Get every element clamped between the min and max values.
+
+        :param min: The minimum values an element can be.
+        :param max: The maximum values an element can be.
+        :return: The clamped array.
+        """
+        return Vector2Array._wrap(_np.clip(self._data, self._operand(min), self._operand(max)))
+
+    def to_interleaved(self) -> _np.ndarray:
+        """
+        Get this array as a NumPy array of (x, y) pairs, with shape (n, 2). This is the layout the SpriteDrawer uses.
+
+        :return: A copy of the values as (x, y) pairs.
+        """
+        return _np.ascontiguousarray(self._data.T)
+
+    @staticmethod
+    def _wrap(data: _np.ndarray) -> 'Vector2Array':
+        array = Vector2Array.__new__(Vector2Array)
+        array._data = data
+        return array
+
+    def _operand(self, other):
+        # Turn the other side of an operation into something that broadcasts against the (2, n) data array, in the
+        # same type as this array so the result keeps its type.
+        if isinstance(other, Vector2Array):
+            return other._data.astype(self._data.dtype, copy=False)
+        elif isinstance(other, Vector2):
+            return _np.array(((other.x,), (other.y,)), dtype=self._data.dtype)
+        elif isinstance(other, (int, float)):
+            return other
+        return _np.asarray(other, dtype=self._data.dtype)
+
+
+class _Vector2ArrayElement(Vector2):
+    # A Vector2 that reads and writes a single element of a Vector2Array.
+
+    __slots__ = ("__data", "__index")
+
+    @property
+    def x(self) -> float:
+        return float(self.__data[0, self.__index])
+
+    @x.setter
+    def x(self, value: float):
+        self.__data[0, self.__index] = value
+
+    @property
+    def y(self) -> float:
+        return float(self.__data[1, self.__index])
+
+    @y.setter
+    def y(self, value: float):
+        self.__data[1, self.__index] = value
+
+    def __init__(self, data: _np.ndarray, index: int):
+        self.__data = data
+        self.__index = index
 
 
 class Size:
     """Represents a set of two values corresponding to width and height."""
 
+    __slots__ = ("width", "height")
+
     def __init__(self, width: int, height: int):
         """
         Create a new Size with the given width and height.
@@ -164,118 +546,471 @@ class Size:
         """
         return Vector2(self.width, self.height)
 
+    def set(self, width: int, height: int) -> 'Size':
+        """
+        Set the width and height of this Size, without creating a new Size.
+
+        :param width: The new width.
+        :param height: The new height.
+        :return: This Size.
+        """
+        self.width = width
+        self.height = height
+        return self
+
     def __str__(self):
         return f"Size(width: {self.width}, height: {self.height})"
 
 
+class Rectangle:
+    """Represents a rectangle, with an x and y position of its top left corner, and a width and height."""
+
+    __slots__ = ("x", "y", "width", "height")
+
+    def __init__(self, x: float, y: float, width: float, height: float):
+        """
+        Create a new Rectangle.
+
+        :param x: The x-coordinate of the top left corner.
+        :param y: The y-coordinate of the top left corner.
+        :param width: The width of the Rectangle.
+        :param height: The height of the Rectangle.
+        """
+        self.x: float = x
+        self.y: float = y
+        self.width: float = width
+        self.height: float = height
+
+    @property
+    def right(self) -> float:
+        """
+        Get the x-coordinate of the right side of this Rectangle.
+        """
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> float:
+        """
+        Get the y-coordinate of the bottom side of this Rectangle.
+        """
+        return self.y + self.height
+
+    def contains(self, point: Vector2) -> bool:
+        """
+        Check if the given point is inside this Rectangle.
+
+        :param point: The point to check.
+        :return: True if the point is inside this Rectangle.
+        """
+        return self.x <= point.x < self.x + self.width and self.y <= point.y < self.y + self.height
+
+    def intersects(self, other: 'Rectangle') -> bool:
+        """
+        Check if this Rectangle overlaps the other Rectangle.
+
+        :param other: The Rectangle to check against.
+        :return: True if the two Rectangles overlap.
+        """
+        return self.x < other.x + other.width and other.x < self.x + self.width and \
+            self.y < other.y + other.height and other.y < self.y + self.height
+
+    def __str__(self):
+        return f"Rectangle(x: {self.x}, y: {self.y}, width: {self.width}, height: {self.height})"
+
+
+class SpatialIndex:
+    """Finds things in a 2D world by where they are, without checking every one of them. Everything in the index is
+    stored in a grid of cells by its bounds, so asking what's inside an area (such as the screen) only looks at the
+    cells that area covers.
+
+    Any hashable value can be stored, such as a sprite, or the name of one."""
+
+    def __init__(self, cell_size: float = 256):
+        """
+        Create a new SpatialIndex.
+
+        :param cell_size: The size of each cell. This works best at around the size of the larger things being stored.
+        """
+        if cell_size <= 0:
+            raise ValueError("The cell size must be greater than zero.")
+        self.cell_size: float = cell_size
+        self.__cells: dict = {}
+        self.__bounds: dict = {}
+
+    def __len__(self):
+        return len(self.__bounds)
+
+    def __contains__(self, item):
+        return item in self.__bounds
+
+    def __iter__(self):
+        return iter(self.__bounds)
+
+    def insert(self, item, bounds: Rectangle):
+        """
+        Add an item to the index.
+
+        :param item: The item to add.
+        :param bounds: The area the item covers.
+        """
+        if item in self.__bounds:
+            raise ValueError("This item is already in the index. Use move() to change its bounds.")
+        edges = (bounds.x, bounds.y, bounds.x + bounds.width, bounds.y + bounds.height)
+        self.__bounds[item] = edges
+        for cell in self.__cells_of(edges):
+            self.__cells.setdefault(cell, set()).add(item)
+
+    def move(self, item, bounds: Rectangle):
+        """
+        Change the bounds of an item already in the index.
+
+        :param item: The item to move.
+        :param bounds: The new area the item covers.
+        """
+        old = self.__bounds[item]
+        edges = (bounds.x, bounds.y, bounds.x + bounds.width, bounds.y + bounds.height)
+        self.__bounds[item] = edges
+        old_cells, new_cells = self.__cell_range(old), self.__cell_range(edges)
+        if old_cells == new_cells:
+            # Most moves are small, and stay in the same cells.
+            return
+        old_cells, new_cells = set(self.__cells_of(old)), set(self.__cells_of(edges))
+        for cell in old_cells - new_cells:
+            self.__remove_from_cell(cell, item)
+        for cell in new_cells - old_cells:
+            self.__cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item):
+        """
+        Remove an item from the index.
+
+        :param item: The item to remove.
+        """
+        for cell in self.__cells_of(self.__bounds.pop(item)):
+            self.__remove_from_cell(cell, item)
+
+    def clear(self):
+        """
+        Remove every item from the index.
+        """
+        self.__cells.clear()
+        self.__bounds.clear()
+
+    def get_bounds(self, item) -> Rectangle:
+        """
+        Get the bounds an item was stored with.
+
+        :param item: The item.
+        :return: The area the item covers.
+        """
+        left, top, right, bottom = self.__bounds[item]
+        return Rectangle(left, top, right - left, bottom - top)
+
+    def query(self, area: Rectangle) -> list:
+        """
+        Get every item whose bounds overlap the given area.
+
+        :param area: The area to search.
+        :return: The list of items.
+        """
+        left, top, right, bottom = area.x, area.y, area.x + area.width, area.y + area.height
+        min_x, min_y, max_x, max_y = self.__cell_range((left, top, right, bottom))
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self.__cells):
+            # The area covers more cells than are in use, so it's quicker to check the used ones.
+            cells = [items for (x, y), items in self.__cells.items() if min_x <= x <= max_x and min_y <= y <= max_y]
+        else:
+            cells = [self.__cells[cell] for cell in self.__cells_of((left, top, right, bottom)) if cell in self.__cells]
+        bounds = self.__bounds
+        found = set()
+        result = []
+        for items in cells:
+            for item in items:
+                if item in found:
+                    continue
+                found.add(item)
+                item_left, item_top, item_right, item_bottom = bounds[item]
+                if item_left <= right and left <= item_right and item_top <= bottom and top <= item_bottom:
+                    result.append(item)
+        return result
+
+    def query_point(self, point: Vector2) -> list:
+        """
+        Get every item whose bounds contain the given point.
+
+        :param point: The point to search at.
+        :return: The list of items.
+        """
+        cell = (_math.floor(point.x / self.cell_size), _math.floor(point.y / self.cell_size))
+        result = []
+        for item in self.__cells.get(cell, ()):
+            left, top, right, bottom = self.__bounds[item]
+            if left <= point.x <= right and top <= point.y <= bottom:
+                result.append(item)
+        return result
+
+    def nearest(self, point: Vector2, max_distance: float = None):
+        """
+        Get the item whose bounds are closest to the given point. Items containing the point have a distance of 0.
+
+        :param point: The point to search from.
+        :param max_distance: If given, items further away than this are ignored.
+        :return: The closest item, or None if there are none (within max_distance).
+        """
+        best, best_distance = None, _math.inf if max_distance is None else max_distance
+        center_x, center_y = _math.floor(point.x / self.cell_size), _math.floor(point.y / self.cell_size)
+        checked = set()
+        ring = 0
+        # Search outwards one ring of cells at a time. Anything in a ring further out is at least ring * cell_size
+        # away, so once something closer than that has been found the search can stop.
+        while ring == 0 or 8 * ring <= len(self.__cells):
+            if best_distance <= (ring - 1) * self.cell_size:
+                return best
+            for cell in self.__ring(center_x, center_y, ring):
+                for item in self.__cells.get(cell, ()):
+                    if item not in checked:
+                        checked.add(item)
+                        distance = self.__distance(point, item)
+                        if distance <= best_distance:
+                            best, best_distance = item, distance
+            ring += 1
+        # The rings have grown bigger than the number of cells in use, so just check everything that's left.
+        for item in self.__bounds:
+            if item not in checked:
+                distance = self.__distance(point, item)
+                if distance <= best_distance:
+                    best, best_distance = item, distance
+        return best
+
+    def __distance(self, point: Vector2, item) -> float:
+        left, top, right, bottom = self.__bounds[item]
+        dx = max(left - point.x, 0, point.x - right)
+        dy = max(top - point.y, 0, point.y - bottom)
+        return _math.hypot(dx, dy)
+
+    @staticmethod
+    def __ring(center_x: int, center_y: int, ring: int):
+        if ring == 0:
+            yield center_x, center_y
+            return
+        for x in range(center_x - ring, center_x + ring + 1):
+            yield x, center_y - ring
+            yield x, center_y + ring
+        for y in range(center_y - ring + 1, center_y + ring):
+            yield center_x - ring, y
+            yield center_x + ring, y
+
+    def __cell_range(self, edges: tuple) -> tuple:
+        size = self.cell_size
+        return (_math.floor(edges[0] / size), _math.floor(edges[1] / size),
+                _math.floor(edges[2] / size), _math.floor(edges[3] / size))
+
+    def __cells_of(self, edges: tuple):
+        min_x, min_y, max_x, max_y = self.__cell_range(edges)
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                yield x, y
+
+    def __remove_from_cell(self, cell: tuple, item):
+        items = self.__cells[cell]
+        items.discard(item)
+        if not items:
+            del self.__cells[cell]
+
+
 class Matrix:
-    """Represents a 4x4 matrix, used for 2D and 3D transformations."""
+    """Represents a 2D affine transformation matrix, used for 2D transformations such as cameras.
+
+    Only the six values a 2D transformation can change are stored. They follow MonoGame's layout (vectors are treated
+    as rows, so the translation lives in m41 and m42), and all the maths is done in python. The matrix is only expanded
+    into the 4x4 form OpenGL needs when it's used, and that is kept until the matrix is changed."""
+
+    __slots__ = ("__m11", "__m12", "__m21", "__m22", "__m41", "__m42", "__gl_matrix")
 
     @staticmethod
     def identity():
         """
         Get the identity matrix.
 
-        :return: A matrix with values (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
-        """
-        return Matrix(1, 0, 0, 0,
-                      0, 1, 0, 0,
-                      0, 0, 1, 0,
-                      0, 0, 0, 1)
-
-    def __init__(self, m11: float, m12: float, m13: float, m14: float, m21: float, m22: float, m23: float, m24: float,
-                 m31: float, m32: float, m33: float, m34: float, m41: float, m42: float, m43: float, m44: float):
-        """
-        Creates a new 4x4 matrix.
-
-        :param m11: Column 1, row 1, of the matrix.
-        :param m12: Column 1, row 2, of the matrix.
-        :param m13: Column 1, row 3, of the matrix.
-        :param m14: Column 1, row 4, of the matrix.
-        :param m21: Column 2, row 1, of the matrix.
-        :param m22: Column 2, row 2, of the matrix.
-        :param m23: Column 2, row 3, of the matrix.
-        :param m24: Column 2, row 4, of the matrix.
-        :param m31: Column 3, row 1, of the matrix.
-        :param m32: Column 3, row 2, of the matrix.
-        :param m33: Column 3, row 3, of the matrix.
-        :param m34: Column 3, row 4, of the matrix.
-        :param m41: Column 4, row 1, of the matrix.
-        :param m42: Column 4, row 2, of the matrix.
-        :param m43: Column 4, row 3, of the matrix.
-        :param m44: Column 4, row 4, of the matrix.
-        """
-        self.m11: float = m11
-        self.m12: float = m12
-        self.m13: float = m13
-        self.m14: float = m14
-        self.m21: float = m21
-        self.m22: float = m22
-        self.m23: float = m23
-        self.m24: float = m24
-        self.m31: float = m31
-        self.m32: float = m32
-        self.m33: float = m33
-        self.m34: float = m34
-        self.m41: float = m41
-        self.m42: float = m42
-        self.m43: float = m43
-        self.m44: float = m44
-
-    #@staticmethod
-    #def transform(value: Vector2) -> 'Matrix':
-    #    """
-    #    Create a tranformation matrix with the given Vector2.
-
-    #    :param value: The Vector2 to create the tranformation matrix with.
-    #    :return: The transformation matrix.
-    #    """
-    #    return Matrix._to_pgs_matrix(_mg.Matrix.CreateTranslation(float(value.x), float(value.y), float(0)))
-
-    #@staticmethod
-    #def rotate(value: float) -> 'Matrix':
-    #    """
-    #    Create a rotation matrix with the given rotation in radians.
-
-    #    :param value: The value in radians to create the rotation matrix.
-    #    :return: The rotation matrix.
-    #    """
-    #    return Matrix._to_pgs_matrix(_mg.Matrix.CreateRotationZ(value))
-
-    #@staticmethod
-    #def scale(value: Vector2) -> 'Matrix':
-    #    """
-    #    Create a scale matrix with the given scale Vector2.
-
-    #    :param value: The Vector2 to create a scale matrix with.
-    #    :return: The scale matrix.
-    #    """
-    #    return Matrix._to_pgs_matrix(_mg.Matrix.CreateScale(_mg.Vector3(float(value.x), float(value.y), float(1))))
-
-    #def __mul__(self, other: 'Matrix') -> 'Matrix':
-    #    """
-    #    Multiply two matrices together.
-
-    #    :param other: The matrix to multiply with.
-    #    :return: The multiplied matrix.
-    #    """
-    #    return Matrix._to_pgs_matrix(_mg.Matrix.Multiply(self._to_mg_matrix(), other._to_mg_matrix()))
-
-
-    #def _to_mg_matrix(self) -> _mg.Matrix:
-    #    return _mg.Matrix(float(self.m11), float(self.m12), float(self.m13), float(self.m14), float(self.m21),
-    #                      float(self.m22), float(self.m23), float(self.m24), float(self.m31), float(self.m32),
-    #                      float(self.m33), float(self.m34), float(self.m41), float(self.m42), float(self.m43),
-    #                      float(self.m44))
-
-    #@staticmethod
-    #def _to_pgs_matrix(matrix: _mg.Matrix) -> 'Matrix':
-    #    return Matrix(matrix.M11, matrix.M12, matrix.M13, matrix.M14, matrix.M21, matrix.M22, matrix.M23, matrix.M24,
-    #                  matrix.M31, matrix.M32, matrix.M33, matrix.M34, matrix.M41, matrix.M42, matrix.M43, matrix.M44)
+        :return: A matrix with values (1, 0, 0, 1, 0, 0)
+        """
+        return Matrix(1, 0, 0, 1, 0, 0)
+
+    def __init__(self, m11: float = 1, m12: float = 0, m21: float = 0, m22: float = 1, m41: float = 0,
+                 m42: float = 0):
+        """
+        Creates a new 2D affine matrix. Leaving out every value will give you the identity matrix.
+
+        :param m11: Row 1, column 1, of the matrix.
+        :param m12: Row 1, column 2, of the matrix.
+        :param m21: Row 2, column 1, of the matrix.
+        :param m22: Row 2, column 2, of the matrix.
+        :param m41: Row 4, column 1, of the matrix (the x translation).
+        :param m42: Row 4, column 2, of the matrix (the y translation).
+        """
+        self.__m11: float = m11
+        self.__m12: float = m12
+        self.__m21: float = m21
+        self.__m22: float = m22
+        self.__m41: float = m41
+        self.__m42: float = m42
+        self.__gl_matrix = None
+
+    @property
+    def m11(self) -> float:
+        return self.__m11
+
+    @m11.setter
+    def m11(self, value: float):
+        self.__m11 = value
+        self.__gl_matrix = None
+
+    @property
+    def m12(self) -> float:
+        return self.__m12
+
+    @m12.setter
+    def m12(self, value: float):
+        self.__m12 = value
+        self.__gl_matrix = None
+
+    @property
+    def m21(self) -> float:
+        return self.__m21
+
+    @m21.setter
+    def m21(self, value: float):
+        self.__m21 = value
+        self.__gl_matrix = None
+
+    @property
+    def m22(self) -> float:
+        return self.__m22
+
+    @m22.setter
+    def m22(self, value: float):
+        self.__m22 = value
+        self.__gl_matrix = None
+
+    @property
+    def m41(self) -> float:
+        return self.__m41
+
+    @m41.setter
+    def m41(self, value: float):
+        self.__m41 = value
+        self.__gl_matrix = None
+
+    @property
+    def m42(self) -> float:
+        return self.__m42
+
+    @m42.setter
+    def m42(self, value: float):
+        self.__m42 = value
+        self.__gl_matrix = None
+
+    @staticmethod
+    def transform(value: Vector2) -> 'Matrix':
+        """
+        Create a tranformation matrix with the given Vector2.
+
+        :param value: The Vector2 to create the tranformation matrix with.
+        :return: The transformation matrix.
+        """
+        return Matrix(1, 0, 0, 1, value.x, value.y)
+
+    @staticmethod
+    def rotate(value: float) -> 'Matrix':
+        """
+        Create a rotation matrix with the given rotation in radians.
+
+        :param value: The value in radians to create the rotation matrix.
+        :return: The rotation matrix.
+        """
+        cos = _math.cos(value)
+        sin = _math.sin(value)
+        return Matrix(cos, sin, -sin, cos, 0, 0)
+
+    @staticmethod
+    def scale(value: Vector2) -> 'Matrix':
+        """
+        Create a scale matrix with the given scale Vector2.
+
+        :param value: The Vector2 to create a scale matrix with.
+        :return: The scale matrix.
+        """
+        return Matrix(value.x, 0, 0, value.y, 0, 0)
+
+    def __mul__(self, other: 'Matrix') -> 'Matrix':
+        """
+        Multiply two matrices together. The resulting matrix applies this matrix first, then the other one.
+
+        :param other: The matrix to multiply with.
+        :return: The multiplied matrix.
+        """
+        return Matrix(self.__m11 * other.__m11 + self.__m12 * other.__m21,
+                      self.__m11 * other.__m12 + self.__m12 * other.__m22,
+                      self.__m21 * other.__m11 + self.__m22 * other.__m21,
+                      self.__m21 * other.__m12 + self.__m22 * other.__m22,
+                      self.__m41 * other.__m11 + self.__m42 * other.__m21 + other.__m41,
+                      self.__m41 * other.__m12 + self.__m42 * other.__m22 + other.__m42)
+
+    def invert(self) -> 'Matrix':
+        """
+        Get the inverse of this matrix, which undoes whatever this matrix does. For example, inverting a camera's matrix
+        lets you turn a position on the screen back into a position in the world.
+
+        :return: The inverted matrix.
+        """
+        determinant = self.__m11 * self.__m22 - self.__m12 * self.__m21
+        if determinant == 0:
+            raise ValueError("This matrix cannot be inverted, as it has a scale of zero.")
+        m11 = self.__m22 / determinant
+        m12 = -self.__m12 / determinant
+        m21 = -self.__m21 / determinant
+        m22 = self.__m11 / determinant
+        return Matrix(m11, m12, m21, m22, -(self.__m41 * m11 + self.__m42 * m21), -(self.__m41 * m12 + self.__m42 * m22))
+
+    def transform_point(self, point: Vector2) -> Vector2:
+        """
+        Transform the given point by this matrix.
+
+        :param point: The point to transform.
+        :return: The transformed point.
+        """
+        return Vector2(point.x * self.__m11 + point.y * self.__m21 + self.__m41,
+                       point.x * self.__m12 + point.y * self.__m22 + self.__m42)
+
+    def transform_points(self, points) -> _np.ndarray:
+        """
+        Transform many points by this matrix at once.
+
+        :param points: The points to transform, as anything NumPy can turn into an array of (x, y) pairs.
+        :return: The transformed points, as a NumPy array with shape (n, 2).
+        """
+        points = _np.asarray(points, dtype=_np.float64).reshape(-1, 2)
+        return points @ _np.array(((self.__m11, self.__m12), (self.__m21, self.__m22))) + (self.__m41, self.__m42)
+
+    def __str__(self):
+        return f"Matrix(m11: {self.__m11}, m12: {self.__m12}, m21: {self.__m21}, m22: {self.__m22}, " \
+               f"m41: {self.__m41}, m42: {self.__m42})"
+
+    def _to_gl_matrix(self) -> _np.ndarray:
+        # The full 4x4 matrix, laid out in the row-major order MonoGame uses. Uploading this with transpose set to
+        # false gives GLSL the transposed (column vector) matrix, so shaders multiply as projection * transform * vec.
+        if self.__gl_matrix is None:
+            self.__gl_matrix = _np.array((self.__m11, self.__m12, 0, 0,
+                                          self.__m21, self.__m22, 0, 0,
+                                          0, 0, 1, 0,
+                                          self.__m41, self.__m42, 0, 1), dtype=_np.float32)
+        return self.__gl_matrix
 
 
 class Color:
     """Represents a Color with given red, green, blue, and alpha values."""
+
+    __slots__ = ("r", "g", "b", "a")
+
     def __init__(self, r: int, g: int, b: int, a: int = 255):
         """
         Create a new Color with the given red, green, blue, and optional alpha values.
@@ -300,6 +1035,48 @@ class Color:
         """
         return Color(hex_value >> 16, (hex_value & 0xFF00) >> 8, hex_value & 255)
 
+    def set(self, r: int, g: int, b: int, a: int = 255) -> 'Color':
+        """
+        Set the red, green, blue, and optional alpha values of this Color, without creating a new Color.
+
+        :param r: The new red value.
+        :param g: The new green value.
+        :param b: The new blue value.
+        :param a: The new alpha value.
+        :return: This Color.
+        """
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        return self
+
+    @property
+    def packed_value(self) -> int:
+        """
+        Get this Color packed into a single 32-bit integer, with red in the lowest byte and alpha in the highest. This
+        is the format SpriteDrawer.draw_many() expects its colors in.
+
+        :return: The packed Color.
+        """
+        return self.r | (self.g << 8) | (self.b << 16) | (self.a << 24)
+
+
+class _ConstantColor(Color):
+    # One of the shared Colors. These are used everywhere as defaults, so they can't be changed (otherwise setting the
+    # color of one sprite in place would change every white sprite).
+
+    __slots__ = ()
+
+    def __init__(self, color: Color):
+        object.__setattr__(self, "r", color.r)
+        object.__setattr__(self, "g", color.g)
+        object.__setattr__(self, "b", color.b)
+        object.__setattr__(self, "a", color.a)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("The shared Colors cannot be changed. Create a new Color instead.")
+
 
 # From https://developer.mozilla.org/en-US/docs/Web/CSS/color_value
 # Colors enum. Defines a list of commonly used colors.
@@ -458,42 +1235,899 @@ class Colors:
     TRANSPARENT = Color(0, 0, 0, 0)
 
 
-class Disposable(_abc.ABC):
+# Swap every shared color out for a constant one.
+for _name, _color in list(vars(Colors).items()):
+    if isinstance(_color, Color):
+        setattr(Colors, _name, _ConstantColor(_color))
+del _name, _color
+
+
+class Disposable(_abc.ABC):
+    """
+    Represents a way to clean and remove unmanaged memory.
+    """
+
+    @_abc.abstractmethod
+    def dispose(self):
+        pass
+
+class RenderState:
+    """
+    Keeps track of the OpenGL state that drawing changes (the shader program, vertex array, bound textures, samplers
+    and blending), and skips any call that wouldn't change anything. Every call into OpenGL from python is slow, and
+    drawing would otherwise set the same state over and over.
+
+    The counters show how well this is working: the number of state changes that had to be made, and the number that
+    were skipped.
+    """
+
+    __program = None
+    __vertex_array = None
+    __active_unit = None
+    __textures: dict = {}
+    __samplers: dict = {}
+    __blend = None
+    __issued = 0
+    __skipped = 0
+
+    @staticmethod
+    def issued_calls() -> int:
+        """
+        Get the number of state changes made since the counters were last reset.
+
+        :return: The number of calls made.
+        """
+        return RenderState.__issued
+
+    @staticmethod
+    def skipped_calls() -> int:
+        """
+        Get the number of state changes skipped, because the state was already set, since the counters were last reset.
+
+        :return: The number of calls skipped.
+        """
+        return RenderState.__skipped
+
+    @staticmethod
+    def reset_counters():
+        """
+        Reset the issued and skipped counters to 0, such as at the start of a frame.
+        """
+        RenderState.__issued = 0
+        RenderState.__skipped = 0
+
+    @staticmethod
+    def invalidate():
+        """
+        Forget all the tracked state, so everything is set again next time. Call this after changing OpenGL state
+        directly (for example from another library).
+        """
+        RenderState.__program = None
+        RenderState.__vertex_array = None
+        RenderState.__active_unit = None
+        RenderState.__textures.clear()
+        RenderState.__samplers.clear()
+        RenderState.__blend = None
+
+    @staticmethod
+    def _use_program(program):
+        if RenderState.__program == program:
+            RenderState.__skipped += 1
+            return
+        _gl.glUseProgram(program)
+        RenderState.__program = program
+        RenderState.__issued += 1
+
+    @staticmethod
+    def _bind_vertex_array(vertex_array):
+        if RenderState.__vertex_array == vertex_array:
+            RenderState.__skipped += 1
+            return
+        _gl.glBindVertexArray(vertex_array)
+        RenderState.__vertex_array = vertex_array
+        RenderState.__issued += 1
+
+    @staticmethod
+    def _bind_texture(unit: int, texture):
+        if RenderState.__textures.get(unit) == texture:
+            RenderState.__skipped += 1
+            return
+        if RenderState.__active_unit != unit:
+            _gl.glActiveTexture(_gl.GL_TEXTURE0 + unit)
+            RenderState.__active_unit = unit
+            RenderState.__issued += 1
+        _gl.glBindTexture(_gl.GL_TEXTURE_2D, texture)
+        RenderState.__textures[unit] = texture
+        RenderState.__issued += 1
+
+    @staticmethod
+    def _bind_sampler(unit: int, sampler):
+        if RenderState.__samplers.get(unit) == sampler:
+            RenderState.__skipped += 1
+            return
+        _gl.glBindSampler(unit, sampler)
+        RenderState.__samplers[unit] = sampler
+        RenderState.__issued += 1
+
+    @staticmethod
+    def _set_alpha_blend():
+        # Every sprite is drawn with regular alpha blending.
+        if RenderState.__blend:
+            RenderState.__skipped += 1
+            return
+        _gl.glEnable(_gl.GL_BLEND)
+        _gl.glBlendFunc(_gl.GL_SRC_ALPHA, _gl.GL_ONE_MINUS_SRC_ALPHA)
+        RenderState.__blend = True
+        RenderState.__issued += 2
+
+    @staticmethod
+    def _forget_program(program):
+        # The program is being deleted, and its handle may be reused.
+        if RenderState.__program == program:
+            RenderState.__program = None
+
+    @staticmethod
+    def _forget_vertex_array(vertex_array):
+        if RenderState.__vertex_array == vertex_array:
+            RenderState.__vertex_array = None
+
+    @staticmethod
+    def _forget_texture(texture):
+        for unit, bound in list(RenderState.__textures.items()):
+            if bound == texture:
+                del RenderState.__textures[unit]
+
+
+class FrameUniforms:
+    """
+    The values every shader shares: the projection, the view (the transformation drawing is done with), the time and
+    the size of the viewport. They're kept in one std140 uniform buffer, bound to FrameUniforms.BINDING once a frame,
+    and every Shader with a FrameData block reads them from there. They're only uploaded when they change, rather than
+    set on each shader after every switch.
+
+    To use them in a custom shader, add FrameUniforms.GLSL after the #version line, and multiply positions by
+    uProjection * uView.
+    """
+
+    BINDING = 0
+    """The uniform buffer binding point the FrameData block is bound to."""
+
+    GLSL = """
+    layout(std140) uniform FrameData
+    {
+        mat4 uProjection;
+        mat4 uView;
+        vec2 uViewportSize;
+        float uTime;
+    };
+    """
+    """The FrameData uniform block, to add to the source of a shader."""
+
+    # The std140 layout of the block: each mat4 takes 64 bytes, and the vec2 and float pack into the next 16.
+    __LAYOUT = _np.dtype([("projection", _np.float32, 16), ("view", _np.float32, 16),
+                          ("viewport_size", _np.float32, 2), ("time", _np.float32), ("padding", _np.float32)])
+
+    __buffer = None
+    __data = None
+    __viewport = None
+    __view = None
+
+    @staticmethod
+    def _begin_frame(time: float):
+        # Upload the time, and bind the buffer for the frame.
+        FrameUniforms.__create()
+        FrameUniforms.__data["time"] = time
+        FrameUniforms.__upload("time", "time")
+        _gl.glBindBufferBase(_gl.GL_UNIFORM_BUFFER, FrameUniforms.BINDING, FrameUniforms.__buffer)
+
+    @staticmethod
+    def _set_view(transform_matrix: Matrix):
+        # Make the buffer match the viewport and the given view. Only the parts that changed are uploaded.
+        if FrameUniforms.__buffer is None:
+            FrameUniforms._begin_frame(0)
+        data = FrameUniforms.__data
+        viewport = tuple(_gl.glGetIntegerv(_gl.GL_VIEWPORT))
+        if viewport != FrameUniforms.__viewport:
+            width, height = viewport[2], viewport[3]
+            data["projection"] = Matrix(2 / width, 0, 0, -2 / height, -1, 1)._to_gl_matrix()
+            data["viewport_size"] = (width, height)
+            FrameUniforms.__upload("projection", "viewport_size")
+            FrameUniforms.__viewport = viewport
+        # A Matrix keeps its 4x4 array until it's changed, so getting the same array back means it's unchanged.
+        view = transform_matrix._to_gl_matrix()
+        if view is not FrameUniforms.__view:
+            if not _np.array_equal(view, data["view"]):
+                data["view"] = view
+                FrameUniforms.__upload("view", "view")
+            FrameUniforms.__view = view
+
+    @staticmethod
+    def __create():
+        if FrameUniforms.__buffer is not None:
+            return
+        FrameUniforms.__data = _np.zeros((), FrameUniforms.__LAYOUT)
+        FrameUniforms.__data["view"] = Matrix.identity()._to_gl_matrix()
+        FrameUniforms.__buffer = _gl.glGenBuffers(1)
+        _gl.glBindBuffer(_gl.GL_UNIFORM_BUFFER, FrameUniforms.__buffer)
+        _gl.glBufferData(_gl.GL_UNIFORM_BUFFER, FrameUniforms.__LAYOUT.itemsize, FrameUniforms.__data,
+                         _gl.GL_DYNAMIC_DRAW)
+
+    @staticmethod
+    def __upload(first: str, last: str):
+        # Upload the bytes of the buffer from the start of the first field to the end of the last.
+        fields = FrameUniforms.__LAYOUT.fields
+        start = fields[first][1]
+        end = fields[last][1] + fields[last][0].itemsize
+        _gl.glBindBuffer(_gl.GL_UNIFORM_BUFFER, FrameUniforms.__buffer)
+        _gl.glBufferSubData(_gl.GL_UNIFORM_BUFFER, start, end - start,
+                            FrameUniforms.__data.reshape(1).view(_np.uint8)[start:end])
+
+
+class Texture(Disposable):
+    # Textures are always drawn whole. TextureRegions set this to the part of their page they draw, in texture
+    # coordinates (left, top, right, bottom).
+    _uv_rect = (0.0, 0.0, 1.0, 1.0)
+    # The frame this texture was last drawn on, which TextureCache uses to pick what to free first.
+    _last_drawn = 0
+
+    @property
+    def size(self) -> Size:
+        """
+        Get the total size in pixels of this texture.
+
+        :return: The total size in pixels of this texture.
+        """
+        return Size(self.__width, self.__height)
+
+    def __init__(self, path: str):
+        img = _img.open(path)
+        self._from_image(img)
+        img.close()
+
+    @staticmethod
+    def load_async(path: str, on_loaded=None) -> 'TextureHandle':
+        """
+        Start loading a Texture in the background. The image is decoded on another thread, and then TextureLoader
+        uploads it on the main thread during a later frame, so the game keeps running (and can show progress) while it
+        loads.
+
+        :param path: The path of the texture.
+        :param on_loaded: An optional function, called with the Texture once it's loaded.
+        :return: The TextureHandle, which holds the Texture once it's loaded.
+        """
+        handle = TextureHandle(path, on_loaded)
+        handle._job = TextureLoader._decode(path)
+        TextureLoader._add(handle)
+        return handle
+
+    @staticmethod
+    def _from_pil_image(image) -> 'Texture':
+        texture = Texture.__new__(Texture)
+        texture._from_image(image)
+        return texture
+
+    def _from_image(self, img):
+        # Everything is uploaded as RGBA, so images without an alpha channel (or with a palette) are converted first.
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        self._from_pixels(img.width, img.height, img.tobytes())
+
+    def _from_pixels(self, width: int, height: int, pixels: bytes):
+        self.__width = width
+        self.__height = height
+        self.__handle = _gl.glGenTextures(1)
+        RenderState._bind_texture(0, self.__handle)
+
+        _gl.glTexImage2D(_gl.GL_TEXTURE_2D, 0, _gl.GL_RGBA, width, height, 0, _gl.GL_RGBA, _gl.GL_UNSIGNED_BYTE, pixels)
+        _gl.glTexParameteri(_gl.GL_TEXTURE_2D, _gl.GL_TEXTURE_MIN_FILTER, _gl.GL_LINEAR)
+        _gl.glTexParameteri(_gl.GL_TEXTURE_2D, _gl.GL_TEXTURE_MAG_FILTER, _gl.GL_LINEAR)
+
+    def _to_pil_image(self):
+        return _img.fromarray(self.get_pixels(), "RGBA")
+
+    @staticmethod
+    def custom(width: int, height: int) -> 'Texture':
+        """
+        Create a new Texture with the given width and height.
+
+        :param width: The width of the texture.
+        :param height: The height of the texture.
+        :return: A blank (transparent) texture with the given width and height.
+        """
+        texture = Texture.__new__(Texture)
+        texture._from_pixels(width, height, bytes(width * height * 4))
+        return texture
+
+    def set_pixels(self, data, area: Rectangle = None):
+        """
+        Set the pixels of this Texture, or of an area of it. The pixels are uploaded straight from memory, so the
+        fastest way to pass them is as anything supporting the buffer protocol: bytes, a bytearray, a memoryview, or a
+        NumPy array of RGBA bytes (such as shape (height, width, 4) uint8) or of packed colors (see
+        Color.packed_value). A list of Colors also works, but is much slower.
+
+        :param data: The pixels, row by row from the top left.
+        :param area: The area of the Texture to set, in pixels. Defaults to the whole Texture.
+        """
+        x, y, width, height = _pixel_area(self.size, area)
+        pixels = _pixel_array(data, width, height)
+        RenderState._bind_texture(0, self.__handle)
+        _gl.glTexSubImage2D(_gl.GL_TEXTURE_2D, 0, x, y, width, height, _gl.GL_RGBA, _gl.GL_UNSIGNED_BYTE, pixels)
+
+    def get_pixels(self, area: Rectangle = None) -> _np.ndarray:
+        """
+        Get the pixels of this Texture, or of an area of it.
+
+        :param area: The area of the Texture to get, in pixels. Defaults to the whole Texture.
+        :return: The pixels, as a NumPy uint8 array with shape (height, width, 4) of RGBA values.
+        """
+        x, y, width, height = _pixel_area(self.size, area)
+        # OpenGL 3.3 can only read back a whole texture, so an area is cut out of that.
+        pixels = _np.empty((self.__height, self.__width, 4), _np.uint8)
+        RenderState._bind_texture(0, self.__handle)
+        _gl.glGetTexImage(_gl.GL_TEXTURE_2D, 0, _gl.GL_RGBA, _gl.GL_UNSIGNED_BYTE,
+                          pixels.ctypes.data_as(_ctypes.c_void_p))
+        if area is None:
+            return pixels
+        return pixels[y:y + height, x:x + width].copy()
+
+    def get_region(self, source: Rectangle) -> 'TextureRegion':
+        """
+        Get a region of this Texture, which can be drawn in place of a Texture to draw only that part of it.
+
+        :param source: The part of this Texture, in pixels, that the region covers.
+        :return: The TextureRegion.
+        """
+        return TextureRegion(self, source)
+
+    def _bind(self):
+        self._last_drawn = Time.total_frames()
+        RenderState._bind_texture(0, self.__handle)
+
+    def dispose(self):
+        if self.__handle is not None:
+            RenderState._forget_texture(self.__handle)
+            _gl.glDeleteTextures([self.__handle])
+            self.__handle = None
+
+
+class DynamicTexture(Texture):
+    """
+    A Texture whose pixels are changed often, such as every frame (video, minimaps, fog of war). Changes go through a
+    ring of pixel buffer objects: the pixels are written into mapped buffer memory, and OpenGL copies them into the
+    texture from there on its own time. The CPU can then carry on writing the next update while the GPU is still
+    using the last one, instead of waiting for each upload to finish.
+
+    Either call set_pixels() like with any Texture, or write straight into the buffer with begin_update() and
+    end_update().
+    """
+
+    BUFFER_COUNT = 3
+    """The number of pixel buffers updates rotate through."""
+
+    def __init__(self, width: int, height: int):
+        """
+        Create a new, blank (transparent), DynamicTexture.
+
+        :param width: The width of the texture.
+        :param height: The height of the texture.
+        """
+        self._from_pixels(width, height, bytes(width * height * 4))
+        self.__buffers = list(_np.atleast_1d(_gl.glGenBuffers(DynamicTexture.BUFFER_COUNT)))
+        for buffer in self.__buffers:
+            _gl.glBindBuffer(_gl.GL_PIXEL_UNPACK_BUFFER, buffer)
+            _gl.glBufferData(_gl.GL_PIXEL_UNPACK_BUFFER, width * height * 4, None, _gl.GL_STREAM_DRAW)
+        _gl.glBindBuffer(_gl.GL_PIXEL_UNPACK_BUFFER, 0)
+        self.__next_buffer = 0
+        self.__area = None
+
+    def begin_update(self, area: Rectangle = None) -> _np.ndarray:
+        """
+        Start changing the pixels of this texture, or of an area of it, by writing straight into buffer memory. Every
+        pixel of the area must be written, as the buffer doesn't hold the old pixels. Call end_update() when done.
+
+        :param area: The area of the texture to change, in pixels. Defaults to the whole texture.
+        :return: A NumPy uint8 array with shape (height, width, 4) to write the RGBA pixels into. It can't be used after
+        end_update().
+        """
+        if not self.__buffers:
+            raise RuntimeError("The DynamicTexture has been disposed.")
+        if self.__area is not None:
+            raise RuntimeError("end_update() must be called before begin_update() can be called again.")
+        self.__area = _pixel_area(self.size, area)
+        width, height = self.__area[2], self.__area[3]
+        _gl.glBindBuffer(_gl.GL_PIXEL_UNPACK_BUFFER, self.__buffers[self.__next_buffer])
+        # Invalidating lets the driver hand out fresh memory if the GPU is still reading this buffer, rather than wait.
+        address = _gl.glMapBufferRange(_gl.GL_PIXEL_UNPACK_BUFFER, 0, width * height * 4,
+                                       _gl.GL_MAP_WRITE_BIT | _gl.GL_MAP_INVALIDATE_BUFFER_BIT)
+        _gl.glBindBuffer(_gl.GL_PIXEL_UNPACK_BUFFER, 0)
+        memory = (_ctypes.c_ubyte * (width * height * 4)).from_address(address)
+        return _np.ctypeslib.as_array(memory).reshape(height, width, 4)
+
+    def end_update(self):
+        """
+        Finish the change started with begin_update(), and copy the pixels into the texture.
+        """
+        if self.__area is None:
+            raise RuntimeError("begin_update() must be called before end_update().")
+        x, y, width, height = self.__area
+        self.__area = None
+        _gl.glBindBuffer(_gl.GL_PIXEL_UNPACK_BUFFER, self.__buffers[self.__next_buffer])
+        _gl.glUnmapBuffer(_gl.GL_PIXEL_UNPACK_BUFFER)
+        self._bind()
+        # With a pixel buffer bound, the data argument is an offset into it.
+        _gl.glTexSubImage2D(_gl.GL_TEXTURE_2D, 0, x, y, width, height, _gl.GL_RGBA, _gl.GL_UNSIGNED_BYTE, None)
+        _gl.glBindBuffer(_gl.GL_PIXEL_UNPACK_BUFFER, 0)
+        self.__next_buffer = (self.__next_buffer + 1) % len(self.__buffers)
+
+    def set_pixels(self, data, area: Rectangle = None):
+        """
+        Set the pixels of this texture, or of an area of it, through the next pixel buffer. Takes the same pixels as
+        Texture.set_pixels().
+
+        :param data: The pixels, row by row from the top left.
+        :param area: The area of the texture to set, in pixels. Defaults to the whole texture.
+        """
+        x, y, width, height = _pixel_area(self.size, area)
+        pixels = _pixel_array(data, width, height)
+        self.begin_update(area).reshape(-1)[:] = pixels
+        self.end_update()
+
+    def dispose(self):
+        if self.__buffers:
+            _gl.glDeleteBuffers(len(self.__buffers), self.__buffers)
+            self.__buffers = []
+        super().dispose()
+
+
+class TextureHandle:
+    """A Texture that's loading in the background, returned by Texture.load_async()."""
+
+    @property
+    def done(self) -> bool:
+        """
+        Get whether loading has finished, either successfully or not.
+
+        :return: True if loading has finished.
+        """
+        return self.__done
+
+    @property
+    def texture(self) -> Texture:
+        """
+        Get the loaded Texture. If loading failed, the error is raised here.
+
+        :return: The Texture, or None if it hasn't loaded yet.
+        """
+        if self.__error is not None:
+            raise self.__error
+        return self.__texture
+
+    @property
+    def error(self) -> Exception:
+        """
+        Get the error that stopped the Texture loading.
+
+        :return: The error, or None if there wasn't one.
+        """
+        return self.__error
+
+    def __init__(self, path: str, on_loaded=None):
+        self.path: str = path
+        self.on_loaded = on_loaded
+        self.__texture = None
+        self.__error = None
+        self.__done = False
+        # The background decode, which TextureLoader waits on.
+        self._job = None
+
+    def _finish(self, texture: Texture, error: Exception):
+        self.__texture = texture
+        self.__error = error
+        self.__done = True
+        self._job = None
+        if texture is not None and self.on_loaded is not None:
+            self.on_loaded(texture)
+
+
+class TextureLoader:
+    """
+    Finishes the Textures started with Texture.load_async(). Images are decoded by a pool of threads (PIL releases the
+    GIL while decoding), but uploading to the graphics card has to happen on the main thread, so every frame the
+    decoded images are uploaded until upload_budget milliseconds have been spent (at least one is always uploaded).
+    The rest wait for the next frame, so loading many textures at once doesn't freeze the game.
+    """
+
+    upload_budget: float = 4
+    """The time in milliseconds to spend uploading textures each frame."""
+
+    __executor = None
+    __pending: list = []
+    __requested = 0
+    __finished = 0
+
+    @staticmethod
+    def pending() -> int:
+        """
+        Get the number of textures still loading.
+
+        :return: The number of textures still loading.
+        """
+        return len(TextureLoader.__pending)
+
+    @staticmethod
+    def progress() -> float:
+        """
+        Get the fraction of the textures started since the loader was last idle that have finished loading.
+
+        :return: The fraction, between 0 and 1. This is 1 when nothing is loading.
+        """
+        if TextureLoader.__requested == 0:
+            return 1.0
+        return TextureLoader.__finished / TextureLoader.__requested
+
+    @staticmethod
+    def _decode(path: str) -> _futures.Future:
+        if TextureLoader.__executor is None:
+            TextureLoader.__executor = _futures.ThreadPoolExecutor(thread_name_prefix="PGSTextureLoader")
+        return TextureLoader.__executor.submit(_decode_image, path)
+
+    @staticmethod
+    def _add(handle: TextureHandle):
+        if not TextureLoader.__pending:
+            TextureLoader.__requested = 0
+            TextureLoader.__finished = 0
+        TextureLoader.__pending.append(handle)
+        TextureLoader.__requested += 1
+
+    @staticmethod
+    def _update():
+        start = _time.perf_counter()
+        for handle in list(TextureLoader.__pending):
+            future = handle._job
+            if not future.done():
+                continue
+            TextureLoader.__pending.remove(handle)
+            TextureLoader.__finished += 1
+            error = future.exception()
+            if error is not None:
+                handle._finish(None, error)
+                continue
+            texture = Texture.__new__(Texture)
+            texture._from_pixels(*future.result())
+            handle._finish(texture, None)
+            if (_time.perf_counter() - start) * 1000 >= TextureLoader.upload_budget:
+                break
+
+
+def _pixel_area(size: Size, area: Rectangle) -> tuple:
+    # Get the (x, y, width, height) of the given area of a texture, in whole pixels. None is the whole texture.
+    if area is None:
+        return 0, 0, size.width, size.height
+    x, y, width, height = int(area.x), int(area.y), int(area.width), int(area.height)
+    if x < 0 or y < 0 or width <= 0 or height <= 0 or x + width > size.width or y + height > size.height:
+        raise ValueError("The area must be inside the texture.")
+    return x, y, width, height
+
+
+def _pixel_array(data, width: int, height: int) -> _np.ndarray:
+    # Get the given RGBA pixels as one contiguous NumPy array of bytes. Anything supporting the buffer protocol is
+    # viewed without being copied (unless it isn't contiguous).
+    if isinstance(data, (list, tuple)):
+        data = _np.fromiter((color.packed_value for color in data), _np.uint32, len(data))
+    elif not isinstance(data, _np.ndarray):
+        data = _np.frombuffer(data, _np.uint8)
+    if data.dtype.kind not in "ui" or data.dtype.itemsize not in (1, 4):
+        raise TypeError("Pixels must be given as RGBA bytes or packed 32-bit colors.")
+    data = _np.ascontiguousarray(data)
+    if data.nbytes != width * height * 4:
+        raise ValueError(f"A {width}x{height} area takes {width * height * 4} bytes of pixels, not {data.nbytes}.")
+    return data.reshape(-1).view(_np.uint8)
+
+
+def _decode_image(path: str):
+    # Runs on a TextureLoader thread: decode the image all the way to RGBA bytes, so the main thread only uploads it.
+    with _img.open(path) as img:
+        img = img.convert("RGBA")
+        return img.width, img.height, img.tobytes()
+
+
+class TextureCache:
+    """Loads each texture file once, however many times it's asked for, and frees the textures that aren't needed any
+    more. Every get() must be matched by a release() once the texture is no longer used (for example when a scene is
+    unloaded). Released textures stay loaded, so getting them again is free, until the textures in the cache take up
+    more than budget bytes of video memory; then the unreferenced ones that were drawn least recently are disposed."""
+
+    def __init__(self, budget: int = 256 * 1024 * 1024):
+        """
+        Create a new, empty, TextureCache.
+
+        :param budget: The estimated video memory, in bytes, the cache can use before it frees unreferenced textures.
+        """
+        self.budget: int = budget
+        self.__entries: dict = {}
+
+    @property
+    def used_bytes(self) -> int:
+        """
+        Get the estimated video memory used by the textures in the cache.
+
+        :return: The estimated size, in bytes, of every texture in the cache.
+        """
+        return sum(entry.size for entry in self.__entries.values())
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, path: str):
+        return _cache_key(path) in self.__entries
+
+    def get(self, path: str) -> Texture:
+        """
+        Get the Texture for the given path, loading it if it isn't in the cache. Call release() when it's no longer
+        used.
+
+        :param path: The path of the texture. Different paths to the same file share one Texture.
+        :return: The Texture.
+        """
+        key = _cache_key(path)
+        entry = self.__entries.get(key)
+        if entry is None:
+            texture = Texture(path)
+            entry = self.__entries[key] = _CachedTexture(texture, texture.size.width * texture.size.height * 4)
+        entry.references += 1
+        self.trim()
+        return entry.texture
+
+    def release(self, path_or_texture):
+        """
+        Stop using a Texture from get(). Once nothing uses it, it can be freed to keep the cache within budget.
+
+        :param path_or_texture: The path the Texture was got with, or the Texture itself.
+        """
+        entry = self.__find(path_or_texture)
+        if entry is None or entry.references == 0:
+            raise ValueError("The texture was not got from this cache, or has already been released.")
+        entry.references -= 1
+        self.trim()
+
+    def trim(self, budget: int = None) -> int:
+        """
+        Dispose unreferenced textures, least recently drawn first, until the cache is within budget.
+
+        :param budget: The size in bytes to trim the cache to. Defaults to the budget of the cache; 0 frees every
+        unreferenced texture.
+        :return: The number of textures disposed.
+        """
+        budget = self.budget if budget is None else budget
+        used = self.used_bytes
+        if used <= budget:
+            return 0
+        freed = 0
+        unreferenced = [(entry.texture._last_drawn, key) for key, entry in self.__entries.items() if entry.references == 0]
+        for _, key in sorted(unreferenced):
+            if used <= budget:
+                break
+            entry = self.__entries.pop(key)
+            entry.texture.dispose()
+            used -= entry.size
+            freed += 1
+        return freed
+
+    def clear(self):
+        """
+        Dispose every texture in the cache, including ones still in use.
+        """
+        for entry in self.__entries.values():
+            entry.texture.dispose()
+        self.__entries.clear()
+
+    def __find(self, path_or_texture):
+        if isinstance(path_or_texture, Texture):
+            for entry in self.__entries.values():
+                if entry.texture is path_or_texture:
+                    return entry
+            return None
+        return self.__entries.get(_cache_key(path_or_texture))
+
+
+class _CachedTexture:
+    __slots__ = ("texture", "size", "references")
+
+    def __init__(self, texture: Texture, size: int):
+        self.texture: Texture = texture
+        self.size: int = size
+        self.references: int = 0
+
+
+def _cache_key(path: str) -> str:
+    # Paths that point at the same file (relative or absolute, with different separators or case on Windows) are the
+    # same texture.
+    return _os.path.normcase(_os.path.abspath(path))
+
+
+class TextureRegion:
     """
-    Represents a way to clean and remove unmanaged memory.
+    Represents a rectangular part of a Texture. A TextureRegion can be drawn anywhere a Texture can, and only that part
+    of the Texture will be drawn.
     """
 
-    @_abc.abstractmethod
-    def dispose(self):
-        pass
-
-class Texture(Disposable):
-    def __init__(self, path: str):
-        self.__handle = _gl.glGenTextures(1)
-        _gl.glActiveTexture(_gl.GL_TEXTURE0)
-        _gl.glBindTexture(_gl.GL_TEXTURE_2D, self.__handle)
+    @property
+    def size(self) -> Size:
+        """
+        Get the size in pixels of this region.
 
-        img = _img.open(path)
+        :return: The size in pixels of this region.
+        """
+        return Size(self.source.width, self.source.height)
 
-        btes = img.tobytes()
-        _gl.glTexImage2D(_gl.GL_TEXTURE_2D, 0, _gl.GL_RGBA, img.width, img.height, 0, _gl.GL_RGBA, _gl.GL_UNSIGNED_BYTE, btes)
+    def __init__(self, texture: Texture, source: Rectangle):
+        """
+        Create a new TextureRegion.
 
-        img.close()
+        :param texture: The Texture the region is part of.
+        :param source: The part of the Texture, in pixels, that the region covers.
+        """
+        self.texture: Texture = texture
+        self.source: Rectangle = source
+        size = texture.size
+        self._uv_rect = (source.x / size.width, source.y / size.height,
+                         (source.x + source.width) / size.width, (source.y + source.height) / size.height)
 
     def _bind(self):
-        _gl.glActiveTexture(_gl.GL_TEXTURE0)
-        _gl.glBindTexture(_gl.GL_TEXTURE_2D, self.__handle)
+        self.texture._bind()
 
-    def dispose(self):
-        #_gl.glDeleteTextures(1, [self.__handle])
-        pass
+
+class AtlasBuilder:
+    """
+    Packs many Textures (or image files) into a few large Textures, called pages. Every packed Texture comes back as a
+    TextureRegion of a page, so lots of different images can be drawn without switching Texture between every draw.
+    """
+
+    def __init__(self, page_size: Size = Size(2048, 2048), padding: int = 1):
+        """
+        Create a new AtlasBuilder.
+
+        :param page_size: The size of each page. Every Texture added must fit inside a single page.
+        :param padding: The gap, in pixels, left around each Texture so they don't bleed into each other when scaled.
+        """
+        self.page_size: Size = page_size
+        self.padding: int = padding
+        self.__textures: dict = {}
+        self.__pages: list[Texture] = []
+
+    @property
+    def pages(self) -> list[Texture]:
+        """
+        Get the pages created by build().
+
+        :return: The list of pages.
+        """
+        return self.__pages
+
+    def add(self, name: str, texture):
+        """
+        Add a Texture to be packed.
+
+        :param name: The name to get the region back with once the atlas is built.
+        :param texture: The Texture, or the path of an image file, to pack.
+        """
+        self.__textures[name] = texture
+
+    def build(self) -> dict:
+        """
+        Pack every added Texture into pages.
+
+        :return: A dictionary of the name given in add() to the TextureRegion it was packed into.
+        """
+        images = {}
+        for name, texture in self.__textures.items():
+            images[name] = _img.open(texture).convert("RGBA") if isinstance(texture, str) else texture._to_pil_image()
+
+        # Packing the tallest images first gives a much flatter skyline, which wastes less space.
+        order = sorted(images, key=lambda n: (images[n].height, images[n].width), reverse=True)
+        packers: list[_SkylinePacker] = []
+        placements = {}
+        for name in order:
+            image = images[name]
+            width, height = image.width + self.padding * 2, image.height + self.padding * 2
+            if width > self.page_size.width or height > self.page_size.height:
+                raise ValueError(f"'{name}' ({image.width}x{image.height}) is too big to fit in a "
+                                 f"{self.page_size.width}x{self.page_size.height} atlas page.")
+            for page, packer in enumerate(packers):
+                position = packer.insert(width, height)
+                if position is not None:
+                    break
+            else:
+                packers.append(_SkylinePacker(self.page_size.width, self.page_size.height))
+                page, position = len(packers) - 1, packers[-1].insert(width, height)
+            placements[name] = (page, position[0] + self.padding, position[1] + self.padding)
+
+        page_images = [_img.new("RGBA", (self.page_size.width, self.page_size.height)) for _ in packers]
+        for name, (page, x, y) in placements.items():
+            page_images[page].paste(images[name], (x, y))
+        self.__pages = [Texture._from_pil_image(image) for image in page_images]
+
+        regions = {}
+        for name, (page, x, y) in placements.items():
+            regions[name] = TextureRegion(self.__pages[page], Rectangle(x, y, images[name].width, images[name].height))
+        return regions
+
+
+class _SkylinePacker:
+    # Packs rectangles into a fixed size area using the skyline bottom-left method. The skyline is a list of
+    # [x, y, width] segments describing the top edge of everything packed so far; each rectangle is placed where it
+    # rests lowest on the skyline.
+
+    def __init__(self, width: int, height: int):
+        self.width: int = width
+        self.height: int = height
+        self.__skyline: list = [[0, 0, width]]
+
+    def insert(self, width: int, height: int):
+        # Returns the (x, y) the rectangle was placed at, or None if it doesn't fit.
+        best = None
+        for index, segment in enumerate(self.__skyline):
+            y = self.__fit(index, width, height)
+            if y is not None and (best is None or (y + height, segment[0]) < best[0]):
+                best = ((y + height, segment[0]), index, segment[0], y)
+        if best is None:
+            return None
+        _, index, x, y = best
+        self.__add_segment(index, x, y + height, width)
+        return x, y
+
+    def __fit(self, index: int, width: int, height: int):
+        # Get the y the rectangle would rest at if its left side were placed at the start of the given segment.
+        if self.__skyline[index][0] + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        while remaining > 0:
+            segment = self.__skyline[index]
+            y = max(y, segment[1])
+            if y + height > self.height:
+                return None
+            remaining -= segment[2]
+            index += 1
+        return y
+
+    def __add_segment(self, index: int, x: int, y: int, width: int):
+        skyline = self.__skyline
+        skyline.insert(index, [x, y, width])
+        # Cut away whatever the new segment now covers.
+        i = index + 1
+        while i < len(skyline):
+            previous_end = skyline[i - 1][0] + skyline[i - 1][2]
+            if skyline[i][0] >= previous_end:
+                break
+            shrink = previous_end - skyline[i][0]
+            skyline[i][0] += shrink
+            skyline[i][2] -= shrink
+            if skyline[i][2] > 0:
+                break
+            del skyline[i]
+        # Merge neighbouring segments at the same height.
+        i = 0
+        while i < len(skyline) - 1:
+            if skyline[i][1] == skyline[i + 1][1]:
+                skyline[i][2] += skyline[i + 1][2]
+                del skyline[i + 1]
+            else:
+                i += 1
 
 
 class Shader(Disposable):
     """
     Create a custom GLSL shader that can be used.
+
+    Linked programs are cached on disk (where the driver supports program binaries), so the next launch can load them
+    instead of compiling the GLSL again. Set Shader.cache_directory to None to turn the cache off.
     """
 
+    cache_directory: str = None
+    """The folder program binaries are cached in, or None to not cache them. Defaults to a PGS folder in the user's
+    cache directory."""
+
     def __init__(self, vertex: str, fragment: str):
         """
         Create a new shader.
@@ -501,31 +2135,58 @@ class Shader(Disposable):
         :param vertex: The vertex shader.
         :param fragment: The fragment shader.
         """
-        vertex_shader = _gl.glCreateShader(_gl.GL_VERTEX_SHADER)
-        _gl.glShaderSource(vertex_shader, vertex)
-        self.__compile_shader(vertex_shader)
-
-        fragment_shader = _gl.glCreateShader(_gl.GL_FRAGMENT_SHADER)
-        _gl.glShaderSource(fragment_shader, fragment)
-        self.__compile_shader(fragment_shader)
-
         self.__handle = _gl.glCreateProgram()
-        _gl.glAttachShader(self.__handle, vertex_shader)
-        _gl.glAttachShader(self.__handle, fragment_shader)
-        self.__link_program(self.__handle)
-        _gl.glDetachShader(self.__handle, vertex_shader)
-        _gl.glDetachShader(self.__handle, fragment_shader)
-        _gl.glDeleteShader(vertex_shader)
-        _gl.glDeleteShader(fragment_shader)
-
-        self.__uniform_locations = {}
-        num_uniforms = 0
-        _gl.glGetProgramiv(self.__handle, _gl.GL_ACTIVE_UNIFORMS, num_uniforms)
+        cache_path = self.__cache_path(vertex, fragment)
+        if cache_path is None or not self.__load_binary(cache_path):
+            vertex_shader = _gl.glCreateShader(_gl.GL_VERTEX_SHADER)
+            _gl.glShaderSource(vertex_shader, vertex)
+            self.__compile_shader(vertex_shader)
+
+            fragment_shader = _gl.glCreateShader(_gl.GL_FRAGMENT_SHADER)
+            _gl.glShaderSource(fragment_shader, fragment)
+            self.__compile_shader(fragment_shader)
+
+            _gl.glAttachShader(self.__handle, vertex_shader)
+            _gl.glAttachShader(self.__handle, fragment_shader)
+            if cache_path is not None:
+                _gl.glProgramParameteri(self.__handle, _gl.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, _gl.GL_TRUE)
+            self.__link_program(self.__handle)
+            _gl.glDetachShader(self.__handle, vertex_shader)
+            _gl.glDetachShader(self.__handle, fragment_shader)
+            _gl.glDeleteShader(vertex_shader)
+            _gl.glDeleteShader(fragment_shader)
+            if cache_path is not None:
+                self.__save_binary(cache_path)
+
+        # Shaders with the shared FrameData block read it from the buffer FrameUniforms keeps.
+        block = _gl.glGetUniformBlockIndex(self.__handle, "FrameData")
+        if block != _gl.GL_INVALID_INDEX:
+            _gl.glUniformBlockBinding(self.__handle, block, FrameUniforms.BINDING)
+
+        self.__uniforms = {}
+        self.__uniform_setters = {}
+        num_uniforms = _gl.glGetProgramiv(self.__handle, _gl.GL_ACTIVE_UNIFORMS)
         for i in range(num_uniforms):
-            name = _gl.glGetActiveUniform(self.__handle, i, None)
-            location = _gl.glGetUniformLocation(self.__handle, name[0])
-            self.__uniform_locations[name] = location
+            name, size, gl_type = _gl.glGetActiveUniform(self.__handle, i)
+            name = name.decode()
+            # Arrays are reported as their first element, but are set all at once by their plain name.
+            if name.endswith("[0]"):
+                name = name[:-3]
+            location = _gl.glGetUniformLocation(self.__handle, name)
+            # Uniforms in a uniform block have no location, and are set through their buffer instead.
+            if location == -1:
+                continue
+            self.__uniforms[name] = (int(gl_type), int(size))
+            self.__uniform_setters[name] = _uniform_setter(self.__handle, location, int(gl_type), int(size))
+
+    @property
+    def uniforms(self) -> dict:
+        """
+        Get the uniforms of this shader that can be set.
 
+        :return: A dictionary of uniform name to a (GL type, array size) tuple.
+        """
+        return dict(self.__uniforms)
 
     def __compile_shader(self, shader):
         _gl.glCompileShader(shader)
@@ -541,120 +2202,1318 @@ class Shader(Disposable):
         if status != _gl.GL_TRUE:
             raise Exception(f"Error linking program '{program}'.\n\n{_gl.glGetProgramInfoLog(program)}")
 
-    def set_uniform(self, uniform_name, value):
-        name = self.__get_uniform_location(uniform_name)
+    @staticmethod
+    def __cache_path(vertex: str, fragment: str):
+        # A binary only works with the driver that made it, so the driver is part of the key along with the sources.
+        if Shader.cache_directory is None or not _gl.glGetIntegerv(_gl.GL_NUM_PROGRAM_BINARY_FORMATS):
+            return None
+        key = _hashlib.sha256()
+        for part in (vertex, fragment, _gl.glGetString(_gl.GL_VENDOR), _gl.glGetString(_gl.GL_RENDERER),
+                     _gl.glGetString(_gl.GL_VERSION)):
+            key.update(part if isinstance(part, bytes) else part.encode())
+            key.update(b"\0")
+        return _os.path.join(Shader.cache_directory, key.hexdigest() + ".bin")
+
+    def __load_binary(self, path: str) -> bool:
+        # The cached binary starts with its 4 byte format. The driver can still reject it (after an update, for
+        # example), in which case the program is compiled from source again.
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return False
+        if len(data) <= 4:
+            return False
+        binary_format = int.from_bytes(data[:4], "little")
+        binary = _np.frombuffer(data, _np.uint8, offset=4)
+        try:
+            _gl.glProgramBinary(self.__handle, binary_format, binary, len(binary))
+        except _gl.GLError:
+            return False
+        return _gl.glGetProgramiv(self.__handle, _gl.GL_LINK_STATUS) == _gl.GL_TRUE
+
+    def __save_binary(self, path: str):
+        length = _gl.glGetProgramiv(self.__handle, _gl.GL_PROGRAM_BINARY_LENGTH)
+        if length <= 0:
+            return
+        binary = _np.zeros(length, _np.uint8)
+        binary_format = _gl.GLenum(0)
+        written = _gl.GLsizei(0)
+        _gl.glGetProgramBinary(self.__handle, length, written, binary_format, binary)
+        # The cache is only there to speed up loading, so failing to write it isn't an error.
+        try:
+            _os.makedirs(Shader.cache_directory, exist_ok=True)
+            temporary_path = f"{path}.{_os.getpid()}.tmp"
+            with open(temporary_path, "wb") as file:
+                file.write(binary_format.value.to_bytes(4, "little"))
+                file.write(binary[:written.value].tobytes())
+            _os.replace(temporary_path, path)
+        except OSError:
+            pass
+
+    def get_uniform_setter(self, uniform_name: str):
+        """
+        Get the setter of a uniform. The setter is made once, when the shader is linked, for the uniform's type, so
+        calling it skips looking the uniform up and working out how to upload the value. Setting the value the uniform
+        already has does nothing.
+
+        Floats take a number (or a tuple of numbers for vectors), and vec2 also takes a Vector2 and vec4 a Color. Ints,
+        bools and samplers take an int or a bool. mat4 takes a Matrix or 16 floats, and arrays take a sequence of all
+        their values.
 
-        if type(value) == bool:
-            _gl.glUniform1i(name, 1 if value else 0)
-        elif type(value) == int:
-            _gl.glUniform1i(name, value)
-        elif type(value) == float:
-            _gl.glUniform1f(name, value)
-        elif type(value) == Vector2:
-            _gl.glUniform2f(name, value.x, value.y)
-        #elif type(value) == Matrix:
-            #_gl.glUniformMatrix4fv(name, 1, True, )
+        :param uniform_name: The name of the uniform.
+        :return: A function that takes the new value of the uniform.
+        """
+        if uniform_name not in self.__uniform_setters:
+            raise Exception("Given uniform name is not valid.")
+        return self.__uniform_setters[uniform_name]
+
+    def set_uniform(self, uniform_name: str, value):
+        """
+        Set the value of a uniform. Use get_uniform_setter() for uniforms that are set every frame.
+
+        :param uniform_name: The name of the uniform.
+        :param value: The new value of the uniform.
+        """
+        self.get_uniform_setter(uniform_name)(value)
 
     def _use(self):
-        _gl.glUseProgram(self.__handle)
+        RenderState._use_program(self.__handle)
 
     def _get_attrib_location(self, name: str) -> int:
         return _gl.glGetAttribLocation(self.__handle, name)
 
-    def __get_uniform_location(self, name):
-        if name not in self.__uniform_locations:
-            raise Exception("Given uniform name is not valid.")
-        return self.__uniform_locations[name]
-
     def dispose(self):
+        RenderState._forget_program(self.__handle)
         _gl.glDeleteProgram(self.__handle)
 
 
-class SpriteBase:
-    pass
+def _user_cache_directory() -> str:
+    # Where the platform keeps per-user caches.
+    if _sys.platform == "win32":
+        base = _os.environ.get("LOCALAPPDATA") or _os.path.expanduser("~\\AppData\\Local")
+    elif _sys.platform == "darwin":
+        base = _os.path.expanduser("~/Library/Caches")
+    else:
+        base = _os.environ.get("XDG_CACHE_HOME") or _os.path.expanduser("~/.cache")
+    return _os.path.join(base, "PGS", "shaders")
+
+
+Shader.cache_directory = _user_cache_directory()
+
+
+# The number of components of each type of uniform, and the functions that upload one value or an array of them.
+_FLOAT_UNIFORMS = {
+    _gl.GL_FLOAT: (1, _gl.glUniform1f, _gl.glUniform1fv),
+    _gl.GL_FLOAT_VEC2: (2, _gl.glUniform2f, _gl.glUniform2fv),
+    _gl.GL_FLOAT_VEC3: (3, _gl.glUniform3f, _gl.glUniform3fv),
+    _gl.GL_FLOAT_VEC4: (4, _gl.glUniform4f, _gl.glUniform4fv),
+}
+_INT_UNIFORMS = {
+    _gl.GL_INT: (1, _gl.glUniform1i, _gl.glUniform1iv),
+    _gl.GL_INT_VEC2: (2, _gl.glUniform2i, _gl.glUniform2iv),
+    _gl.GL_INT_VEC3: (3, _gl.glUniform3i, _gl.glUniform3iv),
+    _gl.GL_INT_VEC4: (4, _gl.glUniform4i, _gl.glUniform4iv),
+    _gl.GL_BOOL: (1, _gl.glUniform1i, _gl.glUniform1iv),
+    _gl.GL_BOOL_VEC2: (2, _gl.glUniform2i, _gl.glUniform2iv),
+    _gl.GL_BOOL_VEC3: (3, _gl.glUniform3i, _gl.glUniform3iv),
+    _gl.GL_BOOL_VEC4: (4, _gl.glUniform4i, _gl.glUniform4iv),
+    _gl.GL_SAMPLER_1D: (1, _gl.glUniform1i, _gl.glUniform1iv),
+    _gl.GL_SAMPLER_2D: (1, _gl.glUniform1i, _gl.glUniform1iv),
+    _gl.GL_SAMPLER_3D: (1, _gl.glUniform1i, _gl.glUniform1iv),
+    _gl.GL_SAMPLER_CUBE: (1, _gl.glUniform1i, _gl.glUniform1iv),
+    _gl.GL_SAMPLER_2D_ARRAY: (1, _gl.glUniform1i, _gl.glUniform1iv),
+    _gl.GL_SAMPLER_2D_SHADOW: (1, _gl.glUniform1i, _gl.glUniform1iv),
+}
+_MATRIX_UNIFORMS = {
+    _gl.GL_FLOAT_MAT2: (4, _gl.glUniformMatrix2fv),
+    _gl.GL_FLOAT_MAT3: (9, _gl.glUniformMatrix3fv),
+    _gl.GL_FLOAT_MAT4: (16, _gl.glUniformMatrix4fv),
+}
+
+
+def _uniform_components(value) -> tuple:
+    # Flatten a uniform value into a tuple of numbers, which is cheap to compare with the last value that was set.
+    if isinstance(value, (int, float)):
+        return value,
+    if isinstance(value, Vector2):
+        return value.x, value.y
+    if isinstance(value, Color):
+        return value.r / 255, value.g / 255, value.b / 255, value.a / 255
+    return tuple(_np.asarray(value).reshape(-1).tolist())
+
+
+def _uniform_setter(program: int, location: int, gl_type: int, size: int):
+    # Make the setter for one uniform. Everything that depends on the uniform's type is worked out here, once, and
+    # each setter remembers the last value it uploaded so setting the same value again costs no GL calls.
+    last = None
+
+    if gl_type in _MATRIX_UNIFORMS:
+        length, upload_matrix = _MATRIX_UNIFORMS[gl_type]
+        last_matrix = None
+
+        def set_matrix(value):
+            nonlocal last, last_matrix
+            if isinstance(value, Matrix):
+                if length != 16 or size != 1:
+                    raise TypeError("Only mat4 uniforms can be set to a Matrix.")
+                # A Matrix keeps its 4x4 array until it's changed, so getting the same array back means it's unchanged.
+                data = matrix = value._to_gl_matrix()
+                if matrix is last_matrix:
+                    return
+            else:
+                data, matrix = _np.ascontiguousarray(value, dtype=_np.float32).reshape(-1), None
+                if data.size != length * size:
+                    raise ValueError(f"This uniform takes {length * size} floats, not {data.size}.")
+            if last is not None and _np.array_equal(data, last):
+                last_matrix = matrix
+                return
+            RenderState._use_program(program)
+            upload_matrix(location, size, _gl.GL_FALSE, data)
+            last, last_matrix = data.copy(), matrix
+
+        return set_matrix
+
+    if gl_type in _FLOAT_UNIFORMS or gl_type in _INT_UNIFORMS:
+        length, upload_value, upload_array = _FLOAT_UNIFORMS.get(gl_type) or _INT_UNIFORMS[gl_type]
+        dtype = _np.float32 if gl_type in _FLOAT_UNIFORMS else _np.int32
+
+        def set_value(value):
+            nonlocal last
+            components = _uniform_components(value)
+            if components == last:
+                return
+            if len(components) != length * size:
+                raise ValueError(f"This uniform takes {length * size} values, not {len(components)}.")
+            RenderState._use_program(program)
+            if size == 1:
+                upload_value(location, *components)
+            else:
+                upload_array(location, size, _np.array(components, dtype))
+            last = components
+
+        return set_value
+
+    def set_unsupported(value):
+        raise TypeError(f"Uniforms of GL type {gl_type:#x} can't be set.")
+
+    return set_unsupported
+
+
+class SpriteBase(_abc.ABC):
+    """
+    Represents the base class of a Sprite object. This includes all attributes a sprite will need barring Texture.
+    This class cannot be instantiated.
 
-class SpriteDrawer:
-    # Primary sprite vertex shader
-    __SPRITE_VERT = """
+    The position, origin, scale and color belong to the sprite: assigning one copies the values in, so changing the
+    assigned Vector2 or Color in place afterwards doesn't change the sprite, and changing the sprite's in place
+    (sprite.position += velocity) changes only this sprite.
+    """
+
+    @property
+    def position(self) -> Vector2:
+        return self.__position
+
+    @position.setter
+    def position(self, value: Vector2):
+        self.__position.set(value.x, value.y)
+
+    @property
+    def scale(self) -> Vector2:
+        return self.__scale
+
+    @scale.setter
+    def scale(self, value: Vector2):
+        self.__scale.set(value.x, value.y)
+
+    @property
+    def color(self) -> Color:
+        return self.__color
+
+    @color.setter
+    def color(self, value: Color):
+        self.__color.set(value.r, value.g, value.b, value.a)
+
+    @property
+    def origin(self) -> Vector2:
+        return self.__origin
+
+    @origin.setter
+    def origin(self, value: Vector2):
+        self.__origin.set(value.x, value.y)
+
+    def __init__(self):
+        self.__position: Vector2 = Vector2.zero()
+        self.rotation: float = 0
+        self.__scale: Vector2 = Vector2.one()
+        self.__color: Color = Color(255, 255, 255)
+        self.__origin: Vector2 = Vector2.zero()
+
+
+class Sprite(SpriteBase):
+    def __init__(self, texture: Texture, position: Vector2):
+        super().__init__()
+        self.texture: Texture = texture
+        self.position: Vector2 = position
+
+    @staticmethod
+    def from_sprite(sprite: 'Sprite'):
+        new_sprite = Sprite(sprite.texture, sprite.position)
+        new_sprite.origin = sprite.origin
+        new_sprite.color = sprite.color
+        new_sprite.scale = sprite.scale
+        new_sprite.rotation = sprite.rotation
+        return new_sprite
+
+    @property
+    def bounds(self) -> Rectangle:
+        """
+        Get the area this sprite covers in the world, taking its origin, scale and rotation into account.
+
+        :return: The area this sprite covers.
+        """
+        left, top, right, bottom = _texture_bounds(self.texture, self.position, self.origin, self.scale, self.rotation)
+        return Rectangle(left, top, right - left, bottom - top)
+
+
+class ParticleEmitter:
+    """
+    Emits and simulates many small textured particles, such as smoke, sparks or dust. Particles aren't Sprites: every
+    particle's state is kept in NumPy arrays, so they are all moved at once, and drawn with a single
+    SpriteDrawer.draw_many() call. This keeps even 100,000 live particles cheap.
+
+    Change the attributes after creating the emitter to set how the particles behave. Every range is a
+    (minimum, maximum) tuple, and each new particle gets a random value in that range.
+    """
+
+    def __init__(self, texture: Texture, position: Vector2 = Vector2.zero(), max_particles: int = 10000):
+        """
+        Create a new ParticleEmitter.
+
+        :param texture: The Texture (or TextureRegion) every particle is drawn with.
+        :param position: The position new particles are emitted from.
+        :param max_particles: The most particles that can be alive at once. New particles are not emitted past this.
+        """
+        self.texture = texture
+        self.position: Vector2 = position.copy()
+        self.max_particles: int = max_particles
+        # The number of particles emitted every second by update().
+        self.emission_rate: float = 0
+        # The lifetime of each particle, in seconds.
+        self.life: tuple = (1, 1)
+        # The speed, in pixels per second, and the direction, in radians, particles are emitted with.
+        self.speed: tuple = (50, 100)
+        self.direction: tuple = (0, 2 * _math.pi)
+        # The acceleration applied to every particle, in pixels per second per second.
+        self.gravity: Vector2 = Vector2.zero()
+        self.rotation: tuple = (0, 0)
+        # The rotation speed, in radians per second.
+        self.angular_velocity: tuple = (0, 0)
+        # Particles fade from the start to the end color, and scale from the start to the end scale, over their life.
+        self.start_color: Color = Colors.WHITE
+        self.end_color: Color = Colors.WHITE
+        self.start_scale: float = 1
+        self.end_scale: float = 1
+
+        self.__random = _np.random.default_rng()
+        self.__count: int = 0
+        self.__to_emit: float = 0
+        self.__positions = _np.zeros((max_particles, 2), _np.float32)
+        self.__velocities = _np.zeros((max_particles, 2), _np.float32)
+        self.__rotations = _np.zeros(max_particles, _np.float32)
+        self.__angular_velocities = _np.zeros(max_particles, _np.float32)
+        self.__life = _np.zeros(max_particles, _np.float32)
+        self.__max_life = _np.ones(max_particles, _np.float32)
+        self.__scales = _np.zeros((max_particles, 2), _np.float32)
+        self.__colors = _np.zeros(max_particles, _np.uint32)
+        self.__origins = _np.zeros((max_particles, 2), _np.float32)
+
+    @property
+    def count(self) -> int:
+        """
+        Get the number of live particles.
+
+        :return: The number of live particles.
+        """
+        return self.__count
+
+    def emit(self, count: int):
+        """
+        Emit a number of particles at once, such as for an explosion.
+
+        :param count: The number of particles to emit.
+        """
+        start = self.__count
+        count = min(int(count), self.max_particles - start)
+        if count <= 0:
+            return
+        end = start + count
+        uniform = self.__random.uniform
+        speed = uniform(self.speed[0], self.speed[1], count)
+        direction = uniform(self.direction[0], self.direction[1], count)
+        self.__positions[start:end] = (self.position.x, self.position.y)
+        self.__velocities[start:end, 0] = _np.cos(direction) * speed
+        self.__velocities[start:end, 1] = _np.sin(direction) * speed
+        self.__rotations[start:end] = uniform(self.rotation[0], self.rotation[1], count)
+        self.__angular_velocities[start:end] = uniform(self.angular_velocity[0], self.angular_velocity[1], count)
+        self.__max_life[start:end] = uniform(self.life[0], self.life[1], count)
+        self.__life[start:end] = self.__max_life[start:end]
+        self.__count = end
+
+    def update(self, delta_time: float = None):
+        """
+        Emit new particles, move every particle, and remove the ones that have reached the end of their life.
+
+        :param delta_time: The time, in seconds, to move forward by. Defaults to the time since the last frame.
+        """
+        if delta_time is None:
+            delta_time = Time.delta_time()
+        self.__to_emit += self.emission_rate * delta_time
+        if self.__to_emit >= 1:
+            self.emit(int(self.__to_emit))
+            self.__to_emit -= int(self.__to_emit)
+
+        count = self.__count
+        if count == 0:
+            return
+        velocities = self.__velocities[:count]
+        velocities += (self.gravity.x * delta_time, self.gravity.y * delta_time)
+        self.__positions[:count] += velocities * delta_time
+        self.__rotations[:count] += self.__angular_velocities[:count] * delta_time
+        life = self.__life[:count]
+        life -= delta_time
+
+        alive = life > 0
+        if not alive.all():
+            # Keep the live particles packed together at the start of the arrays.
+            alive_count = int(alive.sum())
+            for array in (self.__positions, self.__velocities, self.__rotations, self.__angular_velocities,
+                          self.__life, self.__max_life):
+                array[:alive_count] = array[:count][alive]
+            self.__count = alive_count
+
+    def clear(self):
+        """
+        Remove every particle.
+        """
+        self.__count = 0
+
+    def draw(self, sprite_drawer: 'SpriteDrawer'):
+        """
+        Draw every live particle.
+
+        :param sprite_drawer: The SpriteDrawer to draw with.
+        """
+        count = self.__count
+        if count == 0:
+            return
+        # How far through its life each particle is, from 0 to 1.
+        age = 1 - self.__life[:count] / self.__max_life[:count]
+        scales = self.__scales[:count]
+        scales[:, 0] = self.start_scale + (self.end_scale - self.start_scale) * age
+        scales[:, 1] = scales[:, 0]
+        start = _np.array((self.start_color.r, self.start_color.g, self.start_color.b, self.start_color.a), _np.float32)
+        end = _np.array((self.end_color.r, self.end_color.g, self.end_color.b, self.end_color.a), _np.float32)
+        channels = (start + (end - start) * age[:, None]).astype(_np.uint32)
+        colors = self.__colors[:count]
+        colors[:] = channels[:, 0] | channels[:, 1] << 8 | channels[:, 2] << 16 | channels[:, 3] << 24
+        size = self.texture.size
+        origins = self.__origins[:count]
+        origins[:] = (size.width / 2, size.height / 2)
+        sprite_drawer.draw_many(self.texture, self.__positions[:count], origins, scales, self.__rotations[:count],
+                                colors)
+
+
+def _texture_bounds(texture, position: Vector2, origin: Vector2, scale: Vector2, rotation: float) -> tuple:
+    # Get the (left, top, right, bottom) edges of the area the texture (or region) covers when drawn with the given
+    # values.
+    size = texture.size
+    left, top = -origin.x * scale.x, -origin.y * scale.y
+    right, bottom = left + size.width * scale.x, top + size.height * scale.y
+    if rotation != 0:
+        # Rotate the corners, and take the area they cover.
+        cos, sin = _math.cos(rotation), _math.sin(rotation)
+        xs = (left * cos - top * sin, right * cos - top * sin, left * cos - bottom * sin, right * cos - bottom * sin)
+        ys = (left * sin + top * cos, right * sin + top * cos, left * sin + bottom * cos, right * sin + bottom * cos)
+        left, right, top, bottom = min(xs), max(xs), min(ys), max(ys)
+    elif left > right or top > bottom:
+        # A negative scale flips the texture around the origin.
+        left, right, top, bottom = min(left, right), max(left, right), min(top, bottom), max(top, bottom)
+    return position.x + left, position.y + top, position.x + right, position.y + bottom
+
+
+def _view_rectangle(transform_matrix: Matrix) -> Rectangle:
+    # Get the part of the world visible on screen, by turning the corners of the viewport back into the world.
+    _, _, width, height = _gl.glGetIntegerv(_gl.GL_VIEWPORT)
+    corners = transform_matrix.invert().transform_points(((0, 0), (width, 0), (0, height), (width, height)))
+    left, top = corners.min(axis=0)
+    right, bottom = corners.max(axis=0)
+    return Rectangle(float(left), float(top), float(right - left), float(bottom - top))
+
+
+# The layout of the vertices static sprites are compiled into.
+_STATIC_VERTEX = _np.dtype([("position", _np.float32, 2), ("texture_coordinates", _np.float32, 2),
+                            ("color", _np.uint8, 4)])
+
+
+class _StaticBatch:
+    # Compiles sprites that never change into a vertex buffer that stays on the GPU, so drawing them costs one draw
+    # call per texture no matter how many sprites there are. Call build() again whenever the sprites change.
+
+    __STATIC_VERT = """
     #version 330 core
-    
+    """ + FrameUniforms.GLSL + """
+
     in vec2 aPosition;
     in vec2 aTexCoords;
-    
+    in vec4 aColor;
+
     out vec2 frag_texCoords;
-    
-    uniform mat4 uModel;
-    uniform mat4 uTransform;
-    uniform mat4 uProjection;
-    
+    out vec4 frag_color;
+
     void main()
     {
-        //gl_Position = vec4(aPosition, 0.0, 1.0) * uModel * uTransform * uProjection;
-        gl_Position = vec4(aPosition, 0.0, 1.0);
+        gl_Position = uProjection * uView * vec4(aPosition, 0.0, 1.0);
         frag_texCoords = aTexCoords;
+        frag_color = aColor;
     }"""
 
-    # Primary sprite fragment shader
-    __SPRITE_FRAG = """
+    __STATIC_FRAG = """
     #version 330 core
-    
+
     in vec2 frag_texCoords;
-    
+    in vec4 frag_color;
+
     out vec4 out_color;
-    
+
     uniform sampler2D uTexture;
-    uniform vec4 uColor;
-    
+
     void main()
     {
-        //out_color = texture(uTexture, frag_texCoords) * uColor;
-        out_color = vec4(1, 1, 0, 0);
+        out_color = texture(uTexture, frag_texCoords) * frag_color;
     }"""
 
-    __VERTICES = [1.0, 1.0, 1.0, 0.0,
-                  1.0, -1.0, 1.0, 1.0,
-                  -1.0, -1.0, 0.0, 1.0,
-                  -1.0, 1.0, 0.0, 0.0]
-    __INDICES = [0, 1, 3, 1, 2, 3]
+    __shader = None
 
     def __init__(self):
+        self.__vbo = _gl.glGenBuffers(1)
+        self.__ebo = _gl.glGenBuffers(1)
+        self.__vao = _StaticBatch._create_vertex_array(self.__vbo, self.__ebo)
+        self.__groups: list = []
+        self.__index_quads: int = 0
 
-        self.__vao = _gl.glGenVertexArrays(1)
-        print(self.__vao)
-        _gl.glBindVertexArray(self.__vao)
+    @staticmethod
+    def _get_shader() -> Shader:
+        # Every batch of _STATIC_VERTEX quads is drawn with the same shader, so it's only compiled once.
+        if _StaticBatch.__shader is None:
+            _StaticBatch.__shader = Shader(_StaticBatch.__STATIC_VERT, _StaticBatch.__STATIC_FRAG)
+        return _StaticBatch.__shader
 
-        self.__vbo = _gl.glGenBuffers(1)
+    @staticmethod
+    def _create_vertex_array(vbo, ebo) -> int:
+        # Create a vertex array that reads _STATIC_VERTEX quads from the given buffers.
+        shader = _StaticBatch._get_shader()
+        vao = _gl.glGenVertexArrays(1)
+        RenderState._bind_vertex_array(vao)
+        _gl.glBindBuffer(_gl.GL_ARRAY_BUFFER, vbo)
+        _gl.glBindBuffer(_gl.GL_ELEMENT_ARRAY_BUFFER, ebo)
+        stride = _STATIC_VERTEX.itemsize
+        for name, attribute, size, gl_type, normalized in (("aPosition", "position", 2, _gl.GL_FLOAT, _gl.GL_FALSE),
+                                                          ("aTexCoords", "texture_coordinates", 2, _gl.GL_FLOAT, _gl.GL_FALSE),
+                                                          ("aColor", "color", 4, _gl.GL_UNSIGNED_BYTE, _gl.GL_TRUE)):
+            location = shader._get_attrib_location(name)
+            _gl.glEnableVertexAttribArray(location)
+            _gl.glVertexAttribPointer(location, size, gl_type, normalized, stride,
+                                      _ctypes.c_void_p(_STATIC_VERTEX.fields[attribute][1]))
+        RenderState._bind_vertex_array(0)
+        return vao
+
+    @staticmethod
+    def _use_shader(transform_matrix: Matrix):
+        # Get ready to draw _STATIC_VERTEX quads with the given transformation.
+        _StaticBatch._get_shader()._use()
+        FrameUniforms._set_view(transform_matrix)
+        RenderState._set_alpha_blend()
+
+    def build(self, sprites):
+        # Group the sprites by the texture they draw from, keeping the order they were given in.
+        groups: dict = {}
+        for sprite in sprites:
+            texture = sprite.texture.texture if isinstance(sprite.texture, TextureRegion) else sprite.texture
+            groups.setdefault(texture, []).append(sprite)
+        self.build_vertices([(texture, _static_vertices(group)) for texture, group in groups.items()])
+
+    def build_vertices(self, groups: list, usage=_gl.GL_STATIC_DRAW):
+        # Build from a list of (Texture, vertices) pairs, where the vertices are _STATIC_VERTEX quads as made by
+        # _quad_vertices(). Use GL_STREAM_DRAW for vertices that are rebuilt every frame.
+        self.__groups = []
+        quads = 0
+        for texture, vertices in groups:
+            self.__groups.append((texture, quads, len(vertices) // 4))
+            quads += len(vertices) // 4
+        if quads == 0:
+            return
+        vertices = _np.concatenate([vertices for _, vertices in groups]) if len(groups) > 1 else groups[0][1]
+        RenderState._bind_vertex_array(self.__vao)
+        # The array buffer binding isn't part of the vertex array, so it has to be bound again.
         _gl.glBindBuffer(_gl.GL_ARRAY_BUFFER, self.__vbo)
-        _gl.glBufferData(_gl.GL_ARRAY_BUFFER, len(SpriteDrawer.__VERTICES),
-                         (_gl.GLfloat*len(SpriteDrawer.__VERTICES))(*SpriteDrawer.__VERTICES), _gl.GL_STATIC_DRAW)
+        _gl.glBufferData(_gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices, usage)
+        if quads > self.__index_quads:
+            # The indices only depend on the number of quads, so they only need to grow.
+            indices = (_np.array((0, 1, 2, 1, 3, 2), _np.uint32)[None, :] +
+                       _np.arange(0, quads * 4, 4, dtype=_np.uint32)[:, None]).reshape(-1)
+            _gl.glBufferData(_gl.GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, _gl.GL_STATIC_DRAW)
+            self.__index_quads = quads
+        RenderState._bind_vertex_array(0)
+
+    def draw(self, transform_matrix: Matrix):
+        if not self.__groups:
+            return
+        _StaticBatch._use_shader(transform_matrix)
+        RenderState._bind_vertex_array(self.__vao)
+        for texture, first, count in self.__groups:
+            texture._bind()
+            _gl.glDrawElements(_gl.GL_TRIANGLES, count * 6, _gl.GL_UNSIGNED_INT, _ctypes.c_void_p(first * 6 * 4))
+
+    def dispose(self):
+        _gl.glDeleteBuffers(2, [self.__vbo, self.__ebo])
+        RenderState._forget_vertex_array(self.__vao)
+        _gl.glDeleteVertexArrays(1, [self.__vao])
+
+
+class _StreamingBatch:
+    # Collects quads on the CPU and draws them in as few draw calls as possible, like MonoGame's SpriteBatch. The quads
+    # are flushed to the GPU when the texture changes, when the batch is full, and at the end of drawing. Uploads cycle
+    # through a ring of buffers, and each one is orphaned before it's refilled, so the GPU never has to finish drawing
+    # from a buffer before it can be written to again.
+
+    MAX_QUADS = 2048
+    __RING_SIZE = 3
+
+    def __init__(self):
+        # Each quad is (x, y, origin x, origin y, scale x, scale y, rotation, width, height, left, top, right, bottom).
+        self.__quads = _np.empty((_StreamingBatch.MAX_QUADS, 13), _np.float32)
+        self.__colors = _np.empty(_StreamingBatch.MAX_QUADS, _np.uint32)
+        self.__vertices = _np.empty(_StreamingBatch.MAX_QUADS * 4, _STATIC_VERTEX)
+        self.__count: int = 0
+        self.__texture = None
+        self.__transform_matrix: Matrix = Matrix.identity()
+        self.draw_calls: int = 0
 
         self.__ebo = _gl.glGenBuffers(1)
+        indices = (_np.array((0, 1, 2, 1, 3, 2), _np.uint32)[None, :] +
+                   _np.arange(0, _StreamingBatch.MAX_QUADS * 4, 4, dtype=_np.uint32)[:, None]).reshape(-1)
+        # The element buffer binding belongs to the bound vertex array, so make sure none is bound.
+        RenderState._bind_vertex_array(0)
         _gl.glBindBuffer(_gl.GL_ELEMENT_ARRAY_BUFFER, self.__ebo)
-        _gl.glBufferData(_gl.GL_ELEMENT_ARRAY_BUFFER, len(SpriteDrawer.__INDICES),
-                         (_gl.GLuint*len(SpriteDrawer.__INDICES))(*SpriteDrawer.__INDICES), _gl.GL_STATIC_DRAW)
+        _gl.glBufferData(_gl.GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, _gl.GL_STATIC_DRAW)
+        self.__buffer_size = _StreamingBatch.MAX_QUADS * 4 * _STATIC_VERTEX.itemsize
+        self.__ring = []
+        for _ in range(_StreamingBatch.__RING_SIZE):
+            vbo = _gl.glGenBuffers(1)
+            _gl.glBindBuffer(_gl.GL_ARRAY_BUFFER, vbo)
+            _gl.glBufferData(_gl.GL_ARRAY_BUFFER, self.__buffer_size, None, _gl.GL_STREAM_DRAW)
+            self.__ring.append((_StaticBatch._create_vertex_array(vbo, self.__ebo), vbo))
+        self.__ring_index: int = 0
+
+    def begin(self, transform_matrix: Matrix):
+        self.__transform_matrix = transform_matrix
+        self.draw_calls = 0
+
+    def add(self, texture, quad: tuple, color: int):
+        # Add a quad drawn from the given texture (a Texture, not a region; the region is in the quad's values).
+        if texture is not self.__texture or self.__count == _StreamingBatch.MAX_QUADS:
+            self.flush()
+            self.__texture = texture
+        self.__quads[self.__count] = quad
+        self.__colors[self.__count] = color
+        self.__count += 1
+
+    def flush(self):
+        count = self.__count
+        if count == 0:
+            return
+        quads = self.__quads[:count]
+        vertices = self.__vertices[:count * 4]
+        _write_quad_vertices(vertices, quads[:, 0:2], quads[:, 2:4], quads[:, 4:6], quads[:, 6], quads[:, 7:9],
+                             quads[:, 9:13], self.__colors[:count])
+        vao, vbo = self.__ring[self.__ring_index]
+        self.__ring_index = (self.__ring_index + 1) % _StreamingBatch.__RING_SIZE
+        _gl.glBindBuffer(_gl.GL_ARRAY_BUFFER, vbo)
+        # Orphan the buffer: the driver hands back fresh memory if the GPU is still reading the old contents.
+        _gl.glBufferData(_gl.GL_ARRAY_BUFFER, self.__buffer_size, None, _gl.GL_STREAM_DRAW)
+        _gl.glBufferSubData(_gl.GL_ARRAY_BUFFER, 0, vertices.nbytes, vertices)
+        _StaticBatch._use_shader(self.__transform_matrix)
+        self.__texture._bind()
+        RenderState._bind_vertex_array(vao)
+        _gl.glDrawElements(_gl.GL_TRIANGLES, count * 6, _gl.GL_UNSIGNED_INT, None)
+        self.draw_calls += 1
+        self.__count = 0
 
-        self.__shader = Shader(SpriteDrawer.__SPRITE_VERT, SpriteDrawer.__SPRITE_FRAG)
-        self.__shader._use()
+    def dispose(self):
+        for vao, vbo in self.__ring:
+            RenderState._forget_vertex_array(vao)
+            _gl.glDeleteVertexArrays(1, [vao])
+            _gl.glDeleteBuffers(1, [vbo])
+        _gl.glDeleteBuffers(1, [self.__ebo])
 
-        vertex_location = self.__shader._get_attrib_location("aPosition")
-        _gl.glEnableVertexAttribArray(vertex_location)
-        _gl.glVertexAttribPointer(vertex_location, 2, _gl.GL_FLOAT, _gl.GL_FALSE, 4 * 24, 0)
 
-        #ex_coords_location = self.__shader._get_attrib_location("aTexCoords")
-        #_gl.glEnableVertexAttribArray(tex_coords_location)
-        #_gl.glVertexAttribPointer(vertex_location, 2, _gl.GL_FLOAT, _gl.GL_FALSE, 4 * _sys.getsizeof(float),
-        #                          2 * _sys.getsizeof(float))
+# The per-sprite data instanced sprites are drawn with. The model is the 2D affine matrix (m11, m12, m21, m22, m41,
+# m42) that places the unit quad; see _instances().
+_INSTANCE = _np.dtype([("model", _np.float32, 6), ("color", _np.uint8, 4), ("uv_rect", _np.float32, 4)])
+
+
+class _InstanceBatch:
+    # Draws many sprites with instancing: every sprite is the same unit quad, which is stored once, and each one's
+    # transform, tint and texture coordinates go into a per-instance buffer. All the sprites sharing a texture are then
+    # drawn with a single glDrawElementsInstanced call.
+
+    __INSTANCE_VERT = """
+    #version 330 core
+    """ + FrameUniforms.GLSL + """
+
+    in vec2 aCorner;
+    in vec4 aModel;
+    in vec2 aTranslation;
+    in vec4 aColor;
+    in vec4 aUVRect;
+
+    out vec2 frag_texCoords;
+    out vec4 frag_color;
+
+    void main()
+    {
+        vec2 position = vec2(aCorner.x * aModel.x + aCorner.y * aModel.z, aCorner.x * aModel.y + aCorner.y * aModel.w)
+                        + aTranslation;
+        gl_Position = uProjection * uView * vec4(position, 0.0, 1.0);
+        frag_texCoords = mix(aUVRect.xy, aUVRect.zw, aCorner);
+        frag_color = aColor;
+    }"""
+
+    __INSTANCE_FRAG = """
+    #version 330 core
+
+    in vec2 frag_texCoords;
+    in vec4 frag_color;
+
+    out vec4 out_color;
+
+    uniform sampler2D uTexture;
+
+    void main()
+    {
+        out_color = texture(uTexture, frag_texCoords) * frag_color;
+    }"""
+
+    def __init__(self):
+        self.__shader = Shader(_InstanceBatch.__INSTANCE_VERT, _InstanceBatch.__INSTANCE_FRAG)
+        self.__vao = _gl.glGenVertexArrays(1)
+        self.__quad_vbo, self.__ebo, self.__instance_vbo = _gl.glGenBuffers(3)
+        self.__instance_capacity: int = 0
+        RenderState._bind_vertex_array(self.__vao)
+
+        corners = _np.array((0, 0, 1, 0, 0, 1, 1, 1), _np.float32)
+        _gl.glBindBuffer(_gl.GL_ARRAY_BUFFER, self.__quad_vbo)
+        _gl.glBufferData(_gl.GL_ARRAY_BUFFER, corners.nbytes, corners, _gl.GL_STATIC_DRAW)
+        location = self.__shader._get_attrib_location("aCorner")
+        _gl.glEnableVertexAttribArray(location)
+        _gl.glVertexAttribPointer(location, 2, _gl.GL_FLOAT, _gl.GL_FALSE, 0, _ctypes.c_void_p(0))
+
+        indices = _np.array((0, 1, 2, 1, 3, 2), _np.uint32)
+        _gl.glBindBuffer(_gl.GL_ELEMENT_ARRAY_BUFFER, self.__ebo)
+        _gl.glBufferData(_gl.GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, _gl.GL_STATIC_DRAW)
+
+        _gl.glBindBuffer(_gl.GL_ARRAY_BUFFER, self.__instance_vbo)
+        model_offset, color_offset, uv_offset = (_INSTANCE.fields[name][1] for name in ("model", "color", "uv_rect"))
+        self.__instance_attributes = []
+        for name, size, gl_type, normalized, offset in (("aModel", 4, _gl.GL_FLOAT, _gl.GL_FALSE, model_offset),
+                                                        ("aTranslation", 2, _gl.GL_FLOAT, _gl.GL_FALSE, model_offset + 16),
+                                                        ("aColor", 4, _gl.GL_UNSIGNED_BYTE, _gl.GL_TRUE, color_offset),
+                                                        ("aUVRect", 4, _gl.GL_FLOAT, _gl.GL_FALSE, uv_offset)):
+            location = self.__shader._get_attrib_location(name)
+            _gl.glEnableVertexAttribArray(location)
+            # Move on to the next instance's values once per quad, rather than once per vertex.
+            _gl.glVertexAttribDivisor(location, 1)
+            self.__instance_attributes.append((location, size, gl_type, normalized, offset))
+        self.__point_instances(0)
+        RenderState._bind_vertex_array(0)
+
+    def __point_instances(self, first: int):
+        # Point the instance attributes at the given instance. OpenGL 3.3 has no base instance for instanced draws, so
+        # this is how each texture's group of instances is picked out of the shared buffer.
+        for location, size, gl_type, normalized, offset in self.__instance_attributes:
+            _gl.glVertexAttribPointer(location, size, gl_type, normalized, _INSTANCE.itemsize,
+                                      _ctypes.c_void_p(first * _INSTANCE.itemsize + offset))
+
+    def draw(self, groups: list, transform_matrix: Matrix):
+        # Draw a list of (Texture, instances) pairs, where the instances are _INSTANCE values as made by _instances().
+        count = sum(len(instances) for _, instances in groups)
+        if count == 0:
+            return
+        instances = _np.concatenate([instances for _, instances in groups]) if len(groups) > 1 else groups[0][1]
+        RenderState._bind_vertex_array(self.__vao)
+        _gl.glBindBuffer(_gl.GL_ARRAY_BUFFER, self.__instance_vbo)
+        if count > self.__instance_capacity:
+            self.__instance_capacity = max(count, self.__instance_capacity * 2)
+            _gl.glBufferData(_gl.GL_ARRAY_BUFFER, self.__instance_capacity * _INSTANCE.itemsize, None,
+                             _gl.GL_STREAM_DRAW)
+        _gl.glBufferSubData(_gl.GL_ARRAY_BUFFER, 0, instances.nbytes, instances)
 
-    def draw(self, texture):
-        texture._bind()
         self.__shader._use()
+        FrameUniforms._set_view(transform_matrix)
+        RenderState._set_alpha_blend()
+        first = 0
+        for texture, group in groups:
+            if len(group) == 0:
+                continue
+            texture._bind()
+            if first != 0:
+                self.__point_instances(first)
+            _gl.glDrawElementsInstanced(_gl.GL_TRIANGLES, 6, _gl.GL_UNSIGNED_INT, None, len(group))
+            first += len(group)
+        if first != len(groups[0][1]):
+            self.__point_instances(0)
+
+    def dispose(self):
+        _gl.glDeleteBuffers(3, [self.__quad_vbo, self.__ebo, self.__instance_vbo])
+        RenderState._forget_vertex_array(self.__vao)
+        _gl.glDeleteVertexArrays(1, [self.__vao])
+        self.__shader.dispose()
+
+
+def _instances(positions, origins, scales, rotations, sizes, uv_rects, colors):
+    # Build the instance values of many sprites at once. Every argument is an array with one row per sprite; the
+    # uv_rects are (left, top, right, bottom) and the colors are packed (see Color.packed_value).
+    # The model matrix takes a corner of the unit quad to its place in the world: the corner is scaled to the size of
+    # the texture, offset by the origin, scaled, rotated, then moved to the position.
+    count = len(positions)
+    instances = _np.empty(count, _INSTANCE)
+    cos, sin = _np.cos(rotations), _np.sin(rotations)
+    width, height = sizes[:, 0] * scales[:, 0], sizes[:, 1] * scales[:, 1]
+    left, top = -origins[:, 0] * scales[:, 0], -origins[:, 1] * scales[:, 1]
+    model = instances["model"]
+    model[:, 0] = width * cos
+    model[:, 1] = width * sin
+    model[:, 2] = -height * sin
+    model[:, 3] = height * cos
+    model[:, 4] = left * cos - top * sin + positions[:, 0]
+    model[:, 5] = left * sin + top * cos + positions[:, 1]
+    instances["color"] = _np.ascontiguousarray(colors, _np.uint32).view(_np.uint8).reshape(count, 4)
+    instances["uv_rect"] = uv_rects
+    return instances
+
+
+def _static_vertices(sprites):
+    # Build the quads of the given sprites.
+    count = len(sprites)
+    values = _np.empty((count, 13), _np.float32)
+    colors = _np.empty(count, _np.uint32)
+    for i, sprite in enumerate(sprites):
+        texture = sprite.texture
+        size = texture.size
+        values[i] = (sprite.position.x, sprite.position.y, sprite.origin.x, sprite.origin.y, sprite.scale.x,
+                     sprite.scale.y, sprite.rotation, size.width, size.height, *texture._uv_rect)
+        colors[i] = sprite.color.packed_value
+    return _quad_vertices(values[:, 0:2], values[:, 2:4], values[:, 4:6], values[:, 6], values[:, 7:9],
+                          values[:, 9:13], colors)
+
+
+def _quad_vertices(positions, origins, scales, rotations, sizes, uv_rects, colors):
+    # Build the vertices of many quads at once into a new array. See _write_quad_vertices().
+    vertices = _np.empty(len(positions) * 4, _STATIC_VERTEX)
+    _write_quad_vertices(vertices, positions, origins, scales, rotations, sizes, uv_rects, colors)
+    return vertices
+
+
+def _write_quad_vertices(vertices, positions, origins, scales, rotations, sizes, uv_rects, colors):
+    # Write the four corners (top left, top right, bottom left, bottom right) of many quads straight into the given
+    # _STATIC_VERTEX array, which must have room for 4 vertices per quad: each texture is offset by its origin, scaled,
+    # rotated, then moved to its position. Every argument is an array with one row per quad; the uv_rects are
+    # (left, top, right, bottom) and the colors are packed (see Color.packed_value).
+    # Every value is written through a float (or, for the colors, integer) view of the vertices, with the out argument
+    # of each NumPy operation, so the only temporary arrays are a few columns; the vertices can then be handed
+    # straight to glBufferSubData.
+    count = len(positions)
+    floats = vertices[:count * 4].view(_np.float32).reshape(count, 4, 5)
+    integers = vertices[:count * 4].view(_np.uint32).reshape(count, 4, 5)
+
+    cos, sin = _np.cos(rotations), _np.sin(rotations)
+    # The edges of the quad before it's rotated, relative to its position.
+    left = -origins[:, 0] * scales[:, 0]
+    top = -origins[:, 1] * scales[:, 1]
+    right = left + sizes[:, 0] * scales[:, 0]
+    bottom = top + sizes[:, 1] * scales[:, 1]
+    left_cos, right_cos, left_sin, right_sin = left * cos, right * cos, left * sin, right * sin
+    top_cos, bottom_cos, top_sin, bottom_sin = top * cos, bottom * cos, top * sin, bottom * sin
+
+    x, y = positions[:, 0], positions[:, 1]
+    for corner, (x_cos, y_sin, x_sin, y_cos) in enumerate(((left_cos, top_sin, left_sin, top_cos),
+                                                            (right_cos, top_sin, right_sin, top_cos),
+                                                            (left_cos, bottom_sin, left_sin, bottom_cos),
+                                                            (right_cos, bottom_sin, right_sin, bottom_cos))):
+        _np.subtract(x_cos, y_sin, out=floats[:, corner, 0])
+        floats[:, corner, 0] += x
+        _np.add(x_sin, y_cos, out=floats[:, corner, 1])
+        floats[:, corner, 1] += y
+    floats[:, 0::2, 2] = uv_rects[:, 0:1]
+    floats[:, 1::2, 2] = uv_rects[:, 2:3]
+    floats[:, 0:2, 3] = uv_rects[:, 1:2]
+    floats[:, 2:4, 3] = uv_rects[:, 3:4]
+    integers[:, :, 4] = colors[:, None]
+
+
+def _packed_array(data, dtype, length: int = None, name: str = None):
+    # Flattens the given data into a contiguous array. If the data is already a contiguous array of the right type,
+    # no copy is made.
+    if data is None:
+        return None
+    if isinstance(data, Vector2Array):
+        data = data.to_interleaved()
+    array = _np.ascontiguousarray(data, dtype=dtype).reshape(-1)
+    if length is not None and len(array) != length:
+        raise ValueError(f"Expected {length} values for '{name}', got {len(array)} instead.")
+    return array
+
+
+def _mesh_indices(indices, vertex_count: int) -> _np.ndarray:
+    # Flattens the given indices into an array of 32 bit indices, checking that they all refer to a vertex first.
+    indices = _packed_array(indices, _np.int64)
+    if len(indices) and (indices.min() < 0 or indices.max() >= vertex_count):
+        raise IndexError("An index is out of range of the vertices.")
+    return indices.astype(_np.uint32)
+
+
+def _changed_range(changed: tuple, start: int, end: int) -> tuple:
+    # Grow the (start, end) range of changed elements to cover another range. None means nothing has changed.
+    if changed is None:
+        return start, end
+    return min(changed[0], start), max(changed[1], end)
+
+
+class PixelMode(_enum):
+    """Set the pixel mode for the SpriteDrawer to draw with."""
+    Linear = 0
+    Clamp = 1
+
+
+class SpriteDrawer:
+    __STATIC_CHUNK_SIZE = 1024
+
+    def __init__(self):
+        self.__statics: dict = {}
+        # Statics are compiled in chunks of the world, so that only the chunks on screen are drawn, and adding or
+        # removing a static only rebuilds the chunk it's in.
+        self.__static_index = SpatialIndex()
+        self.__static_chunks: dict = {}
+        self.__chunk_statics: dict = {}
+        self.__chunk_of_static: dict = {}
+        self.__chunk_index = SpatialIndex(SpriteDrawer.__STATIC_CHUNK_SIZE)
+        self.__changed_chunks: set = set()
+        self.__instance_batch = None
+
+        self.__batch = _StreamingBatch()
+        self.__begin: bool = False
+        self.__transform_matrix: Matrix = Matrix.identity()
+        # A sampler for each PixelMode. Samplers override the filtering of whatever texture is bound.
+        self.__samplers = {}
+        for pixel_mode, gl_filter in ((PixelMode.Linear, _gl.GL_LINEAR), (PixelMode.Clamp, _gl.GL_NEAREST)):
+            sampler = _gl.glGenSamplers(1)
+            _gl.glSamplerParameteri(sampler, _gl.GL_TEXTURE_MIN_FILTER, gl_filter)
+            _gl.glSamplerParameteri(sampler, _gl.GL_TEXTURE_MAG_FILTER, gl_filter)
+            _gl.glSamplerParameteri(sampler, _gl.GL_TEXTURE_WRAP_S, _gl.GL_CLAMP_TO_EDGE)
+            _gl.glSamplerParameteri(sampler, _gl.GL_TEXTURE_WRAP_T, _gl.GL_CLAMP_TO_EDGE)
+            self.__samplers[pixel_mode] = sampler
+
+    @property
+    def draw_calls(self) -> int:
+        """
+        Get how many draw calls the textures drawn since start() have taken so far. Drawing from fewer textures (for
+        example with an AtlasBuilder) brings this down.
+
+        :return: The number of draw calls.
+        """
+        return self.__batch.draw_calls
+
+    def start(self, transform_matrix: Matrix = Matrix.identity(), pixel_mode: PixelMode = PixelMode.Linear):
+        """
+        Start drawing. Everything drawn with draw_texture() and draw_sprite() is collected and drawn in as few draw
+        calls as possible, so end() must be called for it all to show up.
 
-        _gl.glBindVertexArray(self.__vao)
+        :param transform_matrix: The transformation (usually the camera) to draw with.
+        :param pixel_mode: The pixel mode to draw with.
+        """
+        if self.__begin:
+            raise DrawError("You must call 'end()' first, before you can call 'start()' again.")
+        self.__begin = True
+        self.__transform_matrix = transform_matrix
+        self.__batch.begin(transform_matrix)
+        RenderState._bind_sampler(0, self.__samplers[pixel_mode])
+
+    def end(self):
+        if not self.__begin:
+            raise DrawError("You must call 'start()' before you can call 'end()'.")
+        self.__batch.flush()
+        RenderState._bind_sampler(0, 0)
+        self.__begin = False
+
+    def draw_texture(self, texture, position: Vector2, color: Color = Colors.WHITE, origin: Vector2 = Vector2.zero(),
+                     scale: Vector2 = Vector2.one(), rotation: float = 0, flipped: bool = False):
+        """
+        Draw a Texture, or a TextureRegion.
+
+        :param texture: The Texture or TextureRegion to draw.
+        :param position: The position to draw at.
+        :param color: The color to tint the texture with.
+        :param origin: The point on the texture, in pixels, that is placed at the position, and rotated around.
+        :param scale: The scale to draw at.
+        :param rotation: The rotation in radians.
+        :param flipped: If true, the texture is drawn flipped horizontally.
+        """
+        if not self.__begin:
+            raise DrawError("You must call 'start()' before you can draw to the screen.")
+        size = texture.size
+        left, top, right, bottom = texture._uv_rect
+        if flipped:
+            left, right = right, left
+        self.__batch.add(texture.texture if isinstance(texture, TextureRegion) else texture,
+                         (position.x, position.y, origin.x, origin.y, scale.x, scale.y, rotation, size.width,
+                          size.height, left, top, right, bottom), color.packed_value)
+
+    def draw_sprite(self, sprite: Sprite):
+        self.draw_texture(sprite.texture, sprite.position, sprite.color, sprite.origin, sprite.scale, sprite.rotation)
+
+    def draw_many(self, textures, positions, origins=None, scales=None, rotations=None, colors=None,
+                  texture_indices=None):
+        """
+        Draw many textures at once, with the transformation given to start() (if drawing has started). Each texture is
+        drawn as an instance of one shared quad, with its values built with NumPy and uploaded in one go, so every
+        texture sharing a page is drawn with a single draw call. Every array can be a list, a NumPy array,
+        or anything else NumPy can read, and the (x, y) pair arrays can also be Vector2Arrays. The textures are drawn
+        grouped by Texture (or atlas page).
+
+        :param textures: The Texture (or TextureRegion) to draw, or a list of them that texture_indices picks from.
+        :param positions: The positions to draw at, as packed (x, y) float pairs.
+        :param origins: The origins, as packed (x, y) float pairs. Defaults to (0, 0) for every texture.
+        :param scales: The scales, as packed (x, y) float pairs. Defaults to (1, 1) for every texture.
+        :param rotations: The rotations in radians, one float per texture. Defaults to 0.
+        :param colors: The colors, one packed 32-bit integer per texture (see Color.packed_value). Defaults to white.
+        :param texture_indices: The index into textures to draw for each position. Defaults to 0.
+        """
+        if isinstance(textures, (Texture, TextureRegion)):
+            textures = [textures]
+        positions = _packed_array(positions, _np.float32)
+        if len(positions) % 2 != 0:
+            raise ValueError("Positions must be given as (x, y) pairs.")
+        count = len(positions) // 2
+        if count == 0:
+            return
+        origins = _packed_array(origins, _np.float32, count * 2, "origins")
+        scales = _packed_array(scales, _np.float32, count * 2, "scales")
+        rotations = _packed_array(rotations, _np.float32, count, "rotations")
+        colors = _packed_array(colors, _np.uint32, count, "colors")
+        texture_indices = _packed_array(texture_indices, _np.int32, count, "texture_indices")
+        if texture_indices is not None and (texture_indices.min() < 0 or texture_indices.max() >= len(textures)):
+            raise IndexError("A texture index is out of range of the given textures.")
+
+        pages = [texture.texture if isinstance(texture, TextureRegion) else texture for texture in textures]
+        sizes = _np.array([(texture.size.width, texture.size.height) for texture in textures], _np.float32)
+        uv_rects = _np.array([texture._uv_rect for texture in textures], _np.float32)
+        indices = _np.zeros(count, _np.int32) if texture_indices is None else texture_indices
+        instances = _instances(positions.reshape(-1, 2),
+                               _np.zeros((count, 2), _np.float32) if origins is None else origins.reshape(-1, 2),
+                               _np.ones((count, 2), _np.float32) if scales is None else scales.reshape(-1, 2),
+                               _np.zeros(count, _np.float32) if rotations is None else rotations,
+                               sizes[indices], uv_rects[indices],
+                               _np.full(count, 0xFFFFFFFF, _np.uint32) if colors is None else colors)
+
+        groups = []
+        if len(textures) == 1:
+            groups.append((pages[0], instances))
+        else:
+            # Put the sprites of each page together, so each page is drawn with one instanced draw call.
+            page_indices = _np.array([pages.index(page) for page in pages], _np.int32)[indices]
+            order = _np.argsort(page_indices, kind="stable")
+            instances = instances[order]
+            page_counts = _np.bincount(page_indices, minlength=len(pages))
+            start = 0
+            for page, page_count in enumerate(page_counts):
+                if page_count:
+                    groups.append((pages[page], instances[start:start + page_count]))
+                    start += page_count
+
+        if self.__instance_batch is None:
+            self.__instance_batch = _InstanceBatch()
+        # Anything drawn before this has to be drawn first, so it ends up underneath.
+        self.__batch.flush()
+        self.__instance_batch.draw(groups, self.__transform_matrix if self.__begin else Matrix.identity())
+
+    @property
+    def static_index(self) -> SpatialIndex:
+        """
+        Get the SpatialIndex of the names of every static Sprite by its bounds, which can be used to find statics by
+        where they are (such as the one under the mouse) without checking all of them. It must not be changed directly.
+
+        :return: The SpatialIndex of the statics.
+        """
+        return self.__static_index
+
+    def add_static(self, sprite_name: str, sprite: Sprite):
+        """
+        Add a sprite that never changes. Statics are compiled into buffers that stay on the GPU, so they cost almost
+        nothing to draw, however many there are. If a static is changed after it's added, call update_statics().
+
+        :param sprite_name: The name of the static.
+        :param sprite: The sprite.
+        """
+        if sprite_name in self.__statics:
+            self.delete_static(sprite_name)
+        self.__statics[sprite_name] = sprite
+        bounds = sprite.bounds
+        self.__static_index.insert(sprite_name, bounds)
+        size = SpriteDrawer.__STATIC_CHUNK_SIZE
+        chunk = (_math.floor((bounds.x + bounds.width / 2) / size), _math.floor((bounds.y + bounds.height / 2) / size))
+        self.__chunk_statics.setdefault(chunk, {})[sprite_name] = sprite
+        self.__chunk_of_static[sprite_name] = chunk
+        self.__changed_chunks.add(chunk)
+
+    def get_static(self, sprite_name: str) -> Sprite:
+        return self.__statics[sprite_name]
+
+    def delete_static(self, sprite_name: str):
+        self.__statics.pop(sprite_name)
+        self.__static_index.remove(sprite_name)
+        chunk = self.__chunk_of_static.pop(sprite_name)
+        self.__chunk_statics[chunk].pop(sprite_name)
+        self.__changed_chunks.add(chunk)
+
+    def update_statics(self):
+        """
+        Rebuild the static buffers on the next draw_statics(). Only needed if a static was changed after being added.
+        """
+        statics = list(self.__statics.items())
+        for sprite_name, _ in statics:
+            self.delete_static(sprite_name)
+        for sprite_name, sprite in statics:
+            self.add_static(sprite_name, sprite)
+
+    def draw_statics(self, transform_matrix: Matrix = Matrix.identity()):
+        """
+        Draw every static sprite that is on screen. Statics are drawn grouped by texture, so where statics using
+        different textures overlap, the texture added first is drawn underneath.
+
+        :param transform_matrix: The transformation (usually the camera) to draw the statics with.
+        """
+        if self.__begin:
+            raise DrawError("Static sprite drawing must occur seperately to regular sprite drawing.")
+        if self.__changed_chunks:
+            self.__build_chunks()
+        if self.__static_chunks:
+            for chunk in sorted(self.__chunk_index.query(_view_rectangle(transform_matrix))):
+                self.__static_chunks[chunk].draw(transform_matrix)
+
+    def __build_chunks(self):
+        for chunk in self.__changed_chunks:
+            statics = self.__chunk_statics.get(chunk)
+            if not statics:
+                # The chunk is now empty.
+                self.__chunk_statics.pop(chunk, None)
+                if chunk in self.__static_chunks:
+                    self.__static_chunks.pop(chunk).dispose()
+                    self.__chunk_index.remove(chunk)
+                continue
+            if chunk not in self.__static_chunks:
+                self.__static_chunks[chunk] = _StaticBatch()
+            self.__static_chunks[chunk].build(list(statics.values()))
+            # Statics are put into the chunk their center is in, but can stick out of it, so the chunk covers the
+            # bounds of all of them.
+            edges = [self.__static_index.get_bounds(name) for name in statics]
+            left, top = min(bounds.x for bounds in edges), min(bounds.y for bounds in edges)
+            bounds = Rectangle(left, top, max(bounds.right for bounds in edges) - left,
+                               max(bounds.bottom for bounds in edges) - top)
+            if chunk in self.__chunk_index:
+                self.__chunk_index.move(chunk, bounds)
+            else:
+                self.__chunk_index.insert(chunk, bounds)
+        self.__changed_chunks.clear()
+
+
+class Mesh(Disposable):
+    """A mesh of triangles, for drawing anything that isn't a rectangle of texture: trails, terrain strips, deformed
+    sprites or debug geometry. The vertices and indices are kept in NumPy arrays and uploaded once to buffers on the
+    GPU. Changing part of the mesh with set_vertices() or set_indices() only uploads the changed range again, on the
+    next draw, so meshes of thousands of vertices can be reshaped every frame and still be drawn in one call.
+
+    Draw the mesh with draw(), outside of SpriteDrawer.start() and end(), like SpriteDrawer.draw_statics()."""
+
+    __pixel = None
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        Get the number of vertices in the mesh.
+        """
+        return len(self.__vertices)
+
+    @property
+    def index_count(self) -> int:
+        """
+        Get the number of indices in the mesh, three per triangle.
+        """
+        return len(self.__indices)
+
+    @property
+    def positions(self) -> _np.ndarray:
+        """
+        Get a read only view of the vertex positions, as a NumPy array of shape (vertex_count, 2). Use set_vertices()
+        to change them.
+        """
+        view = self.__vertices["position"].view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def indices(self) -> _np.ndarray:
+        """
+        Get a read only view of the indices, as a NumPy array. Use set_indices() to change them.
+        """
+        view = self.__indices.view()
+        view.flags.writeable = False
+        return view
+
+    def __init__(self, positions, indices, texture_coordinates=None, colors=None):
+        """
+        Create a new Mesh. The number of vertices and indices is fixed, but draw() can draw fewer triangles than the
+        mesh holds, so a mesh that grows (like a trail) can be made at its biggest size.
+
+        :param positions: The position of each vertex, as an (x, y) array (shape (vertex_count, 2)) or a Vector2Array.
+        :param indices: The vertices of each triangle, three indices per triangle.
+        :param texture_coordinates: The (u, v) texture coordinates of each vertex, from 0 to 1 across the texture.
+        Defaults to (0, 0).
+        :param colors: The color each vertex is tinted with: either one Color for every vertex or one packed 32-bit
+        integer per vertex (see Color.packed_value). Defaults to white.
+        """
+        positions = _packed_array(positions, _np.float32)
+        if len(positions) == 0 or len(positions) % 2:
+            raise ValueError("A mesh needs at least one vertex, with an x and a y for each.")
+        self.__vertices = _np.zeros(len(positions) // 2, _STATIC_VERTEX)
+        self.__vertices["position"] = positions.reshape(-1, 2)
+        if texture_coordinates is not None:
+            self.__vertices["texture_coordinates"] = _packed_array(texture_coordinates, _np.float32,
+                                                                   self.vertex_count * 2,
+                                                                   "texture_coordinates").reshape(-1, 2)
+        if isinstance(colors, Color):
+            colors = colors.packed_value
+        elif colors is not None:
+            colors = _packed_array(colors, _np.uint32, self.vertex_count, "colors")
+        else:
+            colors = Colors.WHITE.packed_value
+        self.__vertices["color"].view(_np.uint32)[:, 0] = colors
+        self.__indices = _mesh_indices(indices, self.vertex_count)
+        if len(self.__indices) == 0 or len(self.__indices) % 3:
+            raise ValueError("A mesh needs at least one triangle, with three indices for each.")
+
+        self.__vbo = _gl.glGenBuffers(1)
+        self.__ebo = _gl.glGenBuffers(1)
+        self.__vao = _StaticBatch._create_vertex_array(self.__vbo, self.__ebo)
+        # Allocate the buffers at their full size once, so changes only ever update part of them.
+        RenderState._bind_vertex_array(self.__vao)
+        _gl.glBindBuffer(_gl.GL_ARRAY_BUFFER, self.__vbo)
+        _gl.glBufferData(_gl.GL_ARRAY_BUFFER, self.__vertices.nbytes, self.__vertices, _gl.GL_DYNAMIC_DRAW)
+        _gl.glBufferData(_gl.GL_ELEMENT_ARRAY_BUFFER, self.__indices.nbytes, self.__indices, _gl.GL_DYNAMIC_DRAW)
+        RenderState._bind_vertex_array(0)
+        self.__changed_vertices: tuple = None
+        self.__changed_indices: tuple = None
+        if Mesh.__pixel is None:
+            Mesh.__pixel = Texture.custom(1, 1)
+            Mesh.__pixel.set_pixels(b"\xff\xff\xff\xff")
+
+    def set_vertices(self, start: int, positions=None, texture_coordinates=None, colors=None):
+        """
+        Change a range of vertices. Only the given arrays are changed, and they must all be the same length. The range
+        is uploaded to the GPU on the next draw.
+
+        :param start: The index of the first vertex to change.
+        :param positions: The new (x, y) positions, or None to keep the current ones.
+        :param texture_coordinates: The new (u, v) texture coordinates, or None to keep the current ones.
+        :param colors: The new colors, one packed 32-bit integer per vertex (see Color.packed_value), or None to keep
+        the current ones.
+        """
+        positions = _packed_array(positions, _np.float32)
+        texture_coordinates = _packed_array(texture_coordinates, _np.float32)
+        colors = _packed_array(colors, _np.uint32)
+        counts = {len(array) // width for array, width in ((positions, 2), (texture_coordinates, 2), (colors, 1))
+                  if array is not None}
+        if len(counts) > 1:
+            raise ValueError("The positions, texture coordinates and colors must be for the same number of vertices.")
+        count = counts.pop() if counts else 0
+        if count == 0:
+            return
+        if start < 0 or start + count > self.vertex_count:
+            raise IndexError("The vertices go outside of the mesh.")
+        vertices = self.__vertices[start:start + count]
+        if positions is not None:
+            vertices["position"] = positions.reshape(-1, 2)
+        if texture_coordinates is not None:
+            vertices["texture_coordinates"] = texture_coordinates.reshape(-1, 2)
+        if colors is not None:
+            vertices["color"].view(_np.uint32)[:, 0] = colors
+        self.__changed_vertices = _changed_range(self.__changed_vertices, start, start + count)
+
+    def set_indices(self, start: int, indices):
+        """
+        Change a range of indices. The range is uploaded to the GPU on the next draw.
 
-        _gl.glDrawElements(_gl.GL_TRIANGLES, len(SpriteDrawer.__INDICES), _gl.GL_UNSIGNED_INT, 0)
+        :param start: The position of the first index to change.
+        :param indices: The new indices.
+        """
+        indices = _mesh_indices(indices, self.vertex_count)
+        if start < 0 or start + len(indices) > self.index_count:
+            raise IndexError("The indices go outside of the mesh.")
+        self.__indices[start:start + len(indices)] = indices
+        self.__changed_indices = _changed_range(self.__changed_indices, start, start + len(indices))
+
+    def draw(self, transform_matrix: Matrix = Matrix.identity(), texture=None, triangle_count: int = None):
+        """
+        Draw the mesh, uploading whatever has changed since it was last drawn first.
+
+        :param transform_matrix: The transformation (usually the camera) to draw the mesh with.
+        :param texture: The Texture or TextureRegion to draw the mesh with. The texture coordinates always cover the
+        whole Texture, so those of a TextureRegion are across its atlas page. Defaults to plain white, so the mesh is
+        drawn in its vertex colors.
+        :param triangle_count: The number of triangles to draw, from the start of the indices. Defaults to all of them.
+        """
+        RenderState._bind_vertex_array(self.__vao)
+        if self.__changed_vertices is not None:
+            first, end = self.__changed_vertices
+            _gl.glBindBuffer(_gl.GL_ARRAY_BUFFER, self.__vbo)
+            _gl.glBufferSubData(_gl.GL_ARRAY_BUFFER, first * _STATIC_VERTEX.itemsize,
+                                (end - first) * _STATIC_VERTEX.itemsize, self.__vertices[first:end])
+            self.__changed_vertices = None
+        if self.__changed_indices is not None:
+            first, end = self.__changed_indices
+            _gl.glBufferSubData(_gl.GL_ELEMENT_ARRAY_BUFFER, first * 4, (end - first) * 4, self.__indices[first:end])
+            self.__changed_indices = None
+
+        triangles = self.index_count // 3 if triangle_count is None else min(triangle_count, self.index_count // 3)
+        if triangles <= 0:
+            return
+        texture = Mesh.__pixel if texture is None else texture
+        texture = texture.texture if isinstance(texture, TextureRegion) else texture
+        _StaticBatch._use_shader(transform_matrix)
+        RenderState._bind_vertex_array(self.__vao)
+        texture._bind()
+        _gl.glDrawElements(_gl.GL_TRIANGLES, triangles * 3, _gl.GL_UNSIGNED_INT, None)
+
+    def dispose(self):
+        """
+        Free the buffers of the mesh. It can't be drawn afterwards.
+        """
+        _gl.glDeleteBuffers(2, [self.__vbo, self.__ebo])
+        RenderState._forget_vertex_array(self.__vao)
+        _gl.glDeleteVertexArrays(1, [self.__vao])
 
 
-class DrawError:
+class DrawError(Exception):
     pass
 
 
@@ -686,6 +3545,11 @@ class Game:
             raise Exception("GLFW window could not be initialized! (Is there something wrong with your GLFW installation?)")
 
         _glfw.window_hint(_glfw.VISIBLE, _glfw.FALSE)
+        # Instanced drawing and vertex arrays need a 3.3 core context. Forward compatibility is required on macOS.
+        _glfw.window_hint(_glfw.CONTEXT_VERSION_MAJOR, 3)
+        _glfw.window_hint(_glfw.CONTEXT_VERSION_MINOR, 3)
+        _glfw.window_hint(_glfw.OPENGL_PROFILE, _glfw.OPENGL_CORE_PROFILE)
+        _glfw.window_hint(_glfw.OPENGL_FORWARD_COMPAT, _glfw.TRUE)
         _glfw.window_hint(_glfw.RESIZABLE, _glfw.TRUE if self.__resizable else _glfw.FALSE)
         self.__window = _glfw.create_window(self.__width, self.__height, self.__title, None, None)
         _glfw.set_key_callback(self.__window, Input._key_callback)
@@ -715,8 +3579,11 @@ class Game:
         while not _glfw.window_should_close(self.__window):
             _glfw.poll_events()
             Input._update(self.__window)
+            Time._update()
+            TextureLoader._update()
 
             _gl.glClear(_gl.GL_COLOR_BUFFER_BIT)
+            FrameUniforms._begin_frame(_glfw.get_time())
 
             self.update()
             self.draw()
@@ -1071,4 +3938,22 @@ class Input:
 
 
 class Time:
-    pass
\ No newline at end of file
+    __frames = 0
+    __last_update = None
+    __delta_time = 0.0
+
+    @staticmethod
+    def delta_time() -> float:
+        return Time.__delta_time
+
+    @staticmethod
+    def total_frames() -> int:
+        return Time.__frames
+
+    @staticmethod
+    def _update():
+        now = _time.perf_counter()
+        if Time.__last_update is not None:
+            Time.__delta_time = now - Time.__last_update
+        Time.__last_update = now
+        Time.__frames += 1
\ No newline at end of file
@@ -0,0 +1,198 @@
+import _PGS as _p
+import numpy as _np
+import math as _math
+
+
+class TileMap:
+    """A grid of tiles, drawn from a tileset of Textures (or, ideally, TextureRegions of one atlas page). The tiles are
+    stored as a compact array of tileset indices, and the map is split into square chunks that are compiled into
+    StaticQuads on the GPU. Only the chunks on screen are drawn, and changing a tile only rebuilds the chunk it's in, so
+    maps of hundreds of thousands of tiles cost little more to draw than what fits on the screen.
+
+    Draw the map with draw(), outside of SpriteDrawer.start() and end(), like SpriteDrawer.draw_statics()."""
+
+    EMPTY = -1
+    """The tile index for no tile."""
+
+    @property
+    def width(self) -> int:
+        """
+        Get the width of the map, in tiles.
+        """
+        return self.__tiles.shape[1]
+
+    @property
+    def height(self) -> int:
+        """
+        Get the height of the map, in tiles.
+        """
+        return self.__tiles.shape[0]
+
+    @property
+    def tiles(self) -> _np.ndarray:
+        """
+        Get a read only view of the tile indices, as a NumPy array indexed by [y, x]. Use set_tile() or set_tiles() to
+        change them.
+        """
+        view = self.__tiles.view()
+        view.flags.writeable = False
+        return view
+
+    def __init__(self, tileset: list, width: int, height: int, tile_size: _p.Size,
+                 position: _p.Vector2 = _p.Vector2.zero(), chunk_size: int = 32):
+        """
+        Create a new, empty, TileMap.
+        :param tileset: The Textures or TextureRegions that the tile indices refer to. Each tile is stretched to fit the
+        tile size.
+        :param width: The width of the map, in tiles.
+        :param height: The height of the map, in tiles.
+        :param tile_size: The size of each tile in the world.
+        :param position: The position of the top left corner of the map in the world.
+        :param chunk_size: The width and height of each chunk, in tiles.
+        """
+        if len(tileset) > _np.iinfo(_np.int16).max:
+            raise ValueError(f"A tileset can have at most {_np.iinfo(_np.int16).max} tiles.")
+        self.tileset: list = tileset
+        self.tile_size: _p.Size = tile_size
+        self.position: _p.Vector2 = position.copy()
+        self.chunk_size: int = chunk_size
+        self.__tiles = _np.full((height, width), TileMap.EMPTY, _np.int16)
+        self.__chunks: dict = {}
+        self.__changed_chunks: set = set()
+        self.__tileset_table = None
+
+    def get_tile(self, x: int, y: int) -> int:
+        """
+        Get the tile index at the given tile coordinates.
+        :param x: The x-coordinate of the tile.
+        :param y: The y-coordinate of the tile.
+        :return: The tile index, or TileMap.EMPTY.
+        """
+        return int(self.__tiles[y, x])
+
+    def set_tile(self, x: int, y: int, tile: int):
+        """
+        Set the tile index at the given tile coordinates.
+        :param x: The x-coordinate of the tile.
+        :param y: The y-coordinate of the tile.
+        :param tile: The tile index, or TileMap.EMPTY to remove the tile.
+        """
+        if not 0 <= x < self.width or not 0 <= y < self.height:
+            raise IndexError("The tile coordinates are outside of the map.")
+        if tile < TileMap.EMPTY or tile >= len(self.tileset):
+            raise IndexError("The tile index is out of range of the tileset.")
+        if self.__tiles[y, x] != tile:
+            self.__tiles[y, x] = tile
+            self.__changed_chunks.add((x // self.chunk_size, y // self.chunk_size))
+
+    def set_tiles(self, x: int, y: int, tiles):
+        """
+        Set a block of tile indices at once.
+        :param x: The x-coordinate of the top left tile of the block.
+        :param y: The y-coordinate of the top left tile of the block.
+        :param tiles: The tile indices, as anything NumPy can turn into a 2D array indexed by [y, x].
+        """
+        tiles = _np.asarray(tiles, _np.int16)
+        if tiles.ndim != 2:
+            raise ValueError("The tiles must be a 2D array.")
+        height, width = tiles.shape
+        if x < 0 or y < 0 or x + width > self.width or y + height > self.height:
+            raise IndexError("The block of tiles goes outside of the map.")
+        if tiles.size and (tiles.min() < TileMap.EMPTY or tiles.max() >= len(self.tileset)):
+            raise IndexError("A tile index is out of range of the tileset.")
+        self.__tiles[y:y + height, x:x + width] = tiles
+        size = self.chunk_size
+        for chunk_y in range(y // size, (y + height - 1) // size + 1):
+            for chunk_x in range(x // size, (x + width - 1) // size + 1):
+                self.__changed_chunks.add((chunk_x, chunk_y))
+
+    def tile_at(self, position: _p.Vector2) -> tuple:
+        """
+        Get the coordinates of the tile under the given point in the world.
+        :param position: The point in the world.
+        :return: The (x, y) tile coordinates, or None if the point is outside of the map.
+        """
+        x = _math.floor((position.x - self.position.x) / self.tile_size.width)
+        y = _math.floor((position.y - self.position.y) / self.tile_size.height)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return x, y
+        return None
+
+    def update_tileset(self):
+        """
+        Rebuild every chunk. Call this after changing the tileset, the tile size or the position of the map.
+        """
+        self.__tileset_table = None
+        for chunk in self.__chunks.values():
+            chunk.dispose()
+        self.__chunks.clear()
+        self.__changed_chunks.clear()
+
+    def draw(self, transform_matrix: _p.Matrix = _p.Matrix.identity(), pixel_mode: _p.PixelMode = _p.PixelMode.Linear):
+        """
+        Draw the chunks of the map that are on screen.
+        :param transform_matrix: The transformation (usually the camera) to draw the map with.
+        :param pixel_mode: The pixel mode to draw with. PixelMode.Clamp stops gaps showing between tiles when zoomed.
+        """
+        view = _p.StaticQuads.visible_area(transform_matrix)
+        size = self.chunk_size
+        chunk_width, chunk_height = self.tile_size.width * size, self.tile_size.height * size
+        first_x = max(_math.floor((view.x - self.position.x) / chunk_width), 0)
+        first_y = max(_math.floor((view.y - self.position.y) / chunk_height), 0)
+        last_x = min(_math.floor((view.x + view.width - self.position.x) / chunk_width), (self.width - 1) // size)
+        last_y = min(_math.floor((view.y + view.height - self.position.y) / chunk_height), (self.height - 1) // size)
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = (chunk_x, chunk_y)
+                # Chunks are only built once they're first seen, so a huge map doesn't have to be built all at once.
+                if chunk in self.__changed_chunks or chunk not in self.__chunks:
+                    self.__build_chunk(chunk)
+                self.__chunks[chunk].draw(transform_matrix, pixel_mode)
+
+    def dispose(self):
+        """
+        Free the buffers of every chunk.
+        """
+        self.update_tileset()
+
+    def __build_chunk(self, chunk: tuple):
+        if self.__tileset_table is None:
+            self.__tileset_table = self.__build_tileset_table()
+        pages, page_of_tile, source_of_tile = self.__tileset_table
+        size = self.chunk_size
+        first_x, first_y = chunk[0] * size, chunk[1] * size
+        tiles = self.__tiles[first_y:first_y + size, first_x:first_x + size]
+        ys, xs = _np.nonzero(tiles != TileMap.EMPTY)
+        tiles = tiles[ys, xs]
+
+        groups = []
+        for page_index, page in enumerate(pages):
+            on_page = page_of_tile[tiles] == page_index
+            count = int(on_page.sum())
+            if count == 0:
+                continue
+            rectangles = _np.empty((count, 4), _np.float32)
+            rectangles[:, 0] = self.position.x + (first_x + xs[on_page]) * self.tile_size.width
+            rectangles[:, 1] = self.position.y + (first_y + ys[on_page]) * self.tile_size.height
+            rectangles[:, 2:] = (self.tile_size.width, self.tile_size.height)
+            groups.append((page, rectangles, source_of_tile[tiles[on_page]]))
+
+        if chunk not in self.__chunks:
+            self.__chunks[chunk] = _p.StaticQuads()
+        self.__chunks[chunk].set_quads(groups)
+        self.__changed_chunks.discard(chunk)
+
+    def __build_tileset_table(self) -> tuple:
+        # Work out, once, which page Texture each tile is on, and the part of that page the tile shows.
+        pages = []
+        page_of_tile = _np.zeros(len(self.tileset), _np.int32)
+        source_of_tile = _np.zeros((len(self.tileset), 4), _np.float32)
+        for i, tile in enumerate(self.tileset):
+            page = tile.texture if isinstance(tile, _p.TextureRegion) else tile
+            if page not in pages:
+                pages.append(page)
+            page_of_tile[i] = pages.index(page)
+            source = tile.source if isinstance(tile, _p.TextureRegion) else _p.Rectangle(0, 0, page.size.width,
+                                                                                          page.size.height)
+            source_of_tile[i] = (source.x, source.y, source.width, source.height)
+        return pages, page_of_tile, source_of_tile
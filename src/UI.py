@@ -24,6 +24,7 @@ class UIDefaults:
 class UIManager:
     def __init__(self, sprite_drawer: _p.SpriteDrawer):
         self.sprite_drawer: _p.SpriteDrawer = sprite_drawer
+        self.shape_drawer: _p.ShapeDrawer = _p.ShapeDrawer(sprite_drawer)
         self.__ui_elements: dict = {}
         self.__reversed_ui_elements: list = []
         self.ui_defaults = UIDefaults()
@@ -69,7 +70,7 @@ class Position:
 
     def __init__(self, dock_type: 'DockType', offset: _p.Vector2):
         self.dock_type: 'DockType' = dock_type
-        self.offset: _p.Vector2 = offset
+        self.offset: _p.Vector2 = offset.copy()
         self.__screen_position: _p.Vector2 = _p.Vector2.zero()
         self._update()
 
@@ -83,7 +84,7 @@ class Position:
 
     def _update(self):
         if self.dock_type == DockType.TOP_LEFT:
-            self.__screen_position = self.offset
+            self.__screen_position = self.offset.copy()
         elif self.dock_type == DockType.TOP_RIGHT:
             self.__screen_position = _p.Vector2(_p._GameBackend.graphics_device.ScissorRectangle.Width, 0) + self.offset
         elif self.dock_type == DockType.BOTTOM_LEFT:
@@ -108,6 +109,7 @@ class UIElement(_abc.ABC):
     def __init__(self, ui_manager: UIManager, position: Position, size: _p.Size, color: _p.Color):
         self._ui_manager: UIManager = ui_manager
         self._sprite_drawer: _p.SpriteDrawer = ui_manager.sprite_drawer
+        self._shape_drawer: _p.ShapeDrawer = ui_manager.shape_drawer
         self.position: Position = position
         self.size: _p.Size = size
         self.color: _p.Color = color
@@ -144,30 +146,24 @@ class UIElement(_abc.ABC):
 class FillRectangle(UIElement):
     def __init__(self, ui_manager: UIManager, position: Position, size: _p.Size, color: _p.Color, ignore_mouse: bool = True):
         super().__init__(ui_manager, position, size, color)
-        self.__texture = _p.Texture.custom(1, 1)
-        self.__texture.set_pixels([_p.Colors.WHITE])
         self.mouse_transparent = ignore_mouse
 
     def draw(self):
-        self._sprite_drawer.draw_texture(self.__texture, self.position.screen_position, self.color, self.origin, self.size.to_vector2(), self.rotation)
+        position = self.position.screen_position
+        self._shape_drawer.fill_rectangle(_p.Rectangle(position.x, position.y, self.size.width, self.size.height),
+                                          self.color, self.rotation, self.origin)
 
 
 class BorderRectangle(UIElement):
     def __init__(self, ui_manager: UIManager, position: Position, size: _p.Size, border_width: int, color: _p.Color, ignore_mouse: bool = True):
         super().__init__(ui_manager, position, size, color)
-        self.__texture = _p.Texture.custom(size.width, size.height)
-        pixels = [None] * size.width * size.height
-        for x in range(size.width):
-            for y in range(size.height):
-                if x < border_width or x > size.width - border_width - 1 or y < border_width or y > size.height - border_width - 1:
-                    pixels[y * size.width + x] = _p.Colors.WHITE
-                else:
-                    pixels[y * size.width + x] = _p.Colors.TRANSPARENT
-        self.__texture.set_pixels(pixels)
+        self.border_width: int = border_width
         self.mouse_transparent = ignore_mouse
 
     def draw(self):
-        self._sprite_drawer.draw_texture(self.__texture, self.position.screen_position, self.color, self.origin, _p.Vector2.one(), self.rotation)
+        position = self.position.screen_position
+        self._shape_drawer.draw_rectangle(_p.Rectangle(position.x, position.y, self.size.width, self.size.height),
+                                          self.color, self.border_width, self.rotation, self.origin)
 
 
 class Label(UIElement):
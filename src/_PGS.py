@@ -25,16 +25,29 @@ import Microsoft.Xna.Framework.Graphics as _mgGraphics
 import Microsoft.Xna.Framework.Input as _mgInput
 import FontStashSharp as _fontStash
 from System import TimeSpan as _timeSpan
+from System import IntPtr as _intPtr
+from System import Int64 as _int64
 from System.IO import File as _file
 from System.IO import Path as _path
 import PRS as _prs
 import abc as _abc
 import math as _math
+import ctypes as _ctypes
+import time as _time
+import numpy as _np
+import weakref as _weakref
 from enum import IntEnum as _enum
 
 
 class Vector2:
-    """Represents a 2-dimensional vector, with an x and y position."""
+    """Represents a 2-dimensional vector, with an x and y position.
+
+    The in-place operators (+=, -=, *= and /=) and set() change this Vector2 rather than creating a new one, so every
+    reference to it sees the change. Sprites copy the vectors they're given, but copy() a Vector2 before keeping it
+    anywhere else it shouldn't move with the original."""
+
+    __slots__ = ("x", "y")
+
     @staticmethod
     def zero():
         """Returns a Vector2 with values (0, 0)."""
@@ -64,28 +77,56 @@ class Vector2:
         :param other: The Vector2 to add.
         :return: The added values.
         """
+        if not isinstance(other, Vector2):
+            return NotImplemented
         return Vector2(self.x + other.x, self.y + other.y)
 
+    def __iadd__(self, other: 'Vector2') -> 'Vector2':
+        """
+        Adds the other Vector2's x and y values to this Vector2's, in place, without creating a new Vector2.
+        :param other: The Vector2 to add.
+        :return: This Vector2.
+        """
+        if not isinstance(other, Vector2):
+            return NotImplemented
+        self.x += other.x
+        self.y += other.y
+        return self
+
     def __sub__(self, other: 'Vector2') -> 'Vector2':
         """
         Subtracts the two x-values, and two y-values, from the Vector2s.
         :param other: The Vector2 to subtract.
         :return: The subtracted values.
         """
+        if not isinstance(other, Vector2):
+            return NotImplemented
         return Vector2(self.x - other.x, self.y - other.y)
 
+    def __isub__(self, other: 'Vector2') -> 'Vector2':
+        """
+        Subtracts the other Vector2's x and y values from this Vector2's, in place, without creating a new Vector2.
+        :param other: The Vector2 to subtract.
+        :return: This Vector2.
+        """
+        if not isinstance(other, Vector2):
+            return NotImplemented
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
     def __mul__(self, other) -> 'Vector2':
         """
         Multiplies the two x-values, and two y-values, of the Vector2s together.
         :param other: The Vector2 to multiply.
         :return: THe multiplied values.
         """
-        if type(other) == Vector2:
+        if isinstance(other, Vector2):
             return Vector2(self.x * other.x, self.y * other.y)
         elif type(other) == float or type(other) == int:
             return Vector2(self.x * other, self.y * other)
         else:
-            raise TypeError(f"unsupported operand type(s) for *: 'Vector2' and '{type(other).__name__}'")
+            return NotImplemented
 
     def __rmul__(self, other) -> 'Vector2':
         """
@@ -93,23 +134,57 @@ class Vector2:
         :param other: The Vector2 to multiply.
         :return: The multiplied values.
         """
-        if (type(other) != Vector2 and type(other) != int and type(other) != float):
-            raise TypeError(f"unsupported operand type(s) for *: '{type(other).__name__}' and 'Vector2'")
+        if (not isinstance(other, Vector2) and type(other) != int and type(other) != float):
+            return NotImplemented
         else:
             return self * other
 
+    def __imul__(self, other) -> 'Vector2':
+        """
+        Multiplies this Vector2's x and y values by the other Vector2's (or a number), in place, without creating a new
+        Vector2.
+        :param other: The Vector2 or number to multiply by.
+        :return: This Vector2.
+        """
+        if isinstance(other, Vector2):
+            self.x *= other.x
+            self.y *= other.y
+        elif type(other) == float or type(other) == int:
+            self.x *= other
+            self.y *= other
+        else:
+            return NotImplemented
+        return self
+
     def __truediv__(self, other) -> 'Vector2':
         """
         Divides the two x-values, and two y-values, of the Vector2s together.
         :param other: The Vector2 to divide.
         :return: The divided value.
         """
-        if type(other) == Vector2:
+        if isinstance(other, Vector2):
             return Vector2(self.x / other.x, self.y / other.y)
         elif type(other) == float or type(other) == int:
             return Vector2(self.x / other, self.y / other)
         else:
-            raise TypeError(f"unsupported operand type(s) for /: 'Vector2' and '{type(other).__name__}'")
+            return NotImplemented
+
+    def __itruediv__(self, other) -> 'Vector2':
+        """
+        Divides this Vector2's x and y values by the other Vector2's (or a number), in place, without creating a new
+        Vector2.
+        :param other: The Vector2 or number to divide by.
+        :return: This Vector2.
+        """
+        if isinstance(other, Vector2):
+            self.x /= other.x
+            self.y /= other.y
+        elif type(other) == float or type(other) == int:
+            self.x /= other
+            self.y /= other
+        else:
+            return NotImplemented
+        return self
 
     def __floordiv__(self, other) -> 'Vector2':
         """
@@ -136,6 +211,24 @@ class Vector2:
         """
         return f"Vector2(x: {self.x}, y: {self.y})"
 
+    def set(self, x: float, y: float) -> 'Vector2':
+        """
+        Set the x and y values of this Vector2, without creating a new Vector2.
+        :param x: The new x-coordinate.
+        :param y: The new y-coordinate.
+        :return: This Vector2.
+        """
+        self.x = x
+        self.y = y
+        return self
+
+    def copy(self) -> 'Vector2':
+        """
+        Get a new Vector2 with the same values as this one.
+        :return: The copied Vector2.
+        """
+        return Vector2(self.x, self.y)
+
     @staticmethod
     def lerp(value1: 'Vector2', value2: 'Vector2', amount: float) -> 'Vector2':
         """
@@ -145,13 +238,282 @@ class Vector2:
         :param amount: The amount to lerp by. This value should be between 0 and 1, however can be outside those values.
         :return: The lerped Vector2.
         """
-        lerp_val = _mg.Vector2.Lerp(_mg.Vector2(float(value1.x), float(value1.y)), _mg.Vector2(float(value2.x), float(value2.y)), float(amount))
-        return Vector2(lerp_val.X, lerp_val.Y)
+        return Vector2(value1.x + (value2.x - value1.x) * amount, value1.y + (value2.y - value1.y) * amount)
+
+
+class Vector2Array:
+    """Represents an array of Vector2s, stored as two contiguous NumPy columns (one for x, one for y).
+    Maths on a Vector2Array is done on every element at once by NumPy, which is far faster than updating thousands of
+    separate Vector2s. Indexing a single element gives a Vector2 that reads and writes straight into the array."""
+
+    def __init__(self, size: int = 0, dtype=_np.float32):
+        """
+        Create a new Vector2Array, with every element set to (0, 0).
+        :param size: The number of elements in the array.
+        :param dtype: The NumPy type to store the values as. This should be either float32 or float64.
+        """
+        self._data: _np.ndarray = _np.zeros((2, size), dtype=dtype)
+
+    @staticmethod
+    def from_arrays(x, y, dtype=_np.float32) -> 'Vector2Array':
+        """
+        Create a new Vector2Array from the given x and y values.
+        :param x: The x values, as anything NumPy can turn into an array.
+        :param y: The y values. This must be the same length as x.
+        :param dtype: The NumPy type to store the values as.
+        :return: The Vector2Array.
+        """
+        x = _np.asarray(x, dtype=dtype).reshape(-1)
+        y = _np.asarray(y, dtype=dtype).reshape(-1)
+        if len(x) != len(y):
+            raise ValueError(f"The x and y values must be the same length, got {len(x)} and {len(y)}.")
+        return Vector2Array._wrap(_np.stack((x, y)))
+
+    @staticmethod
+    def from_vectors(vectors: list, dtype=_np.float32) -> 'Vector2Array':
+        """
+        Create a new Vector2Array from the given list of Vector2s.
+        :param vectors: The Vector2s to copy into the array.
+        :param dtype: The NumPy type to store the values as.
+        :return: The Vector2Array.
+        """
+        return Vector2Array.from_arrays([vector.x for vector in vectors], [vector.y for vector in vectors], dtype)
+
+    @staticmethod
+    def full(size: int, value: Vector2, dtype=_np.float32) -> 'Vector2Array':
+        """
+        Create a new Vector2Array with every element set to the given value.
+        :param size: The number of elements in the array.
+        :param value: The Vector2 to set every element to.
+        :param dtype: The NumPy type to store the values as.
+        :return: The Vector2Array.
+        """
+        array = Vector2Array(size, dtype)
+        array._data[0] = value.x
+        array._data[1] = value.y
+        return array
+
+    @staticmethod
+    def lerp(value1: 'Vector2Array', value2, amount) -> 'Vector2Array':
+        """
+        Linearly interpolate every element between two Vector2Arrays with the given amount (0-1).
+        :param value1: The first Vector2Array.
+        :param value2: The second Vector2Array, or a Vector2 to lerp every element towards.
+        :param amount: The amount to lerp by, either as one value, or as an array with one value per element.
+        :return: The lerped Vector2Array.
+        """
+        return value1 + (value2 - value1) * amount
+
+    @property
+    def x(self) -> _np.ndarray:
+        """
+        Get the x values. This is a view into the array, so changing it will change the array.
+        """
+        return self._data[0]
+
+    @x.setter
+    def x(self, value):
+        self._data[0] = value
+
+    @property
+    def y(self) -> _np.ndarray:
+        """
+        Get the y values. This is a view into the array, so changing it will change the array.
+        """
+        return self._data[1]
+
+    @y.setter
+    def y(self, value):
+        self._data[1] = value
+
+    @property
+    def dtype(self):
+        """
+        Get the NumPy type the values are stored as.
+        """
+        return self._data.dtype
+
+    def __len__(self) -> int:
+        return self._data.shape[1]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield _Vector2ArrayElement(self._data, i)
+
+    def __getitem__(self, index):
+        """
+        Get an element, or a range of elements, of this array.
+        :param index: The index of the element, or a slice, index array, or boolean mask for many elements.
+        :return: A Vector2 that reads and writes into this array for a single index, otherwise a Vector2Array. Slices
+                 share their memory with this array, index arrays and masks are copies (the same as NumPy).
+        """
+        if isinstance(index, (int, _np.integer)):
+            length = len(self)
+            if index < 0:
+                index += length
+            if index < 0 or index >= length:
+                raise IndexError(f"Index {index} is out of range for a Vector2Array of length {length}.")
+            return _Vector2ArrayElement(self._data, index)
+        return Vector2Array._wrap(self._data[:, index])
+
+    def __setitem__(self, index, value):
+        if isinstance(value, Vector2Array):
+            self._data[:, index] = value._data
+        else:
+            self._data[0, index] = value.x
+            self._data[1, index] = value.y
+
+    def __add__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._data + self._operand(other))
+
+    def __radd__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._operand(other) + self._data)
+
+    def __iadd__(self, other) -> 'Vector2Array':
+        self._data += self._operand(other)
+        return self
+
+    def __sub__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._data - self._operand(other))
+
+    def __rsub__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._operand(other) - self._data)
+
+    def __isub__(self, other) -> 'Vector2Array':
+        self._data -= self._operand(other)
+        return self
+
+    def __mul__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._data * self._operand(other))
+
+    def __rmul__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._operand(other) * self._data)
+
+    def __imul__(self, other) -> 'Vector2Array':
+        self._data *= self._operand(other)
+        return self
+
+    def __truediv__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._data / self._operand(other))
+
+    def __rtruediv__(self, other) -> 'Vector2Array':
+        return Vector2Array._wrap(self._operand(other) / self._data)
+
+    def __itruediv__(self, other) -> 'Vector2Array':
+        self._data /= self._operand(other)
+        return self
+
+    def __neg__(self) -> 'Vector2Array':
+        return Vector2Array._wrap(-self._data)
+
+    def __str__(self):
+        return f"Vector2Array(length: {len(self)}, x: {self.x}, y: {self.y})"
+
+    def copy(self) -> 'Vector2Array':
+        """
+        Get a copy of this array, that doesn't share any memory with it.
+        :return: The copied array.
+        """
+        return Vector2Array._wrap(self._data.copy())
+
+    def length(self) -> _np.ndarray:
+        """
+        Get the length of every element.
+        :return: The lengths, as a NumPy array.
+        """
+        return _np.hypot(self._data[0], self._data[1])
+
+    def length_squared(self) -> _np.ndarray:
+        """
+        Get the squared length of every element. This is faster than length(), so use it for comparisons if you can.
+        :return: The squared lengths, as a NumPy array.
+        """
+        return self._data[0] * self._data[0] + self._data[1] * self._data[1]
+
+    def normalize(self) -> 'Vector2Array':
+        """
+        Get every element scaled to a length of 1. Elements with a length of 0 are left as (0, 0).
+        :return: The normalized array.
+        """
+        length = self.length()
+        return Vector2Array._wrap(_np.divide(self._data, length, out=_np.zeros_like(self._data), where=length != 0))
+
+    def rotate(self, radians) -> 'Vector2Array':
+        """
+        Get every element rotated around (0, 0) by the given amount.
+        :param radians: The amount to rotate by in radians, either as one value, or as an array with one value per element.
+        :return: The rotated array.
+        """
+        cos = _np.cos(radians)
+        sin = _np.sin(radians)
+        x, y = self._data
+        return Vector2Array._wrap(_np.stack((x * cos - y * sin, x * sin + y * cos)).astype(self.dtype, copy=False))
+
+    def clamp(self, min: Vector2, max: Vector2) -> 'Vector2Array':
+        """
+        Get every element clamped between the min and max values.
+        :param min: The minimum values an element can be.
+        :param max: The maximum values an element can be.
+        :return: The clamped array.
+        """
+        return Vector2Array._wrap(_np.clip(self._data, self._operand(min), self._operand(max)))
+
+    def to_interleaved(self) -> _np.ndarray:
+        """
+        Get this array as a NumPy array of (x, y) pairs, with shape (n, 2). This is the layout the SpriteDrawer uses.
+        :return: A copy of the values as (x, y) pairs.
+        """
+        return _np.ascontiguousarray(self._data.T)
+
+    @staticmethod
+    def _wrap(data: _np.ndarray) -> 'Vector2Array':
+        array = Vector2Array.__new__(Vector2Array)
+        array._data = data
+        return array
+
+    def _operand(self, other):
+        # Turn the other side of an operation into something that broadcasts against the (2, n) data array, in the
+        # same type as this array so the result keeps its type.
+        if isinstance(other, Vector2Array):
+            return other._data.astype(self._data.dtype, copy=False)
+        elif isinstance(other, Vector2):
+            return _np.array(((other.x,), (other.y,)), dtype=self._data.dtype)
+        elif isinstance(other, (int, float)):
+            return other
+        return _np.asarray(other, dtype=self._data.dtype)
+
+
+class _Vector2ArrayElement(Vector2):
+    # A Vector2 that reads and writes a single element of a Vector2Array.
+
+    __slots__ = ("__data", "__index")
+
+    @property
+    def x(self) -> float:
+        return float(self.__data[0, self.__index])
+
+    @x.setter
+    def x(self, value: float):
+        self.__data[0, self.__index] = value
+
+    @property
+    def y(self) -> float:
+        return float(self.__data[1, self.__index])
+
+    @y.setter
+    def y(self, value: float):
+        self.__data[1, self.__index] = value
+
+    def __init__(self, data: _np.ndarray, index: int):
+        self.__data = data
+        self.__index = index
 
 
 class Size:
     """Represents a set of two values corresponding to width and height."""
 
+    __slots__ = ("width", "height")
+
     def __init__(self, width: int, height: int):
         """
         Create a new Size with the given width and height.
@@ -168,58 +530,351 @@ class Size:
         """
         return Vector2(self.width, self.height)
 
+    def set(self, width: int, height: int) -> 'Size':
+        """
+        Set the width and height of this Size, without creating a new Size.
+        :param width: The new width.
+        :param height: The new height.
+        :return: This Size.
+        """
+        self.width = width
+        self.height = height
+        return self
+
+
+class Rectangle:
+    """Represents a rectangle, with an x and y position of its top left corner, and a width and height."""
+
+    __slots__ = ("x", "y", "width", "height")
+
+    def __init__(self, x: float, y: float, width: float, height: float):
+        """
+        Create a new Rectangle.
+        :param x: The x-coordinate of the top left corner.
+        :param y: The y-coordinate of the top left corner.
+        :param width: The width of the Rectangle.
+        :param height: The height of the Rectangle.
+        """
+        self.x: float = x
+        self.y: float = y
+        self.width: float = width
+        self.height: float = height
+
+    @property
+    def right(self) -> float:
+        """
+        Get the x-coordinate of the right side of this Rectangle.
+        """
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> float:
+        """
+        Get the y-coordinate of the bottom side of this Rectangle.
+        """
+        return self.y + self.height
+
+    def contains(self, point: Vector2) -> bool:
+        """
+        Check if the given point is inside this Rectangle.
+        :param point: The point to check.
+        :return: True if the point is inside this Rectangle.
+        """
+        return self.x <= point.x < self.x + self.width and self.y <= point.y < self.y + self.height
+
+    def intersects(self, other: 'Rectangle') -> bool:
+        """
+        Check if this Rectangle overlaps the other Rectangle.
+        :param other: The Rectangle to check against.
+        :return: True if the two Rectangles overlap.
+        """
+        return self.x < other.x + other.width and other.x < self.x + self.width and \
+            self.y < other.y + other.height and other.y < self.y + self.height
+
+    def __str__(self):
+        return f"Rectangle(x: {self.x}, y: {self.y}, width: {self.width}, height: {self.height})"
+
+
+class SpatialIndex:
+    """Finds things in a 2D world by where they are, without checking every one of them. Everything in the index is
+    stored in a grid of cells by its bounds, so asking what's inside an area (such as the screen) only looks at the
+    cells that area covers.
+
+    Any hashable value can be stored, such as a sprite, or the name of one."""
+
+    def __init__(self, cell_size: float = 256):
+        """
+        Create a new SpatialIndex.
+        :param cell_size: The size of each cell. This works best at around the size of the larger things being stored.
+        """
+        if cell_size <= 0:
+            raise ValueError("The cell size must be greater than zero.")
+        self.cell_size: float = cell_size
+        self.__cells: dict = {}
+        self.__bounds: dict = {}
+
+    def __len__(self):
+        return len(self.__bounds)
+
+    def __contains__(self, item):
+        return item in self.__bounds
+
+    def __iter__(self):
+        return iter(self.__bounds)
+
+    def insert(self, item, bounds: Rectangle):
+        """
+        Add an item to the index.
+        :param item: The item to add.
+        :param bounds: The area the item covers.
+        """
+        if item in self.__bounds:
+            raise ValueError("This item is already in the index. Use move() to change its bounds.")
+        edges = (bounds.x, bounds.y, bounds.x + bounds.width, bounds.y + bounds.height)
+        self.__bounds[item] = edges
+        for cell in self.__cells_of(edges):
+            self.__cells.setdefault(cell, set()).add(item)
+
+    def move(self, item, bounds: Rectangle):
+        """
+        Change the bounds of an item already in the index.
+        :param item: The item to move.
+        :param bounds: The new area the item covers.
+        """
+        old = self.__bounds[item]
+        edges = (bounds.x, bounds.y, bounds.x + bounds.width, bounds.y + bounds.height)
+        self.__bounds[item] = edges
+        old_cells, new_cells = self.__cell_range(old), self.__cell_range(edges)
+        if old_cells == new_cells:
+            # Most moves are small, and stay in the same cells.
+            return
+        old_cells, new_cells = set(self.__cells_of(old)), set(self.__cells_of(edges))
+        for cell in old_cells - new_cells:
+            self.__remove_from_cell(cell, item)
+        for cell in new_cells - old_cells:
+            self.__cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item):
+        """
+        Remove an item from the index.
+        :param item: The item to remove.
+        """
+        for cell in self.__cells_of(self.__bounds.pop(item)):
+            self.__remove_from_cell(cell, item)
+
+    def clear(self):
+        """
+        Remove every item from the index.
+        """
+        self.__cells.clear()
+        self.__bounds.clear()
+
+    def get_bounds(self, item) -> Rectangle:
+        """
+        Get the bounds an item was stored with.
+        :param item: The item.
+        :return: The area the item covers.
+        """
+        left, top, right, bottom = self.__bounds[item]
+        return Rectangle(left, top, right - left, bottom - top)
+
+    def query(self, area: Rectangle) -> list:
+        """
+        Get every item whose bounds overlap the given area.
+        :param area: The area to search.
+        :return: The list of items.
+        """
+        left, top, right, bottom = area.x, area.y, area.x + area.width, area.y + area.height
+        min_x, min_y, max_x, max_y = self.__cell_range((left, top, right, bottom))
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self.__cells):
+            # The area covers more cells than are in use, so it's quicker to check the used ones.
+            cells = [items for (x, y), items in self.__cells.items() if min_x <= x <= max_x and min_y <= y <= max_y]
+        else:
+            cells = [self.__cells[cell] for cell in self.__cells_of((left, top, right, bottom)) if cell in self.__cells]
+        bounds = self.__bounds
+        found = set()
+        result = []
+        for items in cells:
+            for item in items:
+                if item in found:
+                    continue
+                found.add(item)
+                item_left, item_top, item_right, item_bottom = bounds[item]
+                if item_left <= right and left <= item_right and item_top <= bottom and top <= item_bottom:
+                    result.append(item)
+        return result
+
+    def query_point(self, point: Vector2) -> list:
+        """
+        Get every item whose bounds contain the given point.
+        :param point: The point to search at.
+        :return: The list of items.
+        """
+        cell = (_math.floor(point.x / self.cell_size), _math.floor(point.y / self.cell_size))
+        result = []
+        for item in self.__cells.get(cell, ()):
+            left, top, right, bottom = self.__bounds[item]
+            if left <= point.x <= right and top <= point.y <= bottom:
+                result.append(item)
+        return result
+
+    def nearest(self, point: Vector2, max_distance: float = None):
+        """
+        Get the item whose bounds are closest to the given point. Items containing the point have a distance of 0.
+        :param point: The point to search from.
+        :param max_distance: If given, items further away than this are ignored.
+        :return: The closest item, or None if there are none (within max_distance).
+        """
+        best, best_distance = None, _math.inf if max_distance is None else max_distance
+        center_x, center_y = _math.floor(point.x / self.cell_size), _math.floor(point.y / self.cell_size)
+        checked = set()
+        ring = 0
+        # Search outwards one ring of cells at a time. Anything in a ring further out is at least ring * cell_size
+        # away, so once something closer than that has been found the search can stop.
+        while ring == 0 or 8 * ring <= len(self.__cells):
+            if best_distance <= (ring - 1) * self.cell_size:
+                return best
+            for cell in self.__ring(center_x, center_y, ring):
+                for item in self.__cells.get(cell, ()):
+                    if item not in checked:
+                        checked.add(item)
+                        distance = self.__distance(point, item)
+                        if distance <= best_distance:
+                            best, best_distance = item, distance
+            ring += 1
+        # The rings have grown bigger than the number of cells in use, so just check everything that's left.
+        for item in self.__bounds:
+            if item not in checked:
+                distance = self.__distance(point, item)
+                if distance <= best_distance:
+                    best, best_distance = item, distance
+        return best
+
+    def __distance(self, point: Vector2, item) -> float:
+        left, top, right, bottom = self.__bounds[item]
+        dx = max(left - point.x, 0, point.x - right)
+        dy = max(top - point.y, 0, point.y - bottom)
+        return _math.hypot(dx, dy)
+
+    @staticmethod
+    def __ring(center_x: int, center_y: int, ring: int):
+        if ring == 0:
+            yield center_x, center_y
+            return
+        for x in range(center_x - ring, center_x + ring + 1):
+            yield x, center_y - ring
+            yield x, center_y + ring
+        for y in range(center_y - ring + 1, center_y + ring):
+            yield center_x - ring, y
+            yield center_x + ring, y
+
+    def __cell_range(self, edges: tuple) -> tuple:
+        size = self.cell_size
+        return (_math.floor(edges[0] / size), _math.floor(edges[1] / size),
+                _math.floor(edges[2] / size), _math.floor(edges[3] / size))
+
+    def __cells_of(self, edges: tuple):
+        min_x, min_y, max_x, max_y = self.__cell_range(edges)
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                yield x, y
+
+    def __remove_from_cell(self, cell: tuple, item):
+        items = self.__cells[cell]
+        items.discard(item)
+        if not items:
+            del self.__cells[cell]
+
 
 class Matrix:
-    """Represents a 4x4 matrix, used for 2D and 3D transformations."""
+    """Represents a 2D affine transformation matrix, used for 2D transformations such as cameras.
+
+    Only the six values a 2D transformation can change are stored. They follow MonoGame's layout (vectors are treated
+    as rows, so the translation lives in m41 and m42), and all the maths is done in python. The matrix is only converted
+    to a MonoGame matrix when the SpriteDrawer needs it, and that conversion is kept until the matrix is changed."""
+
+    __slots__ = ("__m11", "__m12", "__m21", "__m22", "__m41", "__m42", "__mg_matrix")
 
     @staticmethod
     def identity():
         """
         Get the identity matrix.
-        :return: A matrix with values (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
-        """
-        return Matrix(1, 0, 0, 0,
-                      0, 1, 0, 0,
-                      0, 0, 1, 0,
-                      0, 0, 0, 1)
-
-    def __init__(self, m11: float, m12: float, m13: float, m14: float, m21: float, m22: float, m23: float, m24: float,
-                 m31: float, m32: float, m33: float, m34: float, m41: float, m42: float, m43: float, m44: float):
-        """
-        Creates a new 4x4 matrix.
-        :param m11: Column 1, row 1, of the matrix.
-        :param m12: Column 1, row 2, of the matrix.
-        :param m13: Column 1, row 3, of the matrix.
-        :param m14: Column 1, row 4, of the matrix.
-        :param m21: Column 2, row 1, of the matrix.
-        :param m22: Column 2, row 2, of the matrix.
-        :param m23: Column 2, row 3, of the matrix.
-        :param m24: Column 2, row 4, of the matrix.
-        :param m31: Column 3, row 1, of the matrix.
-        :param m32: Column 3, row 2, of the matrix.
-        :param m33: Column 3, row 3, of the matrix.
-        :param m34: Column 3, row 4, of the matrix.
-        :param m41: Column 4, row 1, of the matrix.
-        :param m42: Column 4, row 2, of the matrix.
-        :param m43: Column 4, row 3, of the matrix.
-        :param m44: Column 4, row 4, of the matrix.
-        """
-        self.m11: float = m11
-        self.m12: float = m12
-        self.m13: float = m13
-        self.m14: float = m14
-        self.m21: float = m21
-        self.m22: float = m22
-        self.m23: float = m23
-        self.m24: float = m24
-        self.m31: float = m31
-        self.m32: float = m32
-        self.m33: float = m33
-        self.m34: float = m34
-        self.m41: float = m41
-        self.m42: float = m42
-        self.m43: float = m43
-        self.m44: float = m44
+        :return: A matrix with values (1, 0, 0, 1, 0, 0)
+        """
+        return Matrix(1, 0, 0, 1, 0, 0)
+
+    def __init__(self, m11: float = 1, m12: float = 0, m21: float = 0, m22: float = 1, m41: float = 0,
+                 m42: float = 0):
+        """
+        Creates a new 2D affine matrix. Leaving out every value will give you the identity matrix.
+        :param m11: Row 1, column 1, of the matrix.
+        :param m12: Row 1, column 2, of the matrix.
+        :param m21: Row 2, column 1, of the matrix.
+        :param m22: Row 2, column 2, of the matrix.
+        :param m41: Row 4, column 1, of the matrix (the x translation).
+        :param m42: Row 4, column 2, of the matrix (the y translation).
+        """
+        self.__m11: float = m11
+        self.__m12: float = m12
+        self.__m21: float = m21
+        self.__m22: float = m22
+        self.__m41: float = m41
+        self.__m42: float = m42
+        self.__mg_matrix = None
+
+    @property
+    def m11(self) -> float:
+        return self.__m11
+
+    @m11.setter
+    def m11(self, value: float):
+        self.__m11 = value
+        self.__mg_matrix = None
+
+    @property
+    def m12(self) -> float:
+        return self.__m12
+
+    @m12.setter
+    def m12(self, value: float):
+        self.__m12 = value
+        self.__mg_matrix = None
+
+    @property
+    def m21(self) -> float:
+        return self.__m21
+
+    @m21.setter
+    def m21(self, value: float):
+        self.__m21 = value
+        self.__mg_matrix = None
+
+    @property
+    def m22(self) -> float:
+        return self.__m22
+
+    @m22.setter
+    def m22(self, value: float):
+        self.__m22 = value
+        self.__mg_matrix = None
+
+    @property
+    def m41(self) -> float:
+        return self.__m41
+
+    @m41.setter
+    def m41(self, value: float):
+        self.__m41 = value
+        self.__mg_matrix = None
+
+    @property
+    def m42(self) -> float:
+        return self.__m42
+
+    @m42.setter
+    def m42(self, value: float):
+        self.__m42 = value
+        self.__mg_matrix = None
 
     @staticmethod
     def transform(value: Vector2) -> 'Matrix':
@@ -228,7 +883,7 @@ class Matrix:
         :param value: The Vector2 to create the tranformation matrix with.
         :return: The transformation matrix.
         """
-        return Matrix._to_pgs_matrix(_mg.Matrix.CreateTranslation(float(value.x), float(value.y), float(0)))
+        return Matrix(1, 0, 0, 1, value.x, value.y)
 
     @staticmethod
     def rotate(value: float) -> 'Matrix':
@@ -237,7 +892,9 @@ class Matrix:
         :param value: The value in radians to create the rotation matrix.
         :return: The rotation matrix.
         """
-        return Matrix._to_pgs_matrix(_mg.Matrix.CreateRotationZ(value))
+        cos = _math.cos(value)
+        sin = _math.sin(value)
+        return Matrix(cos, sin, -sin, cos, 0, 0)
 
     @staticmethod
     def scale(value: Vector2) -> 'Matrix':
@@ -246,31 +903,72 @@ class Matrix:
         :param value: The Vector2 to create a scale matrix with.
         :return: The scale matrix.
         """
-        return Matrix._to_pgs_matrix(_mg.Matrix.CreateScale(_mg.Vector3(float(value.x), float(value.y), float(1))))
+        return Matrix(value.x, 0, 0, value.y, 0, 0)
 
     def __mul__(self, other: 'Matrix') -> 'Matrix':
         """
-        Multiply two matrices together.
+        Multiply two matrices together. The resulting matrix applies this matrix first, then the other one.
         :param other: The matrix to multiply with.
         :return: The multiplied matrix.
         """
-        return Matrix._to_pgs_matrix(_mg.Matrix.Multiply(self._to_mg_matrix(), other._to_mg_matrix()))
+        return Matrix(self.__m11 * other.__m11 + self.__m12 * other.__m21,
+                      self.__m11 * other.__m12 + self.__m12 * other.__m22,
+                      self.__m21 * other.__m11 + self.__m22 * other.__m21,
+                      self.__m21 * other.__m12 + self.__m22 * other.__m22,
+                      self.__m41 * other.__m11 + self.__m42 * other.__m21 + other.__m41,
+                      self.__m41 * other.__m12 + self.__m42 * other.__m22 + other.__m42)
+
+    def invert(self) -> 'Matrix':
+        """
+        Get the inverse of this matrix, which undoes whatever this matrix does. For example, inverting a camera's matrix
+        lets you turn a position on the screen back into a position in the world.
+        :return: The inverted matrix.
+        """
+        determinant = self.__m11 * self.__m22 - self.__m12 * self.__m21
+        if determinant == 0:
+            raise ValueError("This matrix cannot be inverted, as it has a scale of zero.")
+        m11 = self.__m22 / determinant
+        m12 = -self.__m12 / determinant
+        m21 = -self.__m21 / determinant
+        m22 = self.__m11 / determinant
+        return Matrix(m11, m12, m21, m22, -(self.__m41 * m11 + self.__m42 * m21), -(self.__m41 * m12 + self.__m42 * m22))
+
+    def transform_point(self, point: Vector2) -> Vector2:
+        """
+        Transform the given point by this matrix.
+        :param point: The point to transform.
+        :return: The transformed point.
+        """
+        return Vector2(point.x * self.__m11 + point.y * self.__m21 + self.__m41,
+                       point.x * self.__m12 + point.y * self.__m22 + self.__m42)
 
+    def transform_points(self, points) -> _np.ndarray:
+        """
+        Transform many points by this matrix at once.
+        :param points: The points to transform, as anything NumPy can turn into an array of (x, y) pairs.
+        :return: The transformed points, as a NumPy array with shape (n, 2).
+        """
+        points = _np.asarray(points, dtype=_np.float64).reshape(-1, 2)
+        return points @ _np.array(((self.__m11, self.__m12), (self.__m21, self.__m22))) + (self.__m41, self.__m42)
 
-    def _to_mg_matrix(self) -> _mg.Matrix:
-        return _mg.Matrix(float(self.m11), float(self.m12), float(self.m13), float(self.m14), float(self.m21),
-                          float(self.m22), float(self.m23), float(self.m24), float(self.m31), float(self.m32),
-                          float(self.m33), float(self.m34), float(self.m41), float(self.m42), float(self.m43),
-                          float(self.m44))
+    def __str__(self):
+        return f"Matrix(m11: {self.__m11}, m12: {self.__m12}, m21: {self.__m21}, m22: {self.__m22}, " \
+               f"m41: {self.__m41}, m42: {self.__m42})"
 
-    @staticmethod
-    def _to_pgs_matrix(matrix: _mg.Matrix) -> 'Matrix':
-        return Matrix(matrix.M11, matrix.M12, matrix.M13, matrix.M14, matrix.M21, matrix.M22, matrix.M23, matrix.M24,
-                      matrix.M31, matrix.M32, matrix.M33, matrix.M34, matrix.M41, matrix.M42, matrix.M43, matrix.M44)
+    def _to_mg_matrix(self) -> _mg.Matrix:
+        if self.__mg_matrix is None:
+            self.__mg_matrix = _mg.Matrix(float(self.__m11), float(self.__m12), float(0), float(0),
+                                          float(self.__m21), float(self.__m22), float(0), float(0),
+                                          float(0), float(0), float(1), float(0),
+                                          float(self.__m41), float(self.__m42), float(0), float(1))
+        return self.__mg_matrix
 
 
 class Color:
     """Represents a Color with given red, green, blue, and alpha values."""
+
+    __slots__ = ("r", "g", "b", "a")
+
     def __init__(self, r: int, g: int, b: int, a: int = 255):
         """
         Create a new Color with the given red, green, blue, and optional alpha values.
@@ -293,6 +991,55 @@ class Color:
         """
         return Color(hex_value >> 16, (hex_value & 0xFF00) >> 8, hex_value & 255)
 
+    def set(self, r: int, g: int, b: int, a: int = 255) -> 'Color':
+        """
+        Set the red, green, blue, and optional alpha values of this Color, without creating a new Color.
+        :param r: The new red value.
+        :param g: The new green value.
+        :param b: The new blue value.
+        :param a: The new alpha value.
+        :return: This Color.
+        """
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        return self
+
+    @property
+    def packed_value(self) -> int:
+        """
+        Get this Color packed into a single 32-bit integer, in the same layout MonoGame uses (red in the lowest byte,
+        alpha in the highest). This is the format SpriteDrawer.draw_many() expects its colors in.
+        :return: The packed Color.
+        """
+        return self.r | (self.g << 8) | (self.b << 16) | (self.a << 24)
+
+    def _to_mg_color(self) -> _mg.Color:
+        return _mg.Color(self.r, self.g, self.b, self.a)
+
+
+class _ConstantColor(Color):
+    # One of the shared Colors. These are used everywhere as defaults, so they can't be changed (otherwise setting the
+    # color of one sprite in place would change every white sprite), and their .NET color is only ever created once.
+
+    __slots__ = ("__mg_color",)
+
+    def __init__(self, color: Color):
+        object.__setattr__(self, "r", color.r)
+        object.__setattr__(self, "g", color.g)
+        object.__setattr__(self, "b", color.b)
+        object.__setattr__(self, "a", color.a)
+        object.__setattr__(self, "_ConstantColor__mg_color", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("The shared Colors cannot be changed. Create a new Color instead.")
+
+    def _to_mg_color(self) -> _mg.Color:
+        if self.__mg_color is None:
+            object.__setattr__(self, "_ConstantColor__mg_color", _mg.Color(self.r, self.g, self.b, self.a))
+        return self.__mg_color
+
 
 # From https://developer.mozilla.org/en-US/docs/Web/CSS/color_value
 # Colors enum. Defines a list of commonly used colors.
@@ -451,9 +1198,21 @@ class Colors:
     TRANSPARENT = Color(0, 0, 0, 0)
 
 
+# Swap every shared color out for a constant one.
+for _name, _color in list(vars(Colors).items()):
+    if isinstance(_color, Color):
+        setattr(Colors, _name, _ConstantColor(_color))
+del _name, _color
+
+
 class Texture:
     """Represents a 2D texture."""
 
+    # Textures are always drawn whole. TextureRegions set this to the part of their page they draw.
+    _source_rectangle = None
+    # The frame this texture was last drawn on, which TextureCache uses to pick what to free first.
+    _last_drawn = 0
+
     @property
     def size(self) -> Size:
         """
@@ -475,6 +1234,21 @@ class Texture:
             except:
                 raise AttributeError("Path cannot be an empty string." if path == "" else "Could not find file with the given path.")
 
+    @staticmethod
+    def load_async(path: str, on_loaded=None) -> 'TextureHandle':
+        """
+        Start loading a Texture in the background. The image is decoded on another thread, and then TextureLoader
+        uploads it on the main thread during a later frame, so the game keeps running (and can show progress) while it
+        loads.
+        :param path: The path of the texture.
+        :param on_loaded: An optional function, called with the Texture once it's loaded.
+        :return: The TextureHandle, which holds the Texture once it's loaded.
+        """
+        handle = TextureHandle(path, on_loaded)
+        handle._job = _prs.PGSUtils.DecodeImageAsync(path)
+        TextureLoader._add(handle)
+        return handle
+
     @staticmethod
     def custom(width: int, height: int):
         """
@@ -487,53 +1261,792 @@ class Texture:
         tex._texture = _mgGraphics.Texture2D(_GameBackend.graphics_device, width, height)
         return tex
 
-    def set_pixels(self, data: list[Color]):
+    def set_pixels(self, data, area: Rectangle = None):
         """
-        Set the pixels of this Texture. This expects a Color array.
-        :param data: The Color array.
+        Set the pixels of this Texture, or of an area of it. The pixels are copied straight from memory, so the fastest
+        way to pass them is as anything supporting the buffer protocol: bytes, a bytearray, a memoryview, or a NumPy
+        array of RGBA bytes (such as shape (height, width, 4) uint8) or of packed colors (see Color.packed_value). A
+        list of Colors also works, but is much slower.
+        :param data: The pixels, row by row from the top left.
+        :param area: The area of the Texture to set, in pixels. Defaults to the whole Texture.
         """
-        colors = []
-        for i in range(len(data)):
-            colors.append(_mg.Color(data[i].r, data[i].g, data[i].b, data[i].a))
-        _prs.PGSUtils.SetTexturePixels(self._texture, colors)
+        x, y, width, height = _pixel_area(self.size, area)
+        pixels = _pixel_array(data, width, height)
+        _prs.PGSUtils.SetTextureData(self._texture, x, y, width, height, _pointer(pixels))
 
+    def get_pixels(self, area: Rectangle = None) -> _np.ndarray:
+        """
+        Get the pixels of this Texture, or of an area of it.
+        :param area: The area of the Texture to get, in pixels. Defaults to the whole Texture.
+        :return: The pixels, as a NumPy uint8 array with shape (height, width, 4) of RGBA values.
+        """
+        x, y, width, height = _pixel_area(self.size, area)
+        pixels = _np.empty((height, width, 4), _np.uint8)
+        _prs.PGSUtils.GetTextureData(self._texture, x, y, width, height, _pointer(pixels))
+        return pixels
 
-class SpriteBase(_abc.ABC):
-    """Represents the base class of a Sprite object. This includes all attributes a sprite will need barring Texture.
-    This class cannot be instantiated."""
+    def get_region(self, source: Rectangle) -> 'TextureRegion':
+        """
+        Get a region of this Texture, which can be drawn in place of a Texture to draw only that part of it.
+        :param source: The part of this Texture, in pixels, that the region covers.
+        :return: The TextureRegion.
+        """
+        return TextureRegion(self, source)
 
-    def __init__(self):
-        self.position: Vector2 = Vector2.zero()
-        self.rotation: float = 0
-        self.scale: Vector2 = Vector2.one()
-        self.color: Color = Colors.WHITE
-        self.origin: Vector2 = Vector2.zero()
+    def dispose(self):
+        """
+        Free this Texture from the graphics card. It can't be drawn afterwards.
+        """
+        if self._texture is not None:
+            self._texture.Dispose()
+            self._texture = None
 
-    @_abc.abstractmethod
-    def _draw(self, spriteBatch):
-        pass
+    def _mark_drawn(self):
+        self._last_drawn = Time.total_frames()
 
 
-class Sprite(SpriteBase):
-    def __init__(self, texture: Texture, position: Vector2):
-        super().__init__()
-        self.texture: Texture = texture
-        self.position: Vector2 = position
+class DynamicTexture(Texture):
+    """A Texture whose pixels are changed often, such as every frame (video, minimaps, fog of war). Each DynamicTexture
+    has its own pinned staging array, the size of the whole texture, that changes are written into, so nothing is
+    allocated or converted per update, and MonoGame copies them into the texture from there.
 
-    @staticmethod
-    def from_sprite(sprite: 'Sprite'):
-        new_sprite = Sprite(sprite.texture, sprite.position)
+    Either call set_pixels() like with any Texture, or write straight into the staging array with begin_update() and
+    end_update()."""
+
+    def __init__(self, width: int, height: int):
+        """
+        Create a new, blank (transparent), DynamicTexture.
+        :param width: The width of the texture.
+        :param height: The height of the texture.
+        """
+        super().__init__("CUSTOM")
+        self._texture = _mgGraphics.Texture2D(_GameBackend.graphics_device, width, height)
+        staging = _prs.PGSStagingBuffer(width * height * 4)
+        self.__staging = staging
+        # Every array from begin_update() is a view of this, so it stays alive as long as any of them do. The pinned
+        # array is only freed once it's gone, so an array kept past dispose() never points at freed memory.
+        self.__memory = (_ctypes.c_ubyte * staging.Size).from_address(staging.Pointer.ToInt64())
+        _weakref.finalize(self.__memory, staging.Dispose).atexit = False
+        self.__area = None
+
+    def begin_update(self, area: Rectangle = None) -> _np.ndarray:
+        """
+        Start changing the pixels of this texture, or of an area of it, by writing straight into the staging array.
+        Every pixel of the area must be written, as the array doesn't hold the old pixels. Call end_update() when done.
+        :param area: The area of the texture to change, in pixels. Defaults to the whole texture.
+        :return: A NumPy uint8 array with shape (height, width, 4) to write the RGBA pixels into. What's written after
+        end_update() isn't uploaded, but the array stays safe to use for as long as it's kept, even after dispose().
+        """
+        if self.__staging is None:
+            raise RuntimeError("The DynamicTexture has been disposed.")
+        if self.__area is not None:
+            raise RuntimeError("end_update() must be called before begin_update() can be called again.")
+        self.__area = _pixel_area(self.size, area)
+        width, height = self.__area[2], self.__area[3]
+        return _np.ctypeslib.as_array(self.__memory)[:width * height * 4].reshape(height, width, 4)
+
+    def end_update(self):
+        """
+        Finish the change started with begin_update(), and copy the pixels into the texture.
+        """
+        if self.__area is None:
+            raise RuntimeError("begin_update() must be called before end_update().")
+        x, y, width, height = self.__area
+        self.__area = None
+        self.__staging.Upload(self._texture, x, y, width, height)
+
+    def set_pixels(self, data, area: Rectangle = None):
+        """
+        Set the pixels of this texture, or of an area of it, through the staging array. Takes the same pixels as
+        Texture.set_pixels().
+        :param data: The pixels, row by row from the top left.
+        :param area: The area of the texture to set, in pixels. Defaults to the whole texture.
+        """
+        x, y, width, height = _pixel_area(self.size, area)
+        pixels = _pixel_array(data, width, height)
+        self.begin_update(area).reshape(-1)[:] = pixels
+        self.end_update()
+
+    def dispose(self):
+        """
+        Free this texture from the graphics card, along with its staging array once no array from begin_update() is
+        left. It can't be drawn or updated afterwards.
+        """
+        self.__staging = None
+        self.__memory = None
+        self.__area = None
+        super().dispose()
+
+
+class TextureHandle:
+    """A Texture that's loading in the background, returned by Texture.load_async()."""
+
+    @property
+    def done(self) -> bool:
+        """
+        Get whether loading has finished, either successfully or not.
+        :return: True if loading has finished.
+        """
+        return self.__done
+
+    @property
+    def texture(self) -> Texture:
+        """
+        Get the loaded Texture. If loading failed, the error is raised here.
+        :return: The Texture, or None if it hasn't loaded yet.
+        """
+        if self.__error is not None:
+            raise self.__error
+        return self.__texture
+
+    @property
+    def error(self) -> Exception:
+        """
+        Get the error that stopped the Texture loading.
+        :return: The error, or None if there wasn't one.
+        """
+        return self.__error
+
+    def __init__(self, path: str, on_loaded=None):
+        self.path: str = path
+        self.on_loaded = on_loaded
+        self.__texture = None
+        self.__error = None
+        self.__done = False
+        # The background decode, which TextureLoader waits on.
+        self._job = None
+
+    def _finish(self, texture: Texture, error: Exception):
+        self.__texture = texture
+        self.__error = error
+        self.__done = True
+        self._job = None
+        if texture is not None and self.on_loaded is not None:
+            self.on_loaded(texture)
+
+
+class TextureLoader:
+    """Finishes the Textures started with Texture.load_async(). Decoding happens on other threads, but uploading to the
+    graphics card has to happen on the main thread, so every frame the decoded images are uploaded until upload_budget
+    milliseconds have been spent (at least one is always uploaded). The rest wait for the next frame, so loading many
+    textures at once doesn't freeze the game."""
+
+    upload_budget: float = 4
+    """The time in milliseconds to spend uploading textures each frame."""
+
+    __pending: list = []
+    __requested = 0
+    __finished = 0
+
+    @staticmethod
+    def pending() -> int:
+        """
+        Get the number of textures still loading.
+        :return: The number of textures still loading.
+        """
+        return len(TextureLoader.__pending)
+
+    @staticmethod
+    def progress() -> float:
+        """
+        Get the fraction of the textures started since the loader was last idle that have finished loading.
+        :return: The fraction, between 0 and 1. This is 1 when nothing is loading.
+        """
+        if TextureLoader.__requested == 0:
+            return 1.0
+        return TextureLoader.__finished / TextureLoader.__requested
+
+    @staticmethod
+    def _add(handle: TextureHandle):
+        if not TextureLoader.__pending:
+            TextureLoader.__requested = 0
+            TextureLoader.__finished = 0
+        TextureLoader.__pending.append(handle)
+        TextureLoader.__requested += 1
+
+    @staticmethod
+    def _update():
+        start = _time.perf_counter()
+        for handle in list(TextureLoader.__pending):
+            task = handle._job
+            if not task.IsCompleted:
+                continue
+            TextureLoader.__pending.remove(handle)
+            TextureLoader.__finished += 1
+            if task.IsFaulted or task.IsCanceled:
+                message = task.Exception.GetBaseException().Message if task.IsFaulted else "Loading was cancelled."
+                handle._finish(None, OSError(f"Could not load the texture at '{handle.path}'. {message}"))
+                continue
+            texture = Texture("CUSTOM")
+            texture._texture = _prs.PGSUtils.CreateTexture(_GameBackend.graphics_device, task.Result)
+            handle._finish(texture, None)
+            if (_time.perf_counter() - start) * 1000 >= TextureLoader.upload_budget:
+                break
+
+
+class TextureCache:
+    """Loads each texture file once, however many times it's asked for, and frees the textures that aren't needed any
+    more. Every get() must be matched by a release() once the texture is no longer used (for example when a scene is
+    unloaded). Released textures stay loaded, so getting them again is free, until the textures in the cache take up
+    more than budget bytes of video memory; then the unreferenced ones that were drawn least recently are disposed."""
+
+    def __init__(self, budget: int = 256 * 1024 * 1024):
+        """
+        Create a new, empty, TextureCache.
+        :param budget: The estimated video memory, in bytes, the cache can use before it frees unreferenced textures.
+        """
+        self.budget: int = budget
+        self.__entries: dict = {}
+
+    @property
+    def used_bytes(self) -> int:
+        """
+        Get the estimated video memory used by the textures in the cache.
+        :return: The estimated size, in bytes, of every texture in the cache.
+        """
+        return sum(entry.size for entry in self.__entries.values())
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, path: str):
+        return _cache_key(path) in self.__entries
+
+    def get(self, path: str) -> Texture:
+        """
+        Get the Texture for the given path, loading it if it isn't in the cache. Call release() when it's no longer
+        used.
+        :param path: The path of the texture. Different paths to the same file share one Texture.
+        :return: The Texture.
+        """
+        key = _cache_key(path)
+        entry = self.__entries.get(key)
+        if entry is None:
+            texture = Texture(path)
+            entry = self.__entries[key] = _CachedTexture(texture, texture.size.width * texture.size.height * 4)
+        entry.references += 1
+        self.trim()
+        return entry.texture
+
+    def release(self, path_or_texture):
+        """
+        Stop using a Texture from get(). Once nothing uses it, it can be freed to keep the cache within budget.
+        :param path_or_texture: The path the Texture was got with, or the Texture itself.
+        """
+        entry = self.__find(path_or_texture)
+        if entry is None or entry.references == 0:
+            raise ValueError("The texture was not got from this cache, or has already been released.")
+        entry.references -= 1
+        self.trim()
+
+    def trim(self, budget: int = None) -> int:
+        """
+        Dispose unreferenced textures, least recently drawn first, until the cache is within budget.
+        :param budget: The size in bytes to trim the cache to. Defaults to the budget of the cache; 0 frees every
+        unreferenced texture.
+        :return: The number of textures disposed.
+        """
+        budget = self.budget if budget is None else budget
+        used = self.used_bytes
+        if used <= budget:
+            return 0
+        freed = 0
+        unreferenced = [(entry.texture._last_drawn, key) for key, entry in self.__entries.items() if entry.references == 0]
+        for _, key in sorted(unreferenced):
+            if used <= budget:
+                break
+            entry = self.__entries.pop(key)
+            entry.texture.dispose()
+            used -= entry.size
+            freed += 1
+        return freed
+
+    def clear(self):
+        """
+        Dispose every texture in the cache, including ones still in use.
+        """
+        for entry in self.__entries.values():
+            entry.texture.dispose()
+        self.__entries.clear()
+
+    def __find(self, path_or_texture):
+        if isinstance(path_or_texture, Texture):
+            for entry in self.__entries.values():
+                if entry.texture is path_or_texture:
+                    return entry
+            return None
+        return self.__entries.get(_cache_key(path_or_texture))
+
+
+class _CachedTexture:
+    __slots__ = ("texture", "size", "references")
+
+    def __init__(self, texture: Texture, size: int):
+        self.texture: Texture = texture
+        self.size: int = size
+        self.references: int = 0
+
+
+def _cache_key(path: str) -> str:
+    # Paths that point at the same file (relative or absolute, with different separators or case on Windows) are the
+    # same texture.
+    return _os.path.normcase(_os.path.abspath(path))
+
+
+class TextureRegion:
+    """Represents a rectangular part of a Texture. A TextureRegion can be used anywhere a Texture can be drawn (such as
+    in a Sprite), and only that part of the Texture will be drawn. Drawing many regions of the same Texture is much
+    faster than drawing many separate Textures, see AtlasBuilder."""
+
+    @property
+    def size(self) -> Size:
+        """
+        Get the size in pixels of this region.
+        :return: The size in pixels of this region.
+        """
+        return Size(self.source.width, self.source.height)
+
+    def __init__(self, texture: Texture, source: Rectangle):
+        """
+        Create a new TextureRegion.
+        :param texture: The Texture the region is part of.
+        :param source: The part of the Texture, in pixels, that the region covers.
+        """
+        self.texture: Texture = texture
+        self.source: Rectangle = source
+        self._texture = texture._texture
+        self._source_rectangle = _mg.Rectangle(int(source.x), int(source.y), int(source.width), int(source.height))
+
+    def _mark_drawn(self):
+        self.texture._mark_drawn()
+
+
+class AtlasBuilder:
+    """Packs many Textures (or image files) into a few large Textures, called pages. Every packed Texture comes back as
+    a TextureRegion of a page, so a whole level can be drawn from one or two Textures, rather than switching Texture
+    (which is slow) between almost every draw.
+
+    Add everything with add(), then call build() once, usually while loading."""
+
+    def __init__(self, page_size: Size = Size(2048, 2048), padding: int = 1):
+        """
+        Create a new AtlasBuilder.
+        :param page_size: The size of each page. Every Texture added must fit inside a single page.
+        :param padding: The gap, in pixels, left around each Texture so they don't bleed into each other when scaled.
+        """
+        self.page_size: Size = page_size
+        self.padding: int = padding
+        self.__textures: dict = {}
+        self.__pages: list[Texture] = []
+
+    @property
+    def pages(self) -> list[Texture]:
+        """
+        Get the pages created by build().
+        :return: The list of pages.
+        """
+        return self.__pages
+
+    def add(self, name: str, texture):
+        """
+        Add a Texture to be packed.
+        :param name: The name to get the region back with once the atlas is built.
+        :param texture: The Texture, or the path of an image file, to pack.
+        """
+        self.__textures[name] = texture
+
+    def build(self) -> dict:
+        """
+        Pack every added Texture into pages.
+        :return: A dictionary of the name given in add() to the TextureRegion it was packed into.
+        """
+        textures = {}
+        try:
+            for name, texture in self.__textures.items():
+                textures[name] = Texture(texture) if isinstance(texture, str) else texture
+            return self.__pack(textures)
+        finally:
+            # The textures loaded from paths are only needed until they're copied into the pages (or packing fails).
+            for name, texture in textures.items():
+                if isinstance(self.__textures[name], str):
+                    texture.dispose()
+
+    def __pack(self, textures: dict) -> dict:
+        # Packing the tallest textures first gives a much flatter skyline, which wastes less space.
+        order = sorted(textures, key=lambda n: (textures[n].size.height, textures[n].size.width), reverse=True)
+        packers: list[_SkylinePacker] = []
+        placements = {}
+        for name in order:
+            size = textures[name].size
+            width, height = size.width + self.padding * 2, size.height + self.padding * 2
+            if width > self.page_size.width or height > self.page_size.height:
+                raise ValueError(f"'{name}' ({size.width}x{size.height}) is too big to fit in a "
+                                 f"{self.page_size.width}x{self.page_size.height} atlas page.")
+            for page, packer in enumerate(packers):
+                position = packer.insert(width, height)
+                if position is not None:
+                    break
+            else:
+                packers.append(_SkylinePacker(self.page_size.width, self.page_size.height))
+                page, position = len(packers) - 1, packers[-1].insert(width, height)
+            placements[name] = (page, position[0] + self.padding, position[1] + self.padding)
+
+        self.__pages = [Texture.custom(self.page_size.width, self.page_size.height) for _ in packers]
+        regions = {}
+        for name, (page, x, y) in placements.items():
+            texture = textures[name]
+            _prs.PGSUtils.CopyTexture(texture._texture, self.__pages[page]._texture, x, y)
+            regions[name] = TextureRegion(self.__pages[page], Rectangle(x, y, texture.size.width, texture.size.height))
+        return regions
+
+
+class _SkylinePacker:
+    # Packs rectangles into a fixed size area using the skyline bottom-left method. The skyline is a list of
+    # [x, y, width] segments describing the top edge of everything packed so far; each rectangle is placed where it
+    # rests lowest on the skyline.
+
+    def __init__(self, width: int, height: int):
+        self.width: int = width
+        self.height: int = height
+        self.__skyline: list = [[0, 0, width]]
+
+    def insert(self, width: int, height: int):
+        # Returns the (x, y) the rectangle was placed at, or None if it doesn't fit.
+        best = None
+        for index, segment in enumerate(self.__skyline):
+            y = self.__fit(index, width, height)
+            if y is not None and (best is None or (y + height, segment[0]) < best[0]):
+                best = ((y + height, segment[0]), index, segment[0], y)
+        if best is None:
+            return None
+        _, index, x, y = best
+        self.__add_segment(index, x, y + height, width)
+        return x, y
+
+    def __fit(self, index: int, width: int, height: int):
+        # Get the y the rectangle would rest at if its left side were placed at the start of the given segment.
+        if self.__skyline[index][0] + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        while remaining > 0:
+            segment = self.__skyline[index]
+            y = max(y, segment[1])
+            if y + height > self.height:
+                return None
+            remaining -= segment[2]
+            index += 1
+        return y
+
+    def __add_segment(self, index: int, x: int, y: int, width: int):
+        skyline = self.__skyline
+        skyline.insert(index, [x, y, width])
+        # Cut away whatever the new segment now covers.
+        i = index + 1
+        while i < len(skyline):
+            previous_end = skyline[i - 1][0] + skyline[i - 1][2]
+            if skyline[i][0] >= previous_end:
+                break
+            shrink = previous_end - skyline[i][0]
+            skyline[i][0] += shrink
+            skyline[i][2] -= shrink
+            if skyline[i][2] > 0:
+                break
+            del skyline[i]
+        # Merge neighbouring segments at the same height.
+        i = 0
+        while i < len(skyline) - 1:
+            if skyline[i][1] == skyline[i + 1][1]:
+                skyline[i][2] += skyline[i + 1][2]
+                del skyline[i + 1]
+            else:
+                i += 1
+
+
+# SpriteEffects.None can't be accessed from python, as None is a keyword.
+_NO_EFFECTS = _mgGraphics.SpriteEffects(0)
+
+
+class _SpriteVector2(Vector2):
+    # The position, origin or scale of a sprite. Changing it in any way marks the sprite as dirty, so its cached .NET
+    # values are rebuilt on the next draw.
+
+    __slots__ = ("__sprite",)
+
+    def __init__(self, sprite: 'SpriteBase', x: float, y: float):
+        object.__setattr__(self, "_SpriteVector2__sprite", sprite)
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        self.__sprite._dirty = True
+
+
+class _SpriteColor(Color):
+    # The color of a sprite, which marks the sprite as dirty when it's changed, like _SpriteVector2.
+
+    __slots__ = ("__sprite",)
+
+    def __init__(self, sprite: 'SpriteBase', color: Color):
+        object.__setattr__(self, "_SpriteColor__sprite", sprite)
+        object.__setattr__(self, "r", color.r)
+        object.__setattr__(self, "g", color.g)
+        object.__setattr__(self, "b", color.b)
+        object.__setattr__(self, "a", color.a)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        self.__sprite._dirty = True
+
+
+class SpriteBase(_abc.ABC):
+    """Represents the base class of a Sprite object. This includes all attributes a sprite will need barring Texture.
+    This class cannot be instantiated.
+
+    The .NET-side values a sprite is drawn with are cached, and are only rebuilt when one of its attributes changes,
+    so a sprite that doesn't move costs next to nothing to draw. The position, origin, scale and color belong to the
+    sprite: assigning one copies the values in, and changing one in place (sprite.position.x += 1) changes only this
+    sprite, and is seen on the next draw."""
+
+    @property
+    def position(self) -> Vector2:
+        return self.__position
+
+    @position.setter
+    def position(self, value: Vector2):
+        self.__position.set(value.x, value.y)
+
+    @property
+    def rotation(self) -> float:
+        return self.__rotation
+
+    @rotation.setter
+    def rotation(self, value: float):
+        self.__rotation = value
+        self._dirty = True
+
+    @property
+    def scale(self) -> Vector2:
+        return self.__scale
+
+    @scale.setter
+    def scale(self, value: Vector2):
+        self.__scale.set(value.x, value.y)
+
+    @property
+    def color(self) -> Color:
+        return self.__color
+
+    @color.setter
+    def color(self, value: Color):
+        self.__color.set(value.r, value.g, value.b, value.a)
+
+    @property
+    def origin(self) -> Vector2:
+        return self.__origin
+
+    @origin.setter
+    def origin(self, value: Vector2):
+        self.__origin.set(value.x, value.y)
+
+    def __init__(self):
+        self._dirty: bool = True
+        self.__draw_arguments: tuple = ()
+        self.__position: Vector2 = _SpriteVector2(self, 0, 0)
+        self.__rotation: float = 0
+        self.__scale: Vector2 = _SpriteVector2(self, 1, 1)
+        self.__color: Color = _SpriteColor(self, Colors.WHITE)
+        self.__origin: Vector2 = _SpriteVector2(self, 0, 0)
+
+    def _get_draw_arguments(self) -> tuple:
+        # Returns the cached (position, color, rotation, origin, scale) .NET values, rebuilding them first if anything
+        # has changed since they were built.
+        if self._dirty:
+            position, origin, scale = self.__position, self.__origin, self.__scale
+            self.__draw_arguments = (_mg.Vector2(float(position.x), float(position.y)), self.__color._to_mg_color(),
+                                     float(self.__rotation),
+                                     _mg.Vector2(float(origin.x), float(origin.y)),
+                                     _mg.Vector2(float(scale.x), float(scale.y)))
+            self._dirty = False
+        return self.__draw_arguments
+
+    @_abc.abstractmethod
+    def _draw(self, spriteBatch):
+        pass
+
+
+class Sprite(SpriteBase):
+    def __init__(self, texture: Texture, position: Vector2):
+        super().__init__()
+        self.texture: Texture = texture
+        self.position: Vector2 = position
+
+    @staticmethod
+    def from_sprite(sprite: 'Sprite'):
+        new_sprite = Sprite(sprite.texture, sprite.position)
         new_sprite.origin = sprite.origin
         new_sprite.color = sprite.color
         new_sprite.scale = sprite.scale
         new_sprite.rotation = sprite.rotation
         return new_sprite
 
+    @property
+    def bounds(self) -> Rectangle:
+        """
+        Get the area this sprite covers in the world, taking its origin, scale and rotation into account.
+        :return: The area this sprite covers.
+        """
+        left, top, right, bottom = _texture_bounds(self.texture, self.position, self.origin, self.scale, self.rotation)
+        return Rectangle(left, top, right - left, bottom - top)
+
     def _draw(self, spriteBatch):
-        spriteBatch.Draw(self.texture._texture, _mg.Vector2(float(self.position.x), float(self.position.y)), None,
-            _mg.Color(self.color.r, self.color.g, self.color.b, self.color.a), float(self.rotation),
-            _mg.Vector2(float(self.origin.x), float(self.origin.y)), _mg.Vector2(float(self.scale.x), float(self.scale.y)),
-            _mgGraphics.SpriteEffects(0), float(0))
+        position, color, rotation, origin, scale = self._get_draw_arguments()
+        self.texture._mark_drawn()
+        spriteBatch.Draw(self.texture._texture, position, self.texture._source_rectangle, color, rotation, origin, scale,
+                         _NO_EFFECTS, float(0))
+
+
+class ParticleEmitter:
+    """Emits and simulates many small textured particles, such as smoke, sparks or dust. Particles aren't Sprites:
+    every particle's state is kept in NumPy arrays, so they are all moved at once, and drawn with a single
+    SpriteDrawer.draw_many() call. This keeps even 100,000 live particles cheap.
+
+    Change the attributes after creating the emitter to set how the particles behave. Every range is a
+    (minimum, maximum) tuple, and each new particle gets a random value in that range."""
+
+    def __init__(self, texture: Texture, position: Vector2 = Vector2.zero(), max_particles: int = 10000):
+        """
+        Create a new ParticleEmitter.
+        :param texture: The Texture (or TextureRegion) every particle is drawn with.
+        :param position: The position new particles are emitted from.
+        :param max_particles: The most particles that can be alive at once. New particles are not emitted past this.
+        """
+        self.texture = texture
+        self.position: Vector2 = position.copy()
+        self.max_particles: int = max_particles
+        # The number of particles emitted every second by update().
+        self.emission_rate: float = 0
+        # The lifetime of each particle, in seconds.
+        self.life: tuple = (1, 1)
+        # The speed, in pixels per second, and the direction, in radians, particles are emitted with.
+        self.speed: tuple = (50, 100)
+        self.direction: tuple = (0, 2 * _math.pi)
+        # The acceleration applied to every particle, in pixels per second per second.
+        self.gravity: Vector2 = Vector2.zero()
+        self.rotation: tuple = (0, 0)
+        # The rotation speed, in radians per second.
+        self.angular_velocity: tuple = (0, 0)
+        # Particles fade from the start to the end color, and scale from the start to the end scale, over their life.
+        self.start_color: Color = Colors.WHITE
+        self.end_color: Color = Colors.WHITE
+        self.start_scale: float = 1
+        self.end_scale: float = 1
+
+        self.__random = _np.random.default_rng()
+        self.__count: int = 0
+        self.__to_emit: float = 0
+        self.__positions = _np.zeros((max_particles, 2), _np.float32)
+        self.__velocities = _np.zeros((max_particles, 2), _np.float32)
+        self.__rotations = _np.zeros(max_particles, _np.float32)
+        self.__angular_velocities = _np.zeros(max_particles, _np.float32)
+        self.__life = _np.zeros(max_particles, _np.float32)
+        self.__max_life = _np.ones(max_particles, _np.float32)
+        self.__scales = _np.zeros((max_particles, 2), _np.float32)
+        self.__colors = _np.zeros(max_particles, _np.uint32)
+        self.__origins = _np.zeros((max_particles, 2), _np.float32)
+
+    @property
+    def count(self) -> int:
+        """
+        Get the number of live particles.
+        :return: The number of live particles.
+        """
+        return self.__count
+
+    def emit(self, count: int):
+        """
+        Emit a number of particles at once, such as for an explosion.
+        :param count: The number of particles to emit.
+        """
+        start = self.__count
+        count = min(int(count), self.max_particles - start)
+        if count <= 0:
+            return
+        end = start + count
+        uniform = self.__random.uniform
+        speed = uniform(self.speed[0], self.speed[1], count)
+        direction = uniform(self.direction[0], self.direction[1], count)
+        self.__positions[start:end] = (self.position.x, self.position.y)
+        self.__velocities[start:end, 0] = _np.cos(direction) * speed
+        self.__velocities[start:end, 1] = _np.sin(direction) * speed
+        self.__rotations[start:end] = uniform(self.rotation[0], self.rotation[1], count)
+        self.__angular_velocities[start:end] = uniform(self.angular_velocity[0], self.angular_velocity[1], count)
+        self.__max_life[start:end] = uniform(self.life[0], self.life[1], count)
+        self.__life[start:end] = self.__max_life[start:end]
+        self.__count = end
+
+    def update(self, delta_time: float = None):
+        """
+        Emit new particles, move every particle, and remove the ones that have reached the end of their life.
+        :param delta_time: The time, in seconds, to move forward by. Defaults to the time since the last frame.
+        """
+        if delta_time is None:
+            delta_time = Time.delta_time()
+        self.__to_emit += self.emission_rate * delta_time
+        if self.__to_emit >= 1:
+            self.emit(int(self.__to_emit))
+            self.__to_emit -= int(self.__to_emit)
+
+        count = self.__count
+        if count == 0:
+            return
+        velocities = self.__velocities[:count]
+        velocities += (self.gravity.x * delta_time, self.gravity.y * delta_time)
+        self.__positions[:count] += velocities * delta_time
+        self.__rotations[:count] += self.__angular_velocities[:count] * delta_time
+        life = self.__life[:count]
+        life -= delta_time
+
+        alive = life > 0
+        if not alive.all():
+            # Keep the live particles packed together at the start of the arrays.
+            alive_count = int(alive.sum())
+            for array in (self.__positions, self.__velocities, self.__rotations, self.__angular_velocities,
+                          self.__life, self.__max_life):
+                array[:alive_count] = array[:count][alive]
+            self.__count = alive_count
+
+    def clear(self):
+        """
+        Remove every particle.
+        """
+        self.__count = 0
+
+    def draw(self, sprite_drawer: 'SpriteDrawer'):
+        """
+        Draw every live particle. This must be called between SpriteDrawer.start() and end().
+        :param sprite_drawer: The SpriteDrawer to draw with.
+        """
+        count = self.__count
+        if count == 0:
+            return
+        # How far through its life each particle is, from 0 to 1.
+        age = 1 - self.__life[:count] / self.__max_life[:count]
+        scales = self.__scales[:count]
+        scales[:, 0] = self.start_scale + (self.end_scale - self.start_scale) * age
+        scales[:, 1] = scales[:, 0]
+        start = _np.array((self.start_color.r, self.start_color.g, self.start_color.b, self.start_color.a), _np.float32)
+        end = _np.array((self.end_color.r, self.end_color.g, self.end_color.b, self.end_color.a), _np.float32)
+        channels = (start + (end - start) * age[:, None]).astype(_np.uint32)
+        colors = self.__colors[:count]
+        colors[:] = channels[:, 0] | channels[:, 1] << 8 | channels[:, 2] << 16 | channels[:, 3] << 24
+        size = self.texture.size
+        origins = self.__origins[:count]
+        origins[:] = (size.width / 2, size.height / 2)
+        sprite_drawer.draw_many(self.texture, self.__positions[:count], origins, scales, self.__rotations[:count],
+                                colors)
+
 
 class PixelMode(_enum):
     """Set the pixel mode for the SpriteDrawer to draw with."""
@@ -541,19 +2054,60 @@ class PixelMode(_enum):
     Clamp = 1
 
 class SpriteDrawer:
+    __STATIC_CHUNK_SIZE = 1024
+
     def __init__(self):
         self.__spriteBatch = _mgGraphics.SpriteBatch(_GameBackend.graphics_device)
         self.__statics: dict = {}
         self.__dynamics: dict = {}
         self.__begin: bool = False
+        # Statics are compiled in chunks of the world, so that only the chunks on screen are drawn, and adding or
+        # removing a static only rebuilds the chunk it's in.
+        self.__static_index = SpatialIndex()
+        self.__static_chunks: dict = {}
+        self.__chunk_statics: dict = {}
+        self.__chunk_of_static: dict = {}
+        self.__chunk_index = SpatialIndex(SpriteDrawer.__STATIC_CHUNK_SIZE)
+        self.__changed_chunks: set = set()
+        self.__uncompiled_statics: dict = {}
+        self.__view = None
+        self.__culled_draws: int = 0
+
+    @property
+    def view_rectangle(self) -> Rectangle:
+        """
+        Get the part of the world that is visible on screen, if culling was enabled in start(), otherwise None.
+        :return: The visible area, in world coordinates.
+        """
+        return self.__view
+
+    @property
+    def culled_draws(self) -> int:
+        """
+        Get how many draw_texture() and draw_sprite() calls have been skipped since start(), because they were entirely
+        off screen.
+        :return: The number of culled draws.
+        """
+        return self.__culled_draws
 
-    def start(self, transform_matrix: Matrix = Matrix.identity(), pixel_mode: PixelMode = PixelMode.Linear):
+    def start(self, transform_matrix: Matrix = Matrix.identity(), pixel_mode: PixelMode = PixelMode.Linear,
+              cull: bool = False):
+        """
+        Start drawing.
+        :param transform_matrix: The transformation (usually the camera) to draw with.
+        :param pixel_mode: The pixel mode to draw with.
+        :param cull: If true, draw_texture() and draw_sprite() calls that would be entirely off screen are skipped.
+        """
         if self.__begin:
             raise DrawError("You must call 'end()' first, before you can call 'start()' again.")
         self.__spriteBatch.Begin(_mgGraphics.SpriteSortMode.Deferred, None,
                                  _mgGraphics.SamplerState.LinearClamp if pixel_mode == PixelMode.Linear else _mgGraphics.SamplerState.PointClamp,
                                  None, None, None, transform_matrix._to_mg_matrix());
         self.__begin = True
+        self.__culled_draws = 0
+        self.__view = None
+        if cull:
+            self.__view = _view_rectangle(transform_matrix)
 
     def end(self):
         if not self.__begin:
@@ -561,58 +2115,980 @@ class SpriteDrawer:
         self.__spriteBatch.End();
         self.__begin = False
 
+    def __is_culled(self, texture, position: Vector2, origin: Vector2, scale: Vector2, rotation: float) -> bool:
+        # Check whether the texture, drawn with the given values, would be entirely outside the view.
+        left, top, right, bottom = _texture_bounds(texture, position, origin, scale, rotation)
+        view = self.__view
+        if right < view.x or left > view.x + view.width or bottom < view.y or top > view.y + view.height:
+            self.__culled_draws += 1
+            return True
+        return False
+
     def draw_texture(self, texture: Texture, position: Vector2, color: Color = Colors.WHITE, origin: Vector2 = Vector2.zero(),
                     scale: Vector2 = Vector2.one(), rotation: float = 0, flipped: bool = False):
         if not self.__begin:
             raise DrawError("You must call 'start()' before you can draw to the screen.")
-        self.__spriteBatch.Draw(texture._texture, _mg.Vector2(float(position.x), float(position.y)), None,
-            _mg.Color(color.r, color.g, color.b, color.a), float(rotation), _mg.Vector2(float(origin.x), float(origin.y)),
+        if self.__view is not None and self.__is_culled(texture, position, origin, scale, rotation):
+            return
+        texture._mark_drawn()
+        self.__spriteBatch.Draw(texture._texture, _mg.Vector2(float(position.x), float(position.y)), texture._source_rectangle,
+            color._to_mg_color(), float(rotation), _mg.Vector2(float(origin.x), float(origin.y)),
             _mg.Vector2(float(scale.x), float(scale.y)), _mgGraphics.SpriteEffects(0), float(0))
 
     def draw_sprite(self, sprite: SpriteBase):
         if not self.__begin:
             raise DrawError("You must call 'start()' before you can draw to the screen.")
+        if self.__view is not None and isinstance(sprite, Sprite) and \
+                self.__is_culled(sprite.texture, sprite.position, sprite.origin, sprite.scale, sprite.rotation):
+            return
         sprite._draw(self.__spriteBatch)
 
+    def draw_many(self, textures, positions, origins=None, scales=None, rotations=None, colors=None,
+                  texture_indices=None):
+        """
+        Draw many textures at once. All the data is handed to the backend in a single call, rather than one call per
+        texture, which makes this much faster than calling draw_texture() in a loop when drawing thousands of things.
+        Every array can be a list, a NumPy array, or anything else NumPy can read, and the (x, y) pair arrays can also be
+        Vector2Arrays.
+        :param textures: The Texture (or TextureRegion) to draw, or a list of them that texture_indices picks from.
+        :param positions: The positions to draw at, as packed (x, y) float pairs.
+        :param origins: The origins, as packed (x, y) float pairs. Defaults to (0, 0) for every texture.
+        :param scales: The scales, as packed (x, y) float pairs. Defaults to (1, 1) for every texture.
+        :param rotations: The rotations in radians, one float per texture. Defaults to 0.
+        :param colors: The colors, one packed 32-bit integer per texture (see Color.packed_value). Defaults to white.
+        :param texture_indices: The index into textures to draw for each position. Defaults to 0.
+        """
+        if not self.__begin:
+            raise DrawError("You must call 'start()' before you can draw to the screen.")
+        if isinstance(textures, (Texture, TextureRegion)):
+            textures = [textures]
+        positions = _packed_array(positions, _np.float32)
+        if len(positions) % 2 != 0:
+            raise ValueError("Positions must be given as (x, y) pairs.")
+        count = len(positions) // 2
+        if count == 0:
+            return
+        origins = _packed_array(origins, _np.float32, count * 2, "origins")
+        scales = _packed_array(scales, _np.float32, count * 2, "scales")
+        rotations = _packed_array(rotations, _np.float32, count, "rotations")
+        colors = _packed_array(colors, _np.uint32, count, "colors")
+        texture_indices = _packed_array(texture_indices, _np.int32, count, "texture_indices")
+        if texture_indices is not None and (texture_indices.min() < 0 or texture_indices.max() >= len(textures)):
+            raise IndexError("A texture index is out of range of the given textures.")
+        sources = None
+        if any(texture._source_rectangle is not None for texture in textures):
+            # A width of 0 tells DrawMany to draw the whole texture.
+            sources = _np.zeros((len(textures), 4), _np.int32)
+            for i, texture in enumerate(textures):
+                if isinstance(texture, TextureRegion):
+                    source = texture.source
+                    sources[i] = (source.x, source.y, source.width, source.height)
+        for texture in textures:
+            texture._mark_drawn()
+        _prs.PGSUtils.DrawMany(self.__spriteBatch, [texture._texture for texture in textures], _pointer(sources),
+                               _pointer(positions), _pointer(origins), _pointer(scales), _pointer(rotations),
+                               _pointer(colors), _pointer(texture_indices), count)
+
     def draw_text(self, font_name: str, font_size: int, text: str, position: Vector2, color: Color = Colors.WHITE, origin: Vector2 = Vector2.zero()):
         _FontManager.get_font(font_name, font_size).DrawText(self.__spriteBatch, text,
                                                              _mg.Vector2(float(position.x), float(position.y)),
-                                                             _mg.Color(color.r, color.g, color.b, color.a),
+                                                             color._to_mg_color(),
                                                              _mg.Vector2.One, 0.0, _mg.Vector2(float(origin.x), float(origin.y)))
 
+    @property
+    def static_index(self) -> SpatialIndex:
+        """
+        Get the SpatialIndex of the names of every static Sprite by its bounds, which can be used to find statics by
+        where they are (such as the one under the mouse) without checking all of them. It must not be changed directly.
+        :return: The SpatialIndex of the statics.
+        """
+        return self.__static_index
+
     def add_static(self, sprite_name: str, sprite: SpriteBase):
+        """
+        Add a sprite that never changes. Statics are compiled into buffers that stay on the GPU, so they cost almost
+        nothing to draw, however many there are. If a static is changed after it's added, call update_statics().
+        :param sprite_name: The name of the static.
+        :param sprite: The sprite.
+        """
+        if sprite_name in self.__statics:
+            self.delete_static(sprite_name)
         self.__statics[sprite_name] = sprite
+        if not isinstance(sprite, Sprite):
+            # Sprites that aren't a plain Sprite draw themselves, so they can't be compiled, and still go through
+            # the SpriteBatch.
+            self.__uncompiled_statics[sprite_name] = sprite
+            return
+        bounds = sprite.bounds
+        self.__static_index.insert(sprite_name, bounds)
+        size = SpriteDrawer.__STATIC_CHUNK_SIZE
+        chunk = (_math.floor((bounds.x + bounds.width / 2) / size), _math.floor((bounds.y + bounds.height / 2) / size))
+        self.__chunk_statics.setdefault(chunk, {})[sprite_name] = sprite
+        self.__chunk_of_static[sprite_name] = chunk
+        self.__changed_chunks.add(chunk)
 
     def get_static(self, sprite_name: str):
         return self.__statics[sprite_name]
 
     def delete_static(self, sprite_name: str):
         self.__statics.pop(sprite_name)
+        if sprite_name in self.__uncompiled_statics:
+            self.__uncompiled_statics.pop(sprite_name)
+            return
+        self.__static_index.remove(sprite_name)
+        chunk = self.__chunk_of_static.pop(sprite_name)
+        self.__chunk_statics[chunk].pop(sprite_name)
+        self.__changed_chunks.add(chunk)
+
+    def update_statics(self):
+        """
+        Rebuild the static buffers on the next draw_statics(). Only needed if a static was changed after being added.
+        """
+        statics = list(self.__statics.items())
+        for sprite_name, _ in statics:
+            self.delete_static(sprite_name)
+        for sprite_name, sprite in statics:
+            self.add_static(sprite_name, sprite)
 
-    def draw_statics(self, transform_matrix: Matrix = Matrix.identity()):
+    def draw_statics(self, transform_matrix: Matrix = Matrix.identity(), pixel_mode: PixelMode = PixelMode.Linear):
+        """
+        Draw every static sprite that is on screen. Statics are drawn grouped by texture, so where statics using
+        different textures overlap, the texture added first is drawn underneath.
+        :param transform_matrix: The transformation (usually the camera) to draw the statics with.
+        :param pixel_mode: The pixel mode to draw with.
+        """
         if (self.__begin):
             raise DrawError("Static sprite drawing must occur seperately to regular sprite drawing.")
-        # TODO: Fix whatever weird transparency issues is going on
-        self.__spriteBatch.Begin(_mgGraphics.SpriteSortMode.Deferred, None, None, None, None, None, transform_matrix._to_mg_matrix())
-        for sprite in self.__statics:
-            self.__statics[sprite]._draw(self.__spriteBatch)
-        self.__spriteBatch.End()
+        if self.__changed_chunks:
+            self.__build_chunks()
+        if self.__static_chunks:
+            for chunk in sorted(self.__chunk_index.query(_view_rectangle(transform_matrix))):
+                self.__static_chunks[chunk].draw(transform_matrix, pixel_mode)
+        if self.__uncompiled_statics:
+            self.__spriteBatch.Begin(_mgGraphics.SpriteSortMode.Deferred, None, None, None, None, None,
+                                     transform_matrix._to_mg_matrix())
+            for sprite in self.__uncompiled_statics.values():
+                sprite._draw(self.__spriteBatch)
+            self.__spriteBatch.End()
+
+    def __build_chunks(self):
+        for chunk in self.__changed_chunks:
+            statics = self.__chunk_statics.get(chunk)
+            if not statics:
+                # The chunk is now empty.
+                self.__chunk_statics.pop(chunk, None)
+                if chunk in self.__static_chunks:
+                    self.__static_chunks.pop(chunk).dispose()
+                    self.__chunk_index.remove(chunk)
+                continue
+            if chunk not in self.__static_chunks:
+                self.__static_chunks[chunk] = _StaticBatch()
+            self.__static_chunks[chunk].build(list(statics.values()))
+            # Statics are put into the chunk their center is in, but can stick out of it, so the chunk covers the
+            # bounds of all of them.
+            edges = [self.__static_index.get_bounds(name) for name in statics]
+            left, top = min(bounds.x for bounds in edges), min(bounds.y for bounds in edges)
+            bounds = Rectangle(left, top, max(bounds.right for bounds in edges) - left,
+                               max(bounds.bottom for bounds in edges) - top)
+            if chunk in self.__chunk_index:
+                self.__chunk_index.move(chunk, bounds)
+            else:
+                self.__chunk_index.insert(chunk, bounds)
+        self.__changed_chunks.clear()
 
     def draw_render_target(self, render_target: 'RenderTarget', position: Vector2, color: Color = Colors.WHITE, origin: Vector2 = Vector2.zero(),
                     scale: Vector2 = Vector2.one(), rotation: float = 0,):
         self.__spriteBatch.Draw(render_target._framebuffer, _mg.Vector2(float(position.x), float(position.y)), None,
-            _mg.Color(color.r, color.g, color.b, color.a), float(rotation), _mg.Vector2(float(origin.x), float(origin.y)),
+            color._to_mg_color(), float(rotation), _mg.Vector2(float(origin.x), float(origin.y)),
             _mg.Vector2(float(scale.x), float(scale.y)), _mgGraphics.SpriteEffects(0), float(0))
 
+class ShapeDrawer:
+    """Draws rectangles, lines, circles and polygons with a SpriteDrawer. Every shape is made of stretched and rotated
+    copies of one shared white pixel, so shapes cost no textures of their own and are batched together with the
+    sprites drawn around them. Shapes with many parts (outlines, circles and polygons) are drawn with one
+    SpriteDrawer.draw_many() call each.
+
+    Like the SpriteDrawer, shapes can only be drawn between SpriteDrawer.start() and end()."""
+
+    __pixel = None
+
+    def __init__(self, sprite_drawer: 'SpriteDrawer'):
+        """
+        Create a new ShapeDrawer.
+        :param sprite_drawer: The SpriteDrawer to draw the shapes with.
+        """
+        self.sprite_drawer: SpriteDrawer = sprite_drawer
+        if ShapeDrawer.__pixel is None:
+            ShapeDrawer.__pixel = Texture.custom(1, 1)
+            ShapeDrawer.__pixel.set_pixels(b"\xff\xff\xff\xff")
+
+    def fill_rectangle(self, rectangle: Rectangle, color: Color, rotation: float = 0, origin: Vector2 = Vector2.zero()):
+        """
+        Draw a filled rectangle.
+        :param rectangle: The rectangle to fill.
+        :param color: The color of the rectangle.
+        :param rotation: The rotation of the rectangle, in radians, around its origin.
+        :param origin: The point, relative to the top left of the rectangle, that it's positioned and rotated around.
+        """
+        if rectangle.width <= 0 or rectangle.height <= 0:
+            return
+        self.sprite_drawer.draw_texture(ShapeDrawer.__pixel, Vector2(rectangle.x, rectangle.y), color,
+                                        Vector2(origin.x / rectangle.width, origin.y / rectangle.height),
+                                        Vector2(rectangle.width, rectangle.height), rotation)
+
+    def draw_rectangle(self, rectangle: Rectangle, color: Color, thickness: float = 1, rotation: float = 0,
+                       origin: Vector2 = Vector2.zero()):
+        """
+        Draw the outline of a rectangle. The outline is drawn inside the rectangle.
+        :param rectangle: The rectangle to outline.
+        :param color: The color of the outline.
+        :param thickness: The thickness of the outline.
+        :param rotation: The rotation of the rectangle, in radians, around its origin.
+        :param origin: The point, relative to the top left of the rectangle, that it's positioned and rotated around.
+        """
+        width, height = rectangle.width, rectangle.height
+        thickness = min(thickness, width / 2, height / 2)
+        if thickness <= 0:
+            return
+        # The top and bottom edges span the whole width, and the sides fit between them. Four edges are drawn with
+        # draw_texture() rather than draw_many(), so the UI's rectangles don't depend on PGSUtils.DrawMany.
+        edges = ((0, 0, width, thickness),
+                 (0, height - thickness, width, thickness),
+                 (0, thickness, thickness, height - thickness * 2),
+                 (width - thickness, thickness, thickness, height - thickness * 2))
+        cos, sin = _math.cos(rotation), _math.sin(rotation)
+        for x, y, edge_width, edge_height in edges:
+            x, y = x - origin.x, y - origin.y
+            self.sprite_drawer.draw_texture(ShapeDrawer.__pixel, Vector2(x * cos - y * sin + rectangle.x,
+                                                                         x * sin + y * cos + rectangle.y),
+                                            color, Vector2.zero(), Vector2(edge_width, edge_height), rotation)
+
+    def draw_line(self, start: Vector2, end: Vector2, color: Color, thickness: float = 1):
+        """
+        Draw a straight line.
+        :param start: The point the line starts at.
+        :param end: The point the line ends at.
+        :param color: The color of the line.
+        :param thickness: The thickness of the line.
+        """
+        x, y = end.x - start.x, end.y - start.y
+        self.sprite_drawer.draw_texture(ShapeDrawer.__pixel, start, color, Vector2(0, 0.5),
+                                        Vector2(_math.sqrt(x * x + y * y), thickness), _math.atan2(y, x))
+
+    def draw_lines(self, points, color: Color, thickness: float = 1, closed: bool = False):
+        """
+        Draw lines joining each point to the next.
+        :param points: The points, as a list of Vector2s, a Vector2Array, or anything NumPy can turn into (x, y) pairs.
+        :param color: The color of the lines.
+        :param thickness: The thickness of the lines.
+        :param closed: Whether to also join the last point back to the first.
+        """
+        points = _points_array(points)
+        if closed and len(points) > 2:
+            points = _np.concatenate((points, points[:1]))
+        if len(points) < 2:
+            return
+        deltas = points[1:] - points[:-1]
+        lengths = _np.hypot(deltas[:, 0], deltas[:, 1])
+        scales = _np.column_stack((lengths, _np.full(len(lengths), thickness, _np.float32)))
+        origins = _np.zeros((len(lengths), 2), _np.float32)
+        origins[:, 1] = 0.5
+        self.__draw_pixels(points[:-1], scales, _np.arctan2(deltas[:, 1], deltas[:, 0]), color, origins)
+
+    def draw_circle(self, center: Vector2, radius: float, color: Color, thickness: float = 1, segments: int = None):
+        """
+        Draw the outline of a circle. The outline is drawn inside the circle.
+        :param center: The center of the circle.
+        :param radius: The radius of the circle.
+        :param color: The color of the outline.
+        :param thickness: The thickness of the outline.
+        :param segments: The number of straight lines the circle is made of. Defaults to enough for it to look round.
+        """
+        segments = segments or _circle_segments(radius)
+        angles = _np.linspace(0, _math.tau, segments, endpoint=False)
+        radius -= thickness / 2
+        points = _np.column_stack((center.x + _np.cos(angles) * radius, center.y + _np.sin(angles) * radius))
+        self.draw_lines(points, color, thickness, True)
+
+    def fill_circle(self, center: Vector2, radius: float, color: Color):
+        """
+        Draw a filled circle.
+        :param center: The center of the circle.
+        :param radius: The radius of the circle.
+        :param color: The color of the circle.
+        """
+        if radius <= 0:
+            return
+        # The circle is filled with one pixel high row for every row of pixels it covers.
+        rows = _np.arange(_math.ceil(radius * 2), dtype=_np.float32)
+        offsets = _np.minimum(rows + 0.5 - radius, radius)
+        half_widths = _np.sqrt(_np.maximum(radius * radius - offsets * offsets, 0))
+        positions = _np.column_stack((center.x - half_widths, center.y - radius + rows))
+        scales = _np.column_stack((half_widths * 2, _np.minimum(radius * 2 - rows, 1)))
+        self.__draw_pixels(positions, scales, None, color)
+
+    def draw_polygon(self, points, color: Color, thickness: float = 1):
+        """
+        Draw the outline of a polygon.
+        :param points: The corners of the polygon, as a list of Vector2s, a Vector2Array, or anything NumPy can turn
+        into (x, y) pairs.
+        :param color: The color of the outline.
+        :param thickness: The thickness of the outline.
+        """
+        self.draw_lines(points, color, thickness, True)
+
+    def fill_polygon(self, points, color: Color):
+        """
+        Draw a filled polygon. The polygon doesn't have to be convex; where its edges cross, the even-odd rule decides
+        what's inside.
+        :param points: The corners of the polygon, as a list of Vector2s, a Vector2Array, or anything NumPy can turn
+        into (x, y) pairs.
+        :param color: The color of the polygon.
+        """
+        points = _points_array(points)
+        if len(points) < 3:
+            return
+        # Fill the polygon one row of pixels at a time: find where the middle of each row crosses the edges, and fill
+        # between each pair of crossings.
+        rows = _np.arange(_math.floor(points[:, 1].min()), _math.ceil(points[:, 1].max()), dtype=_np.float32)[:, None] + 0.5
+        starts, ends = points, _np.roll(points, -1, axis=0)
+        crosses = (starts[:, 1] <= rows) != (ends[:, 1] <= rows)
+        with _np.errstate(divide="ignore", invalid="ignore"):
+            xs = starts[:, 0] + (rows - starts[:, 1]) * (ends[:, 0] - starts[:, 0]) / (ends[:, 1] - starts[:, 1])
+        xs = _np.sort(_np.where(crosses, xs, _np.nan), axis=1)
+        lefts, rights = xs[:, 0::2], xs[:, 1::2]
+        if rights.shape[1] < lefts.shape[1]:
+            lefts = lefts[:, :rights.shape[1]]
+        spans = ~_np.isnan(rights)
+        row_of_span = _np.broadcast_to(rows - 0.5, lefts.shape)[spans]
+        positions = _np.column_stack((lefts[spans], row_of_span))
+        scales = _np.column_stack((rights[spans] - lefts[spans], _np.ones(len(row_of_span), _np.float32)))
+        self.__draw_pixels(positions, scales, None, color)
+
+    def __draw_pixels(self, positions, scales, rotations, color: Color, origins=None):
+        if len(positions) == 0:
+            return
+        colors = _np.full(len(positions), color.packed_value, _np.uint32)
+        self.sprite_drawer.draw_many(ShapeDrawer.__pixel, positions, origins, scales, rotations, colors)
+
+
+class Mesh:
+    """A mesh of triangles, for drawing anything that isn't a rectangle of texture: trails, terrain strips, deformed
+    sprites or debug geometry. The vertices and indices are kept in NumPy arrays and uploaded once to dynamic buffers
+    on the GPU. Changing part of the mesh with set_vertices() or set_indices() only uploads the changed range again, on
+    the next draw, so meshes of thousands of vertices can be reshaped every frame and still be drawn in one call.
+
+    Draw the mesh with draw(), outside of SpriteDrawer.start() and end(), like SpriteDrawer.draw_statics()."""
+
+    __pixel = None
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        Get the number of vertices in the mesh.
+        """
+        return len(self.__vertices)
+
+    @property
+    def index_count(self) -> int:
+        """
+        Get the number of indices in the mesh, three per triangle.
+        """
+        return len(self.__indices)
+
+    @property
+    def positions(self) -> _np.ndarray:
+        """
+        Get a read only view of the vertex positions, as a NumPy array of shape (vertex_count, 2). Use set_vertices()
+        to change them.
+        """
+        view = self.__vertices["position"][:, :2]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def indices(self) -> _np.ndarray:
+        """
+        Get a read only view of the indices, as a NumPy array. Use set_indices() to change them.
+        """
+        view = self.__indices.view()
+        view.flags.writeable = False
+        return view
+
+    def __init__(self, positions, indices, texture_coordinates=None, colors=None):
+        """
+        Create a new Mesh. The number of vertices and indices is fixed, but draw() can draw fewer triangles than the
+        mesh holds, so a mesh that grows (like a trail) can be made at its biggest size.
+        :param positions: The position of each vertex, as an (x, y) array (shape (vertex_count, 2)) or a Vector2Array.
+        :param indices: The vertices of each triangle, three indices per triangle.
+        :param texture_coordinates: The (u, v) texture coordinates of each vertex, from 0 to 1 across the texture.
+        Defaults to (0, 0).
+        :param colors: The color each vertex is tinted with: either one Color for every vertex or one packed 32-bit
+        integer per vertex (see Color.packed_value). Defaults to white.
+        """
+        positions = _packed_array(positions, _np.float32)
+        if len(positions) == 0 or len(positions) % 2:
+            raise ValueError("A mesh needs at least one vertex, with an x and a y for each.")
+        self.__vertices = _np.zeros(len(positions) // 2, _STATIC_VERTEX)
+        self.__vertices["position"][:, :2] = positions.reshape(-1, 2)
+        if texture_coordinates is not None:
+            self.__vertices["texture_coordinates"] = _packed_array(texture_coordinates, _np.float32,
+                                                                   self.vertex_count * 2,
+                                                                   "texture_coordinates").reshape(-1, 2)
+        if isinstance(colors, Color):
+            self.__vertices["color"] = colors.packed_value
+        elif colors is not None:
+            self.__vertices["color"] = _packed_array(colors, _np.uint32, self.vertex_count, "colors")
+        else:
+            self.__vertices["color"] = Colors.WHITE.packed_value
+        # 16 bit indices are supported by every graphics profile, so they're used whenever they can reach every vertex.
+        self.__indices = _mesh_indices(indices, self.vertex_count,
+                                       _np.uint16 if self.vertex_count <= 65536 else _np.int32)
+        if len(self.__indices) == 0 or len(self.__indices) % 3:
+            raise ValueError("A mesh needs at least one triangle, with three indices for each.")
+
+        device = _GameBackend.graphics_device
+        self.__vertex_buffer = _mgGraphics.DynamicVertexBuffer(device,
+                                                               _mgGraphics.VertexPositionColorTexture.VertexDeclaration,
+                                                               self.vertex_count, _mgGraphics.BufferUsage.WriteOnly)
+        index_size = _mgGraphics.IndexElementSize.SixteenBits if self.__indices.dtype == _np.uint16 else \
+            _mgGraphics.IndexElementSize.ThirtyTwoBits
+        self.__index_buffer = _mgGraphics.DynamicIndexBuffer(device, index_size, self.index_count,
+                                                             _mgGraphics.BufferUsage.WriteOnly)
+        self.__changed_vertices: tuple = (0, self.vertex_count)
+        self.__changed_indices: tuple = (0, self.index_count)
+        if Mesh.__pixel is None:
+            Mesh.__pixel = Texture.custom(1, 1)
+            Mesh.__pixel.set_pixels(b"\xff\xff\xff\xff")
+
+    def set_vertices(self, start: int, positions=None, texture_coordinates=None, colors=None):
+        """
+        Change a range of vertices. Only the given arrays are changed, and they must all be the same length. The range
+        is uploaded to the GPU on the next draw.
+        :param start: The index of the first vertex to change.
+        :param positions: The new (x, y) positions, or None to keep the current ones.
+        :param texture_coordinates: The new (u, v) texture coordinates, or None to keep the current ones.
+        :param colors: The new colors, one packed 32-bit integer per vertex (see Color.packed_value), or None to keep
+        the current ones.
+        """
+        positions = _packed_array(positions, _np.float32)
+        texture_coordinates = _packed_array(texture_coordinates, _np.float32)
+        colors = _packed_array(colors, _np.uint32)
+        counts = {len(array) // width for array, width in ((positions, 2), (texture_coordinates, 2), (colors, 1))
+                  if array is not None}
+        if len(counts) > 1:
+            raise ValueError("The positions, texture coordinates and colors must be for the same number of vertices.")
+        count = counts.pop() if counts else 0
+        if count == 0:
+            return
+        if start < 0 or start + count > self.vertex_count:
+            raise IndexError("The vertices go outside of the mesh.")
+        vertices = self.__vertices[start:start + count]
+        if positions is not None:
+            vertices["position"][:, :2] = positions.reshape(-1, 2)
+        if texture_coordinates is not None:
+            vertices["texture_coordinates"] = texture_coordinates.reshape(-1, 2)
+        if colors is not None:
+            vertices["color"] = colors
+        self.__changed_vertices = _changed_range(self.__changed_vertices, start, start + count)
+
+    def set_indices(self, start: int, indices):
+        """
+        Change a range of indices. The range is uploaded to the GPU on the next draw.
+        :param start: The position of the first index to change.
+        :param indices: The new indices.
+        """
+        indices = _mesh_indices(indices, self.vertex_count, self.__indices.dtype)
+        if start < 0 or start + len(indices) > self.index_count:
+            raise IndexError("The indices go outside of the mesh.")
+        self.__indices[start:start + len(indices)] = indices
+        self.__changed_indices = _changed_range(self.__changed_indices, start, start + len(indices))
+
+    def draw(self, transform_matrix: Matrix = Matrix.identity(), texture=None,
+             pixel_mode: PixelMode = PixelMode.Linear, triangle_count: int = None):
+        """
+        Draw the mesh, uploading whatever has changed since it was last drawn first.
+        :param transform_matrix: The transformation (usually the camera) to draw the mesh with.
+        :param texture: The Texture or TextureRegion to draw the mesh with. The texture coordinates always cover the
+        whole Texture, so those of a TextureRegion are across its atlas page. Defaults to plain white, so the mesh is
+        drawn in its vertex colors.
+        :param pixel_mode: The pixel mode to draw with.
+        :param triangle_count: The number of triangles to draw, from the start of the indices. Defaults to all of them.
+        """
+        if self.__vertex_buffer.IsContentLost or self.__index_buffer.IsContentLost:
+            # The graphics device was reset, which empties dynamic buffers.
+            self.__changed_vertices = (0, self.vertex_count)
+            self.__changed_indices = (0, self.index_count)
+        if self.__changed_vertices is not None:
+            first, end = self.__changed_vertices
+            _prs.PGSUtils.SetVertices(self.__vertex_buffer, _pointer(self.__vertices[first:end]), first, end - first)
+            self.__changed_vertices = None
+        if self.__changed_indices is not None:
+            first, end = self.__changed_indices
+            _prs.PGSUtils.SetIndices(self.__index_buffer, _pointer(self.__indices[first:end]), first, end - first)
+            self.__changed_indices = None
+
+        triangles = self.index_count // 3 if triangle_count is None else min(triangle_count, self.index_count // 3)
+        if triangles <= 0:
+            return
+        texture = Mesh.__pixel if texture is None else texture
+        texture._mark_drawn()
+        effect = _StaticBatch._get_effect(transform_matrix)
+        effect.Texture = texture._texture
+        _prs.PGSUtils.DrawTriangles(_GameBackend.graphics_device, effect, self.__vertex_buffer, self.__index_buffer, 0,
+                                    triangles, _StaticBatch._get_sampler(pixel_mode))
+
+    def dispose(self):
+        """
+        Free the buffers of the mesh. It can't be drawn afterwards.
+        """
+        self.__vertex_buffer.Dispose()
+        self.__index_buffer.Dispose()
+
+
+class StaticQuads:
+    """Rectangles of texture that are built once and drawn many times, such as the chunks of a TileMap. They are
+    compiled into vertex buffers that stay on the GPU, so drawing them costs one draw call per Texture, no matter how
+    many quads there are. Call set_quads() again whenever they change.
+
+    Draw the quads with draw(), outside of SpriteDrawer.start() and end(), like SpriteDrawer.draw_statics()."""
+
+    @staticmethod
+    def visible_area(transform_matrix: Matrix = Matrix.identity()) -> Rectangle:
+        """
+        Get the part of the world that is on screen when drawing with the given transformation, to decide which quads
+        are worth drawing.
+        :param transform_matrix: The transformation (usually the camera) that will be drawn with.
+        :return: The area of the world on screen.
+        """
+        return _view_rectangle(transform_matrix)
+
+    def __init__(self):
+        """
+        Create a new, empty, StaticQuads.
+        """
+        self.__batch = _StaticBatch()
+
+    def set_quads(self, groups: list):
+        """
+        Replace every quad.
+        :param groups: A list of (texture, rectangles, sources) tuples, one for each Texture the quads are drawn from.
+        The rectangles are the (x, y, width, height) of each quad in the world, and the sources are the (x, y, width,
+        height) of the part of the texture, in pixels, each quad shows. Both can be anything NumPy can turn into an
+        array of shape (quads, 4).
+        """
+        built = []
+        for texture, rectangles, sources in groups:
+            rectangles = _np.asarray(rectangles, _np.float32).reshape(-1, 4)
+            sources = _np.asarray(sources, _np.float32).reshape(-1, 4)
+            if len(rectangles) != len(sources):
+                raise ValueError(f"Every quad needs a source, got {len(rectangles)} quads and {len(sources)} sources.")
+            if len(rectangles) == 0:
+                continue
+            size = texture.size
+            vertices = _np.zeros((len(rectangles), 4), _STATIC_VERTEX)
+            for corner, (right, bottom) in enumerate(((0, 0), (1, 0), (0, 1), (1, 1))):
+                vertices["position"][:, corner, 0] = rectangles[:, 0] + right * rectangles[:, 2]
+                vertices["position"][:, corner, 1] = rectangles[:, 1] + bottom * rectangles[:, 3]
+                vertices["texture_coordinates"][:, corner, 0] = (sources[:, 0] + right * sources[:, 2]) / size.width
+                vertices["texture_coordinates"][:, corner, 1] = (sources[:, 1] + bottom * sources[:, 3]) / size.height
+            vertices["color"] = Colors.WHITE.packed_value
+            built.append((texture._texture, vertices.reshape(-1)))
+        self.__batch.build_vertices(built)
+
+    def draw(self, transform_matrix: Matrix = Matrix.identity(), pixel_mode: PixelMode = PixelMode.Linear):
+        """
+        Draw every quad.
+        :param transform_matrix: The transformation (usually the camera) to draw the quads with.
+        :param pixel_mode: The pixel mode to draw with.
+        """
+        self.__batch.draw(transform_matrix, pixel_mode)
+
+    def dispose(self):
+        """
+        Free the buffers of the quads from the graphics card.
+        """
+        self.__batch.dispose()
+
+
 class DrawError(Exception):
     pass
 
 
+def _packed_array(data, dtype, length: int = None, name: str = None):
+    # Flattens the given data into a contiguous array that can be handed straight to PGSUtils. If the data is already
+    # a contiguous array of the right type, no copy is made.
+    if data is None:
+        return None
+    if isinstance(data, Vector2Array):
+        data = data.to_interleaved()
+    array = _np.ascontiguousarray(data, dtype=dtype).reshape(-1)
+    if length is not None and len(array) != length:
+        raise ValueError(f"Expected {length} values for '{name}', got {len(array)} instead.")
+    return array
+
+
+def _points_array(points) -> _np.ndarray:
+    # Get the given points as a float32 array with shape (n, 2).
+    if isinstance(points, Vector2Array):
+        return points.to_interleaved().astype(_np.float32).reshape(-1, 2)
+    if len(points) and isinstance(points[0], Vector2):
+        return _np.array([(point.x, point.y) for point in points], _np.float32)
+    return _np.asarray(points, _np.float32).reshape(-1, 2)
+
+
+def _circle_segments(radius: float) -> int:
+    # Enough straight lines for a circle of the given radius to look round: one every few pixels of its edge.
+    return max(8, min(256, int(_math.tau * radius / 4)))
+
+
+def _mesh_indices(indices, vertex_count: int, dtype) -> _np.ndarray:
+    # Flattens the given indices into an array of the given type, checking that they all refer to a vertex first.
+    indices = _packed_array(indices, _np.int64)
+    if len(indices) and (indices.min() < 0 or indices.max() >= vertex_count):
+        raise IndexError("An index is out of range of the vertices.")
+    return indices.astype(dtype)
+
+
+def _changed_range(changed: tuple, start: int, end: int) -> tuple:
+    # Grow the (start, end) range of changed elements to cover another range. None means nothing has changed.
+    if changed is None:
+        return start, end
+    return min(changed[0], start), max(changed[1], end)
+
+
+def _pointer(array) -> _intPtr:
+    # Get a pointer to the start of the given array for PGSUtils to read from. None becomes a null pointer.
+    if array is None:
+        return _intPtr.Zero
+    return _intPtr.__overloads__[_int64](array.ctypes.data)
+
+
+def _pixel_area(size: Size, area: Rectangle) -> tuple:
+    # Get the (x, y, width, height) of the given area of a texture, in whole pixels. None is the whole texture.
+    if area is None:
+        return 0, 0, size.width, size.height
+    x, y, width, height = int(area.x), int(area.y), int(area.width), int(area.height)
+    if x < 0 or y < 0 or width <= 0 or height <= 0 or x + width > size.width or y + height > size.height:
+        raise ValueError("The area must be inside the texture.")
+    return x, y, width, height
+
+
+def _pixel_array(data, width: int, height: int) -> _np.ndarray:
+    # Get the given RGBA pixels as one contiguous NumPy array of bytes. Anything supporting the buffer protocol is
+    # viewed without being copied (unless it isn't contiguous).
+    if isinstance(data, (list, tuple)):
+        data = _np.fromiter((color.packed_value for color in data), _np.uint32, len(data))
+    elif not isinstance(data, _np.ndarray):
+        data = _np.frombuffer(data, _np.uint8)
+    if data.dtype.kind not in "ui" or data.dtype.itemsize not in (1, 4):
+        raise TypeError("Pixels must be given as RGBA bytes or packed 32-bit colors.")
+    data = _np.ascontiguousarray(data)
+    if data.nbytes != width * height * 4:
+        raise ValueError(f"A {width}x{height} area takes {width * height * 4} bytes of pixels, not {data.nbytes}.")
+    return data.reshape(-1).view(_np.uint8)
+
+
+def _texture_bounds(texture, position: Vector2, origin: Vector2, scale: Vector2, rotation: float) -> tuple:
+    # Get the (left, top, right, bottom) edges of the area the texture (or region) covers when drawn with the given
+    # values.
+    if isinstance(texture, TextureRegion):
+        width, height = texture.source.width, texture.source.height
+    else:
+        width, height = texture._texture.Width, texture._texture.Height
+    left, top = -origin.x * scale.x, -origin.y * scale.y
+    right, bottom = left + width * scale.x, top + height * scale.y
+    if rotation != 0:
+        # Rotate the corners, and take the area they cover.
+        cos, sin = _math.cos(rotation), _math.sin(rotation)
+        xs = (left * cos - top * sin, right * cos - top * sin, left * cos - bottom * sin, right * cos - bottom * sin)
+        ys = (left * sin + top * cos, right * sin + top * cos, left * sin + bottom * cos, right * sin + bottom * cos)
+        left, right, top, bottom = min(xs), max(xs), min(ys), max(ys)
+    elif left > right or top > bottom:
+        # A negative scale flips the texture around the origin.
+        left, right, top, bottom = min(left, right), max(left, right), min(top, bottom), max(top, bottom)
+    return position.x + left, position.y + top, position.x + right, position.y + bottom
+
+
+def _view_rectangle(transform_matrix: Matrix) -> Rectangle:
+    # Get the part of the world visible on screen, by turning the corners of the screen back into the world.
+    viewport = _GameBackend.graphics_device.Viewport
+    corners = transform_matrix.invert().transform_points(((0, 0), (viewport.Width, 0), (0, viewport.Height),
+                                                          (viewport.Width, viewport.Height)))
+    left, top = corners.min(axis=0)
+    right, bottom = corners.max(axis=0)
+    return Rectangle(float(left), float(top), float(right - left), float(bottom - top))
+
+
+# The layout of MonoGame's VertexPositionColorTexture, which static sprites are compiled into.
+_STATIC_VERTEX = _np.dtype([("position", _np.float32, 3), ("color", _np.uint32),
+                            ("texture_coordinates", _np.float32, 2)])
+
+
+class _StaticBatch:
+    # Compiles sprites that never change into vertex buffers that stay on the GPU, so drawing them costs one draw call
+    # per texture no matter how many sprites there are. Call build() again whenever the sprites change.
+
+    # 16 bit indices can only reach 65536 vertices, so bigger groups are split into several buffers.
+    __MAX_QUADS = 16384
+
+    __index_buffer = None
+    __effect = None
+
+    def __init__(self):
+        self.__groups: list = []
+
+    def build(self, sprites):
+        # Group the sprites by the texture they draw from, keeping the order they were given in.
+        groups: dict = {}
+        for sprite in sprites:
+            groups.setdefault(sprite.texture._texture, []).append(sprite)
+        self.build_vertices([(texture, _static_vertices(group)) for texture, group in groups.items()])
+
+    def build_vertices(self, groups: list):
+        # Build from a list of (Texture2D, vertices) pairs, where the vertices are _STATIC_VERTEX quads as made by
+        # _static_vertices().
+        self.dispose()
+        device = _GameBackend.graphics_device
+        if _StaticBatch.__index_buffer is None:
+            _StaticBatch.__index_buffer = _prs.PGSUtils.CreateQuadIndexBuffer(device, _StaticBatch.__MAX_QUADS)
+        for texture, vertices in groups:
+            for start in range(0, len(vertices) // 4, _StaticBatch.__MAX_QUADS):
+                chunk = vertices[start * 4:(start + _StaticBatch.__MAX_QUADS) * 4]
+                buffer = _prs.PGSUtils.CreateVertexBuffer(device, _pointer(chunk), len(chunk))
+                self.__groups.append((texture, buffer, len(chunk) // 4))
+
+    @staticmethod
+    def _get_effect(transform_matrix: Matrix):
+        # Get the BasicEffect that _STATIC_VERTEX buffers are drawn with, ready to draw with the given transformation.
+        device = _GameBackend.graphics_device
+        if _StaticBatch.__effect is None:
+            _StaticBatch.__effect = _mgGraphics.BasicEffect(device)
+            _StaticBatch.__effect.TextureEnabled = True
+            _StaticBatch.__effect.VertexColorEnabled = True
+        effect = _StaticBatch.__effect
+        viewport = device.Viewport
+        effect.Projection = _mg.Matrix.CreateOrthographicOffCenter(0, viewport.Width, viewport.Height, 0, 0, 1)
+        effect.World = transform_matrix._to_mg_matrix()
+        return effect
+
+    @staticmethod
+    def _get_sampler(pixel_mode: 'PixelMode'):
+        return _mgGraphics.SamplerState.LinearClamp if pixel_mode == PixelMode.Linear else \
+            _mgGraphics.SamplerState.PointClamp
+
+    def draw(self, transform_matrix: Matrix, pixel_mode: 'PixelMode'):
+        if not self.__groups:
+            return
+        device = _GameBackend.graphics_device
+        effect = _StaticBatch._get_effect(transform_matrix)
+        sampler = _StaticBatch._get_sampler(pixel_mode)
+        for texture, buffer, quads in self.__groups:
+            effect.Texture = texture
+            _prs.PGSUtils.DrawQuads(device, effect, buffer, _StaticBatch.__index_buffer, quads, sampler)
+
+    def dispose(self):
+        for _, buffer, _ in self.__groups:
+            buffer.Dispose()
+        self.__groups = []
+
+
+def _static_vertices(sprites):
+    # Build the four corners (top left, top right, bottom left, bottom right) of every sprite, positioned exactly as
+    # SpriteBatch would draw them: the texture is offset by the origin, scaled, rotated, then moved to the position.
+    count = len(sprites)
+    values = _np.empty((count, 13), _np.float64)
+    colors = _np.empty(count, _np.uint32)
+    for i, sprite in enumerate(sprites):
+        texture = sprite.texture
+        size = texture._texture.Width, texture._texture.Height
+        source = texture.source if isinstance(texture, TextureRegion) else Rectangle(0, 0, size[0], size[1])
+        values[i] = (sprite.position.x, sprite.position.y, sprite.origin.x, sprite.origin.y, sprite.scale.x,
+                     sprite.scale.y, sprite.rotation, source.x / size[0], source.y / size[1],
+                     source.right / size[0], source.bottom / size[1], source.width, source.height)
+        colors[i] = sprite.color.packed_value
+    position, origin, scale = values[:, 0:2], values[:, 2:4], values[:, 4:6]
+    rotation, uv, source_size = values[:, 6], values[:, 7:11], values[:, 11:13]
+
+    corners = _np.array([(0, 0), (1, 0), (0, 1), (1, 1)], _np.float64)
+    local = (corners[None, :, :] * source_size[:, None, :] - origin[:, None, :]) * scale[:, None, :]
+    cos, sin = _np.cos(rotation)[:, None], _np.sin(rotation)[:, None]
+
+    vertices = _np.zeros((count, 4), _STATIC_VERTEX)
+    vertices["position"][:, :, 0] = local[:, :, 0] * cos - local[:, :, 1] * sin + position[:, None, 0]
+    vertices["position"][:, :, 1] = local[:, :, 0] * sin + local[:, :, 1] * cos + position[:, None, 1]
+    vertices["color"] = colors[:, None]
+    vertices["texture_coordinates"][:, :, 0] = _np.where(corners[:, 0] == 0, uv[:, None, 0], uv[:, None, 2])
+    vertices["texture_coordinates"][:, :, 1] = _np.where(corners[:, 1] == 0, uv[:, None, 1], uv[:, None, 3])
+    return vertices.reshape(-1)
+
+
+class RenderTargetFormat(_enum):
+    """The format of the pixels of a RenderTarget."""
+    Color = 0
+    """8 bits for each of red, green, blue and alpha, like textures and the screen."""
+    HalfVector4 = 1
+    """A 16 bit float for each of red, green, blue and alpha, for values outside of 0 to 1 (such as HDR lighting)."""
+    Vector4 = 2
+    """A 32 bit float for each of red, green, blue and alpha."""
+    Single = 3
+    """A single 32 bit float, for masks and distance fields."""
+
+
 class RenderTarget:
     """Represents a Framebuffer that can be rendered to."""
 
-    def __init__(self, size: Size):
-        self._framebuffer = _mgGraphics.RenderTarget2D(_GameBackend.graphics_device, size.width, size.height)
+    __BYTES_PER_PIXEL = {RenderTargetFormat.Color: 4, RenderTargetFormat.HalfVector4: 8,
+                         RenderTargetFormat.Vector4: 16, RenderTargetFormat.Single: 4}
+
+    def __init__(self, size: Size, format: RenderTargetFormat = RenderTargetFormat.Color):
+        """
+        Create a new RenderTarget.
+        :param size: The width and height of the RenderTarget, in pixels.
+        :param format: The format of the pixels.
+        """
+        self.size: Size = Size(int(size.width), int(size.height))
+        self.format: RenderTargetFormat = format
+        self._framebuffer = _mgGraphics.RenderTarget2D(_GameBackend.graphics_device, self.size.width,
+                                                       self.size.height, False,
+                                                       getattr(_mgGraphics.SurfaceFormat, format.name),
+                                                       getattr(_mgGraphics.DepthFormat, "None"))
+
+    @property
+    def size_in_bytes(self) -> int:
+        """
+        Get the video memory the RenderTarget takes up.
+        :return: The size of the pixels, in bytes.
+        """
+        return self.size.width * self.size.height * RenderTarget.__BYTES_PER_PIXEL[self.format]
+
+    def dispose(self):
+        """
+        Free the RenderTarget. It can't be drawn to or with afterwards.
+        """
+        self._framebuffer.Dispose()
+
+
+class RenderTargetPool:
+    """Hands out RenderTargets for effects that only need them for a while, such as blur passes, cached UI or
+    screenshots, and reuses them rather than making new ones every frame. Targets are reused between requests of the
+    same size and format; a reused target still holds whatever was last drawn to it, so clear it before drawing.
+
+    Targets from get() go back into the pool when they're released, or on their own at the end of the frame they were
+    got on. Targets that sit in the pool unused for idle_frames frames are disposed."""
+
+    __pools = _weakref.WeakSet()
+
+    def __init__(self, idle_frames: int = 60):
+        """
+        Create a new, empty, RenderTargetPool.
+        :param idle_frames: The number of frames a target can sit unused in the pool before it's disposed.
+        """
+        self.idle_frames: int = idle_frames
+        # The number of targets handed out that were reused from the pool, and that had to be made because none fit.
+        self.hits: int = 0
+        self.misses: int = 0
+        # Free targets are kept with the frame they were released on, grouped by (width, height, format).
+        self.__free: dict = {}
+        # Targets that are in use, and whether they're kept past the end of the frame.
+        self.__in_use: dict = {}
+        self.__frame: int = 0
+        RenderTargetPool.__pools.add(self)
+
+    @property
+    def resident_bytes(self) -> int:
+        """
+        Get the video memory used by the targets of the pool, both in use and free.
+        :return: The size, in bytes, of every target in the pool.
+        """
+        return sum(target.size_in_bytes for target in self.__in_use) + \
+            sum(target.size_in_bytes for free in self.__free.values() for target, _ in free)
+
+    @property
+    def free_count(self) -> int:
+        """
+        Get the number of targets in the pool that aren't in use.
+        """
+        return sum(len(free) for free in self.__free.values())
+
+    def __len__(self):
+        return len(self.__in_use) + self.free_count
+
+    def get(self, size: Size, format: RenderTargetFormat = RenderTargetFormat.Color,
+            keep: bool = False) -> RenderTarget:
+        """
+        Get a RenderTarget of the given size and format, reusing a free one if there is one.
+        :param size: The width and height of the target, in pixels.
+        :param format: The format of the pixels.
+        :param keep: Whether to keep the target past the end of the frame, until it's released. Otherwise, it's
+        released on its own at the end of the frame.
+        :return: The RenderTarget.
+        """
+        free = self.__free.get((int(size.width), int(size.height), format))
+        if free:
+            # Take the most recently released target, so the rest can go idle and be trimmed.
+            target = free.pop()[0]
+            self.hits += 1
+        else:
+            target = RenderTarget(size, format)
+            self.misses += 1
+        self.__in_use[target] = keep
+        return target
+
+    def release(self, render_target: RenderTarget):
+        """
+        Put a RenderTarget from get() back into the pool, so it can be handed out again, even in the same frame.
+        :param render_target: The RenderTarget to release.
+        """
+        if render_target not in self.__in_use:
+            raise ValueError("The render target was not got from this pool, or has already been released.")
+        del self.__in_use[render_target]
+        key = (render_target.size.width, render_target.size.height, render_target.format)
+        self.__free.setdefault(key, []).append((render_target, self.__frame))
+
+    def trim(self, idle_frames: int = None) -> int:
+        """
+        Dispose the free targets that haven't been used for a number of frames.
+        :param idle_frames: The number of frames a target can be unused for. Defaults to the idle_frames of the pool; 0
+        frees every target that isn't in use.
+        :return: The number of targets disposed.
+        """
+        idle_frames = self.idle_frames if idle_frames is None else idle_frames
+        freed = 0
+        for key, free in list(self.__free.items()):
+            for target, released in free:
+                if self.__frame - released >= idle_frames:
+                    target.dispose()
+                    freed += 1
+            free[:] = [(target, released) for target, released in free if self.__frame - released < idle_frames]
+            if not free:
+                del self.__free[key]
+        return freed
+
+    def clear(self):
+        """
+        Dispose every target in the pool, including ones still in use.
+        """
+        for target in self.__in_use:
+            target.dispose()
+        for free in self.__free.values():
+            for target, _ in free:
+                target.dispose()
+        self.__in_use.clear()
+        self.__free.clear()
+
+    def _end_frame(self):
+        for target, keep in list(self.__in_use.items()):
+            if not keep:
+                self.release(target)
+        self.__frame += 1
+        self.trim()
+
+    @staticmethod
+    def _end_frames():
+        # Called by the game at the end of every drawn frame.
+        for pool in list(RenderTargetPool.__pools):
+            pool._end_frame()
 
 
 class _FontManager:
@@ -669,6 +3145,7 @@ class _GameBackend(_prs.PGSGame):
     def update(self, gameTime):
         Input._update()
         Time._update(gameTime)
+        TextureLoader._update()
         if (Time.elapsed_milliseconds() - self.counter > 1000):
             self.counter = Time.elapsed_milliseconds()
             self.Window.Title = self.titleText + " - Python Graphics Set - FPS: " + str(Time.fps()) if self.show_credits else self.titleText
@@ -677,6 +3154,7 @@ class _GameBackend(_prs.PGSGame):
     def draw(self):
         self.GraphicsDevice.Clear(self.clear_color)
         self.game.draw()
+        RenderTargetPool._end_frames()
 
     def __resize(self, sender, args):
         #self.graphics.PreferredBackBufferWidth = self.Window.ClientBounds.Width
@@ -0,0 +1,79 @@
+﻿using System;
+using System.Runtime.InteropServices;
+using Microsoft.Xna.Framework;
+using Microsoft.Xna.Framework.Graphics;
+
+namespace PRS
+{
+    /// <summary>
+    /// A pinned array of pixels that python writes into and that is then uploaded into a texture. Each DynamicTexture
+    /// owns one, so updates to different textures never share memory and nothing is allocated per update. PGSUtils
+    /// keeps one more for its own copies in and out of textures.
+    /// </summary>
+    public sealed class PGSStagingBuffer : IDisposable
+    {
+        private byte[] _data;
+        private GCHandle _handle;
+
+        public PGSStagingBuffer(int size)
+        {
+            _data = new byte[size];
+            _handle = GCHandle.Alloc(_data, GCHandleType.Pinned);
+        }
+
+        /// <summary>
+        /// The size of the array, in bytes.
+        /// </summary>
+        public int Size => _data.Length;
+
+        /// <summary>
+        /// A pointer to the start of the array, which stays valid until the buffer is disposed.
+        /// </summary>
+        public IntPtr Pointer
+        {
+            get
+            {
+                if (!_handle.IsAllocated)
+                    throw new ObjectDisposedException(nameof(PGSStagingBuffer));
+                return _handle.AddrOfPinnedObject();
+            }
+        }
+
+        /// <summary>
+        /// Upload the first <paramref name="width"/> x <paramref name="height"/> RGBA pixels of the array into that area
+        /// of <paramref name="texture"/>.
+        /// </summary>
+        public void Upload(Texture2D texture, int x, int y, int width, int height)
+        {
+            int size = width * height * 4;
+            if (!_handle.IsAllocated)
+                throw new ObjectDisposedException(nameof(PGSStagingBuffer));
+            if (size > _data.Length)
+                throw new ArgumentException("The area is bigger than the staging buffer.");
+            texture.SetData(0, new Rectangle(x, y, width, height), _data, 0, size);
+        }
+
+        /// <summary>
+        /// Download the RGBA pixels in an area of <paramref name="texture"/> into the start of the array.
+        /// </summary>
+        public void Download(Texture2D texture, int x, int y, int width, int height)
+        {
+            int size = width * height * 4;
+            if (!_handle.IsAllocated)
+                throw new ObjectDisposedException(nameof(PGSStagingBuffer));
+            if (size > _data.Length)
+                throw new ArgumentException("The area is bigger than the staging buffer.");
+            texture.GetData(0, new Rectangle(x, y, width, height), _data, 0, size);
+        }
+
+        /// <summary>
+        /// Unpin and drop the array. The pointer can't be used afterwards.
+        /// </summary>
+        public void Dispose()
+        {
+            if (_handle.IsAllocated)
+                _handle.Free();
+            _data = Array.Empty<byte>();
+        }
+    }
+}
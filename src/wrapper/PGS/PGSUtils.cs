@@ -1,7 +1,11 @@
 ﻿using System;
 using System.Collections.Generic;
+using System.IO;
+using System.Runtime.InteropServices;
+using System.Threading.Tasks;
 using Microsoft.Xna.Framework;
 using Microsoft.Xna.Framework.Graphics;
+using StbImageSharp;
 
 namespace PRS
 {
@@ -11,5 +15,226 @@ namespace PRS
         {
             targetTexture.SetData(colors);
         }
+
+        // Shared by SetTextureData and GetTextureData, and grown to the biggest area copied so far, so copies don't
+        // allocate. Nothing outside those two calls ever sees it.
+        private static PGSStagingBuffer _transferBuffer;
+
+        private static PGSStagingBuffer GetTransferBuffer(int size)
+        {
+            if (_transferBuffer == null || _transferBuffer.Size < size)
+            {
+                _transferBuffer?.Dispose();
+                _transferBuffer = new PGSStagingBuffer(size);
+            }
+            return _transferBuffer;
+        }
+
+        /// <summary>
+        /// Copy <paramref name="width"/> x <paramref name="height"/> RGBA pixels from <paramref name="pixels"/> (such as
+        /// the data of a NumPy array) into that area of <paramref name="texture"/>, through a reused pinned buffer.
+        /// </summary>
+        public static unsafe void SetTextureData(Texture2D texture, int x, int y, int width, int height, IntPtr pixels)
+        {
+            int size = width * height * 4;
+            PGSStagingBuffer buffer = GetTransferBuffer(size);
+            Buffer.MemoryCopy(pixels.ToPointer(), buffer.Pointer.ToPointer(), size, size);
+            buffer.Upload(texture, x, y, width, height);
+        }
+
+        /// <summary>
+        /// Copy the RGBA pixels in an area of <paramref name="texture"/> out to <paramref name="pixels"/>, which must
+        /// have room for <paramref name="width"/> x <paramref name="height"/> pixels.
+        /// </summary>
+        public static unsafe void GetTextureData(Texture2D texture, int x, int y, int width, int height, IntPtr pixels)
+        {
+            int size = width * height * 4;
+            PGSStagingBuffer buffer = GetTransferBuffer(size);
+            buffer.Download(texture, x, y, width, height);
+            Buffer.MemoryCopy(buffer.Pointer.ToPointer(), pixels.ToPointer(), size, size);
+        }
+
+        /// <summary>
+        /// Copy the whole of <paramref name="source"/> into <paramref name="destination"/>, with its top left corner at
+        /// (<paramref name="x"/>, <paramref name="y"/>). Used to pack textures into an atlas page.
+        /// </summary>
+        public static void CopyTexture(Texture2D source, Texture2D destination, int x, int y)
+        {
+            Color[] pixels = new Color[source.Width * source.Height];
+            source.GetData(pixels);
+            destination.SetData(0, new Rectangle(x, y, source.Width, source.Height), pixels, 0, pixels.Length);
+        }
+
+        /// <summary>
+        /// Decode the image at <paramref name="path"/> into RGBA pixels on the thread pool. Nothing here touches the
+        /// graphics device, so the game keeps running while images load; see <see cref="CreateTexture"/>.
+        /// </summary>
+        public static Task<ImageResult> DecodeImageAsync(string path)
+        {
+            return Task.Run(() =>
+            {
+                using (FileStream stream = File.OpenRead(path))
+                    return ImageResult.FromStream(stream, ColorComponents.RedGreenBlueAlpha);
+            });
+        }
+
+        /// <summary>
+        /// Upload an image decoded by <see cref="DecodeImageAsync"/> into a new texture. This must be called on the
+        /// main thread.
+        /// </summary>
+        public static Texture2D CreateTexture(GraphicsDevice device, ImageResult image)
+        {
+            Texture2D texture = new Texture2D(device, image.Width, image.Height);
+            texture.SetData(image.Data);
+            return texture;
+        }
+
+        /// <summary>
+        /// Create a vertex buffer from a packed array of <paramref name="count"/>
+        /// <see cref="VertexPositionColorTexture"/> vertices built in python.
+        /// </summary>
+        public static unsafe VertexBuffer CreateVertexBuffer(GraphicsDevice device, IntPtr vertices, int count)
+        {
+            VertexPositionColorTexture[] data = new VertexPositionColorTexture[count];
+            fixed (VertexPositionColorTexture* destination = data)
+            {
+                long size = (long) count * sizeof(VertexPositionColorTexture);
+                Buffer.MemoryCopy((void*) vertices, destination, size, size);
+            }
+            VertexBuffer buffer = new VertexBuffer(device, VertexPositionColorTexture.VertexDeclaration, count,
+                BufferUsage.WriteOnly);
+            buffer.SetData(data);
+            return buffer;
+        }
+
+        /// <summary>
+        /// Create an index buffer for <paramref name="quadCount"/> quads, where each quad is four vertices in the order
+        /// top left, top right, bottom left, bottom right. 16 bit indices are used, so it can index at most 16384 quads.
+        /// </summary>
+        public static IndexBuffer CreateQuadIndexBuffer(GraphicsDevice device, int quadCount)
+        {
+            short[] indices = new short[quadCount * 6];
+            for (int i = 0; i < quadCount; i++)
+            {
+                short vertex = (short) (i * 4);
+                indices[i * 6] = vertex;
+                indices[i * 6 + 1] = (short) (vertex + 1);
+                indices[i * 6 + 2] = (short) (vertex + 2);
+                indices[i * 6 + 3] = (short) (vertex + 1);
+                indices[i * 6 + 4] = (short) (vertex + 3);
+                indices[i * 6 + 5] = (short) (vertex + 2);
+            }
+            IndexBuffer buffer = new IndexBuffer(device, IndexElementSize.SixteenBits, indices.Length,
+                BufferUsage.WriteOnly);
+            buffer.SetData(indices);
+            return buffer;
+        }
+
+        /// <summary>
+        /// Copy <paramref name="count"/> vertices from python into a dynamic vertex buffer, starting at vertex
+        /// <paramref name="start"/>. Rewriting the whole buffer discards the old contents, so the GPU never has to
+        /// finish drawing from it first.
+        /// </summary>
+        public static unsafe void SetVertices(DynamicVertexBuffer buffer, IntPtr vertices, int start, int count)
+        {
+            VertexPositionColorTexture[] data = new VertexPositionColorTexture[count];
+            fixed (VertexPositionColorTexture* destination = data)
+            {
+                long size = (long) count * sizeof(VertexPositionColorTexture);
+                Buffer.MemoryCopy((void*) vertices, destination, size, size);
+            }
+            int stride = sizeof(VertexPositionColorTexture);
+            buffer.SetData(start * stride, data, 0, count, stride,
+                count == buffer.VertexCount ? SetDataOptions.Discard : SetDataOptions.None);
+        }
+
+        /// <summary>
+        /// Copy <paramref name="count"/> indices from python into a dynamic index buffer, starting at index
+        /// <paramref name="start"/>. The indices must be 16 or 32 bit, matching the element size of the buffer.
+        /// </summary>
+        public static void SetIndices(DynamicIndexBuffer buffer, IntPtr indices, int start, int count)
+        {
+            SetDataOptions options = count == buffer.IndexCount ? SetDataOptions.Discard : SetDataOptions.None;
+            if (buffer.IndexElementSize == IndexElementSize.SixteenBits)
+            {
+                short[] data = new short[count];
+                Marshal.Copy(indices, data, 0, count);
+                buffer.SetData(start * sizeof(short), data, 0, count, options);
+            }
+            else
+            {
+                int[] data = new int[count];
+                Marshal.Copy(indices, data, 0, count);
+                buffer.SetData(start * sizeof(int), data, 0, count, options);
+            }
+        }
+
+        /// <summary>
+        /// Draw <paramref name="quadCount"/> quads from the given buffers with the given effect, using the same states
+        /// <see cref="SpriteBatch"/> draws with by default.
+        /// </summary>
+        public static void DrawQuads(GraphicsDevice device, Effect effect, VertexBuffer vertices, IndexBuffer indices,
+            int quadCount, SamplerState samplerState)
+        {
+            DrawTriangles(device, effect, vertices, indices, 0, quadCount * 2, samplerState);
+        }
+
+        /// <summary>
+        /// Draw <paramref name="triangleCount"/> triangles from the given buffers with the given effect, starting at
+        /// index <paramref name="startIndex"/>, using the same states <see cref="SpriteBatch"/> draws with by default.
+        /// </summary>
+        public static void DrawTriangles(GraphicsDevice device, Effect effect, VertexBuffer vertices,
+            IndexBuffer indices, int startIndex, int triangleCount, SamplerState samplerState)
+        {
+            device.BlendState = BlendState.AlphaBlend;
+            device.DepthStencilState = DepthStencilState.None;
+            device.RasterizerState = RasterizerState.CullNone;
+            device.SamplerStates[0] = samplerState;
+            device.SetVertexBuffer(vertices);
+            device.Indices = indices;
+            foreach (EffectPass pass in effect.CurrentTechnique.Passes)
+            {
+                pass.Apply();
+                device.DrawIndexedPrimitives(PrimitiveType.TriangleList, 0, startIndex, triangleCount);
+            }
+        }
+
+        /// <summary>
+        /// Draw many textures with a single call from python. Every pointer points to a packed array of
+        /// <paramref name="count"/> elements (pairs of floats for the vector arrays). Any pointer other than
+        /// <paramref name="positions"/> can be zero, in which case the default value is used for every texture.
+        /// <paramref name="textureSources"/> holds an (x, y, width, height) source rectangle for each of
+        /// <paramref name="textures"/>; a width of zero or less draws the whole texture.
+        /// </summary>
+        public static unsafe void DrawMany(SpriteBatch spriteBatch, Texture2D[] textures, IntPtr textureSources,
+            IntPtr positions, IntPtr origins, IntPtr scales, IntPtr rotations, IntPtr colors, IntPtr textureIndices,
+            int count)
+        {
+            int* source = (int*) textureSources;
+            Rectangle?[] sources = new Rectangle?[textures.Length];
+            for (int i = 0; source != null && i < textures.Length; i++)
+            {
+                if (source[i * 4 + 2] > 0)
+                    sources[i] = new Rectangle(source[i * 4], source[i * 4 + 1], source[i * 4 + 2], source[i * 4 + 3]);
+            }
+
+            float* position = (float*) positions;
+            float* origin = (float*) origins;
+            float* scale = (float*) scales;
+            float* rotation = (float*) rotations;
+            uint* color = (uint*) colors;
+            int* textureIndex = (int*) textureIndices;
+
+            for (int i = 0; i < count; i++)
+            {
+                int index = textureIndex == null ? 0 : textureIndex[i];
+                spriteBatch.Draw(textures[index], new Vector2(position[i * 2], position[i * 2 + 1]), sources[index],
+                    color == null ? Color.White : new Color(color[i]),
+                    rotation == null ? 0 : rotation[i],
+                    origin == null ? Vector2.Zero : new Vector2(origin[i * 2], origin[i * 2 + 1]),
+                    scale == null ? Vector2.One : new Vector2(scale[i * 2], scale[i * 2 + 1]),
+                    SpriteEffects.None, 0);
+            }
+        }
     }
-}
\ No newline at end of file
+}
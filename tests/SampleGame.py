@@ -8,6 +8,8 @@ from random import randint as r
 
 class SampleGame(Game):
     def initialize(self):
+        # Scenes get their textures from here, so retrying doesn't load the same textures again.
+        self.textures = TextureCache()
         self.active_scene: Scene = MenuScene(self)
         self.active_scene.initialize()
 
@@ -85,12 +87,12 @@ class MainScene(Scene):
         self.ui_manager.ui_defaults = UIDefaults(Color.from_hex(0x853A76), Color.from_hex(0x4B0C3B),
                                                  Color.from_hex(0x4B0C3B), Colors.PURPLE, Colors.WHITE, 36)
 
-        self.car_texture = Texture("./Assets/racecar.png")
+        self.car_texture = self.game.textures.get("./Assets/racecar.png")
         self.car = PlayerCar(Sprite(self.car_texture, Vector2(100, 720 / 2)))
         self.camera = Camera()
         self.camera.origin = Vector2(0, self.game.window_size.height / 2)
 
-        self.road_system = RoadSystem(Texture("./Assets/highway.png"), Vector2(0, 720 / 2))
+        self.road_system = RoadSystem(self.game.textures.get("./Assets/highway.png"), Vector2(0, 720 / 2))
         self.cars = []
         self.spawned = False
 
@@ -132,6 +134,10 @@ class MainScene(Scene):
         self.lerp_time = None
         self.cam_speed_mult = 0
 
+    def unload(self):
+        self.game.textures.release("./Assets/racecar.png")
+        self.game.textures.release("./Assets/highway.png")
+
     def update(self):
         if self.should_reload:
             self.game.change_scene(MainScene(self.game))
@@ -0,0 +1,114 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+# Like src/__init__.py, src goes at the end of the path, so "OpenGL" still means PyOpenGL inside the OpenGL backend.
+sys.path.append(_SRC)
+
+if sys.platform.startswith("linux"):
+    # Drawing tests render into a headless EGL context, so they can run without a display or a GPU (on Mesa's
+    # llvmpipe). PyOpenGL reads this when it's first imported.
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+
+# These are scripts that open a window, not tests.
+collect_ignore = ["test_main.py", "scene_test.py"]
+
+BACKENDS = ("_PGS", "OpenGL")
+
+
+def load_backend(name: str):
+    # Import a backend, skipping the test if what it needs (pythonnet and MonoGame, or PyOpenGL and glfw) isn't
+    # installed. The OpenGL backend is loaded straight from its file, as "OpenGL" is PyOpenGL's name.
+    module_name = "_PGS" if name == "_PGS" else "_PGS_OpenGL"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    try:
+        if name == "_PGS":
+            import _PGS
+            return _PGS
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(_SRC, "OpenGL.py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except (ImportError, OSError, RuntimeError) as error:
+        pytest.skip(f"The {name} backend can't be loaded here: {error}")
+    sys.modules[module_name] = module
+    return module
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Each backend in turn, for tests of what both backends share."""
+    return load_backend(request.param)
+
+
+@pytest.fixture
+def pgs():
+    """The MonoGame backend, for tests of what only it has."""
+    return load_backend("_PGS")
+
+
+GL_WIDTH, GL_HEIGHT = 320, 240
+
+
+@pytest.fixture(scope="session")
+def gl_context():
+    """A headless OpenGL 3.3 core context, GL_WIDTH by GL_HEIGHT, made current for the whole session."""
+    try:
+        import ctypes
+        from OpenGL import EGL
+        display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        if not EGL.eglInitialize(display, None, None):
+            raise RuntimeError("eglInitialize failed.")
+        attributes = (EGL.EGLint * 15)(EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+                                       EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+                                       EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8,
+                                       EGL.EGL_ALPHA_SIZE, 8, EGL.EGL_NONE, 0, 0)
+        config, count = EGL.EGLConfig(), EGL.EGLint()
+        if not EGL.eglChooseConfig(display, attributes, ctypes.pointer(config), 1, ctypes.pointer(count)) or \
+                count.value == 0:
+            raise RuntimeError("No EGL config can draw OpenGL into a pbuffer.")
+        surface = EGL.eglCreatePbufferSurface(display, config, (EGL.EGLint * 5)(EGL.EGL_WIDTH, GL_WIDTH,
+                                                                                EGL.EGL_HEIGHT, GL_HEIGHT,
+                                                                                EGL.EGL_NONE))
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        context = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT,
+                                       (EGL.EGLint * 7)(EGL.EGL_CONTEXT_MAJOR_VERSION, 3,
+                                                        EGL.EGL_CONTEXT_MINOR_VERSION, 3,
+                                                        EGL.EGL_CONTEXT_OPENGL_PROFILE_MASK,
+                                                        EGL.EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT, EGL.EGL_NONE))
+        if not context or not EGL.eglMakeCurrent(display, surface, surface, context):
+            raise RuntimeError("An OpenGL 3.3 core context couldn't be made.")
+    except Exception as error:
+        pytest.skip(f"No headless OpenGL context can be made here: {error}")
+    from OpenGL import GL
+    GL.glViewport(0, 0, GL_WIDTH, GL_HEIGHT)
+    yield
+    EGL.eglMakeCurrent(display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+    EGL.eglDestroyContext(display, context)
+    EGL.eglDestroySurface(display, surface)
+    EGL.eglTerminate(display)
+
+
+@pytest.fixture
+def gl(gl_context):
+    """The OpenGL backend, with a headless context to draw into."""
+    return load_backend("OpenGL")
+
+
+def read_pixels():
+    """Read back what has been drawn, as a (GL_HEIGHT, GL_WIDTH, 4) RGBA array with the top row first."""
+    import numpy as np
+    from OpenGL import GL
+    GL.glFinish()
+    data = GL.glReadPixels(0, 0, GL_WIDTH, GL_HEIGHT, GL.GL_RGBA, GL.GL_UNSIGNED_BYTE)
+    return np.frombuffer(data, np.uint8).reshape(GL_HEIGHT, GL_WIDTH, 4)[::-1]
+
+
+def clear():
+    from OpenGL import GL
+    GL.glClearColor(0, 0, 0, 1)
+    GL.glClear(GL.GL_COLOR_BUFFER_BIT)
@@ -0,0 +1,33 @@
+import pytest
+
+
+@pytest.fixture
+def loaded(pgs, monkeypatch):
+    # Loading textures needs a graphics device, so the builder loads these instead. A path of "WxH" is that size.
+    loaded = []
+
+    class FakeTexture:
+        def __init__(self, path: str):
+            self.size = pgs.Size(*map(int, path.split("x")))
+            self.disposed = False
+            loaded.append(self)
+
+        def dispose(self):
+            self.disposed = True
+
+    monkeypatch.setattr(pgs, "Texture", FakeTexture)
+    return loaded
+
+
+def test_textures_loaded_from_paths_are_disposed_when_one_is_too_big(pgs, loaded):
+    builder = pgs.AtlasBuilder(pgs.Size(64, 64))
+    builder.add("small", "16x16")
+    builder.add("big", "100x10")
+    builder.add("medium", "32x32")
+    given = pgs.Texture("8x8")
+    builder.add("given", given)
+    with pytest.raises(ValueError):
+        builder.build()
+    assert all(texture.disposed for texture in loaded if texture is not given)
+    # Textures passed in belong to the caller.
+    assert not given.disposed
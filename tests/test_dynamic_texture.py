@@ -0,0 +1,135 @@
+import ctypes
+import gc
+import types
+
+import numpy as np
+import pytest
+
+
+RED, GREEN = [255, 0, 0, 255], [0, 255, 0, 255]
+
+
+@pytest.fixture
+def texture(gl):
+    texture = gl.DynamicTexture(8, 8)
+    yield texture
+    texture.dispose()
+
+
+def test_begin_update_changes_only_its_area(gl, texture):
+    texture.set_pixels(np.tile(np.array(RED, np.uint8), (8, 8, 1)))
+    pixels = texture.begin_update(gl.Rectangle(2, 3, 4, 2))
+    assert pixels.shape == (2, 4, 4)
+    pixels[:] = GREEN
+    texture.end_update()
+    result = texture.get_pixels()
+    assert (result[3:5, 2:6] == GREEN).all()
+    result[3:5, 2:6] = RED
+    assert (result == RED).all()
+    from OpenGL import GL
+    assert GL.glGetError() == GL.GL_NO_ERROR
+
+
+def test_begin_and_end_must_be_paired(gl, texture):
+    with pytest.raises(RuntimeError):
+        texture.end_update()
+    texture.begin_update()[:] = GREEN
+    with pytest.raises(RuntimeError):
+        texture.begin_update()
+    # The update that was started can still be finished.
+    texture.end_update()
+    assert (texture.get_pixels() == GREEN).all()
+    with pytest.raises(RuntimeError):
+        texture.end_update()
+    texture.dispose()
+    with pytest.raises(RuntimeError):
+        texture.begin_update()
+
+
+def test_set_pixels_goes_around_the_ring(gl, texture, monkeypatch):
+    from OpenGL import GL
+    bound = []
+    bind_buffer = gl._gl.glBindBuffer
+    monkeypatch.setattr(gl._gl, "glBindBuffer", lambda target, buffer: (
+        bound.append(buffer) if target == GL.GL_PIXEL_UNPACK_BUFFER and buffer else None, bind_buffer(target, buffer)))
+    updates = gl.DynamicTexture.BUFFER_COUNT * 2 + 1
+    for i in range(updates):
+        value = [i * 10, 255 - i * 10, i, 255]
+        texture.set_pixels(np.tile(np.array(value, np.uint8), (8, 8, 1)))
+        assert (texture.get_pixels() == value).all()
+        texture.set_pixels(np.array(RED * 4, np.uint8), gl.Rectangle(1, 1, 2, 2))
+        assert (texture.get_pixels(gl.Rectangle(1, 1, 2, 2)) == RED).all()
+        assert (texture.get_pixels(gl.Rectangle(3, 3, 5, 5)) == value).all()
+    # Each update maps and then uploads from one buffer, and the next update moves on to the next buffer.
+    used = bound[::2]
+    assert bound[1::2] == used
+    ring = used[:gl.DynamicTexture.BUFFER_COUNT]
+    assert len(set(ring)) == gl.DynamicTexture.BUFFER_COUNT
+    assert used == [ring[i % len(ring)] for i in range(updates * 2)]
+
+
+@pytest.fixture
+def staged(pgs, monkeypatch):
+    # A staging buffer over Python memory, and a texture that records uploads, as there's no graphics device here.
+    buffers = []
+
+    class FakeStagingBuffer:
+        def __init__(self, size: int):
+            self.data = (ctypes.c_ubyte * size)()
+            self.Size = size
+            self.Pointer = types.SimpleNamespace(ToInt64=lambda: ctypes.addressof(self.data))
+            self.uploads = []
+            self.disposed = False
+            buffers.append(self)
+
+        def Upload(self, texture, x, y, width, height):
+            self.uploads.append((x, y, bytes(self.data[:width * height * 4])))
+
+        def Dispose(self):
+            self.disposed = True
+
+    class FakeTexture2D:
+        def __init__(self, device, width, height):
+            self.Width, self.Height = width, height
+
+        def Dispose(self):
+            pass
+
+    monkeypatch.setattr(pgs, "_prs", types.SimpleNamespace(PGSStagingBuffer=FakeStagingBuffer))
+    monkeypatch.setattr(pgs, "_mgGraphics", types.SimpleNamespace(Texture2D=FakeTexture2D))
+    return buffers
+
+
+def test_pgs_updates_go_through_the_staging_buffer(pgs, staged):
+    texture = pgs.DynamicTexture(4, 4)
+    staging, = staged
+    texture.set_pixels(bytes(range(16)), pgs.Rectangle(1, 2, 2, 2))
+    assert staging.uploads == [(1, 2, bytes(range(16)))]
+    with pytest.raises(RuntimeError):
+        texture.end_update()
+    texture.begin_update()
+    with pytest.raises(RuntimeError):
+        texture.begin_update()
+    texture.dispose()
+    with pytest.raises(RuntimeError):
+        texture.begin_update()
+
+
+def test_pgs_staging_buffer_outlives_its_views(pgs, staged):
+    texture = pgs.DynamicTexture(4, 4)
+    staging, = staged
+    pixels = texture.begin_update()
+    texture.end_update()
+    texture.dispose()
+    gc.collect()
+    # The array is still a view of the staging buffer, so it isn't freed yet.
+    assert not staging.disposed
+    pixels[:] = 7
+    del pixels
+    gc.collect()
+    assert staging.disposed
+    # Without any views left, dispose() frees it straight away.
+    texture = pgs.DynamicTexture(4, 4)
+    texture.set_pixels(bytes(64))
+    texture.dispose()
+    assert staged[1].disposed
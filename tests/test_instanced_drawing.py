@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+import pytest
+from conftest import clear, read_pixels
+
+
+def solid_texture(gl, width: int, height: int, rgba: tuple):
+    texture = gl.Texture.custom(width, height)
+    texture.set_pixels(np.tile(np.array(rgba, np.uint8), (height, width, 1)))
+    return texture
+
+
+@pytest.fixture
+def drawer(gl):
+    sprite_drawer = gl.SpriteDrawer()
+    clear()
+    return sprite_drawer
+
+
+def test_positions(gl, drawer):
+    red = solid_texture(gl, 10, 10, (255, 0, 0, 255))
+    drawer.draw_many(red, [20, 20, 100, 50])
+    pixels = read_pixels()
+    assert pixels[25, 25].tolist() == [255, 0, 0, 255]
+    assert pixels[55, 105].tolist() == [255, 0, 0, 255]
+    # Just outside of the first quad, and between the two.
+    assert pixels[25, 31].tolist() == [0, 0, 0, 255]
+    assert pixels[40, 60].tolist() == [0, 0, 0, 255]
+    from OpenGL import GL
+    assert GL.glGetError() == GL.GL_NO_ERROR
+
+
+def test_colors_scales_and_origins(gl, drawer):
+    white = solid_texture(gl, 1, 1, (255, 255, 255, 255))
+    colors = [gl.Colors.RED.packed_value, gl.Color(0, 0, 255).packed_value]
+    # A 40x20 rectangle from (10, 10), and a 20x20 square centred on (200, 100).
+    drawer.draw_many(white, [10, 10, 200, 100], origins=[0, 0, 0.5, 0.5], scales=[40, 20, 20, 20], colors=colors)
+    pixels = read_pixels()
+    assert pixels[28, 48].tolist() == [255, 0, 0, 255]
+    assert pixels[32, 48].tolist() == [0, 0, 0, 255]
+    assert pixels[91, 191].tolist() == [0, 0, 255, 255]
+    assert pixels[108, 208].tolist() == [0, 0, 255, 255]
+    assert pixels[89, 189].tolist() == [0, 0, 0, 255]
+
+
+def test_rotations(gl, drawer):
+    white = solid_texture(gl, 1, 1, (255, 255, 255, 255))
+    # A long thin bar turned a quarter turn around its left end points straight down.
+    drawer.draw_many(white, [100, 50], origins=[0, 0.5], scales=[100, 4], rotations=[math.pi / 2])
+    pixels = read_pixels()
+    assert pixels[140, 100].tolist() == [255, 255, 255, 255]
+    assert pixels[52, 140].tolist() == [0, 0, 0, 255]
+
+
+def test_transform_matrix_and_texture_indices(gl, drawer):
+    red = solid_texture(gl, 10, 10, (255, 0, 0, 255))
+    green = solid_texture(gl, 10, 10, (0, 255, 0, 255))
+    drawer.start(gl.Matrix.scale(gl.Vector2(2, 2)) * gl.Matrix.transform(gl.Vector2(10, 0)))
+    drawer.draw_many([red, green], [0, 0, 50, 50], texture_indices=[0, 1])
+    drawer.end()
+    pixels = read_pixels()
+    # Scaled by 2 then moved 10 right: the red quad covers x 10-30, y 0-20, the green x 110-130, y 100-120.
+    assert pixels[10, 20].tolist() == [255, 0, 0, 255]
+    assert pixels[110, 120].tolist() == [0, 255, 0, 255]
+    assert pixels[10, 5].tolist() == [0, 0, 0, 255]
@@ -17,7 +17,9 @@ class Test(Game):
             print("pres")
 
     def draw(self):
-        self.sprite_drawer.draw(self.tex)
+        self.sprite_drawer.start()
+        self.sprite_drawer.draw_texture(self.tex, Vector2.zero())
+        self.sprite_drawer.end()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+import pytest
+
+POINTS = ((0, 0), (1, 0), (0, 1), (-15.5, 40), (1000, -3))
+
+
+def matrices(backend):
+    Matrix, Vector2 = backend.Matrix, backend.Vector2
+    return (Matrix.identity(),
+            Matrix.transform(Vector2(30, -12)),
+            Matrix.rotate(0.7),
+            Matrix.scale(Vector2(2, 0.5)),
+            Matrix.scale(Vector2(2, 0.5)) * Matrix.rotate(-2.1) * Matrix.transform(Vector2(-400, 250)),
+            Matrix(1, 0.3, 0.2, 1, 5, 6))
+
+
+def assert_point(point, x: float, y: float):
+    assert point.x == pytest.approx(x, abs=1e-6)
+    assert point.y == pytest.approx(y, abs=1e-6)
+
+
+def test_invert_undoes_transform_point(backend):
+    for matrix in matrices(backend):
+        inverse = matrix.invert()
+        for x, y in POINTS:
+            assert_point(inverse.transform_point(matrix.transform_point(backend.Vector2(x, y))), x, y)
+            assert_point(matrix.transform_point(inverse.transform_point(backend.Vector2(x, y))), x, y)
+
+
+def test_matrix_times_inverse_is_identity(backend):
+    for matrix in matrices(backend):
+        product = matrix * matrix.invert()
+        for actual, expected in zip((product.m11, product.m12, product.m21, product.m22, product.m41, product.m42),
+                                    (1, 0, 0, 1, 0, 0)):
+            assert actual == pytest.approx(expected, abs=1e-9)
+
+
+def test_multiplication_applies_left_matrix_first(backend):
+    Matrix, Vector2 = backend.Matrix, backend.Vector2
+    first, second = Matrix.rotate(0.4) * Matrix.scale(Vector2(3, 2)), Matrix.transform(Vector2(7, -1))
+    for x, y in POINTS:
+        expected = second.transform_point(first.transform_point(Vector2(x, y)))
+        assert_point((first * second).transform_point(Vector2(x, y)), expected.x, expected.y)
+
+
+def test_transform_points_matches_transform_point(backend):
+    for matrix in matrices(backend):
+        transformed = matrix.transform_points(POINTS)
+        assert transformed.shape == (len(POINTS), 2)
+        for (x, y), (actual_x, actual_y) in zip(POINTS, transformed):
+            expected = matrix.transform_point(backend.Vector2(x, y))
+            assert actual_x == pytest.approx(expected.x)
+            assert actual_y == pytest.approx(expected.y)
+
+
+def test_invert_zero_scale_raises(backend):
+    with pytest.raises(ValueError):
+        backend.Matrix.scale(backend.Vector2(0, 1)).invert()
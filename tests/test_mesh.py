@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from conftest import clear, read_pixels
+
+
+RED, GREEN, BLACK = [255, 0, 0, 255], [0, 255, 0, 255], [0, 0, 0, 255]
+
+
+def square(x: float, y: float, size: float) -> list:
+    # Top left, top right, bottom left, bottom right.
+    return [x, y, x + size, y, x, y + size, x + size, y + size]
+
+
+@pytest.fixture
+def mesh(gl):
+    # Two 20x20 squares, at (10, 10) and (60, 10), of two triangles each: the first red, the second green.
+    gl.SpriteDrawer()
+    clear()
+    mesh = gl.Mesh(square(10, 10, 20) + square(60, 10, 20), [0, 1, 2, 1, 3, 2, 4, 5, 6, 5, 7, 6],
+                   colors=[gl.Colors.RED.packed_value] * 4 + [gl.Color(0, 255, 0).packed_value] * 4)
+    yield mesh
+    mesh.dispose()
+
+
+@pytest.fixture
+def uploads(gl, monkeypatch):
+    # Record the (target, offset, size) of every part of a vertex or index buffer that is uploaded again.
+    from OpenGL import GL
+    uploads = []
+    buffer_sub_data = gl._gl.glBufferSubData
+
+    def record(target, offset, size, data):
+        if target in (GL.GL_ARRAY_BUFFER, GL.GL_ELEMENT_ARRAY_BUFFER):
+            uploads.append((target, offset, size))
+        buffer_sub_data(target, offset, size, data)
+
+    monkeypatch.setattr(gl._gl, "glBufferSubData", record)
+    return uploads
+
+
+def test_first_draw(gl, mesh, uploads):
+    assert (mesh.vertex_count, mesh.index_count) == (8, 12)
+    mesh.draw()
+    # The buffers were filled when the mesh was made, so nothing is uploaded again.
+    assert uploads == []
+    pixels = read_pixels()
+    assert pixels[12, 12].tolist() == RED and pixels[28, 28].tolist() == RED
+    assert pixels[12, 62].tolist() == GREEN and pixels[28, 78].tolist() == GREEN
+    assert pixels[20, 45].tolist() == BLACK and pixels[35, 20].tolist() == BLACK
+
+
+def test_set_vertices_uploads_only_the_changed_range(gl, mesh, uploads):
+    from OpenGL import GL
+    mesh.draw()
+    # Move the green square down by 50.
+    mesh.set_vertices(4, positions=square(60, 60, 20))
+    assert mesh.positions[4].tolist() == [60, 60]
+    mesh.draw()
+    vertex_size = gl._STATIC_VERTEX.itemsize
+    assert uploads == [(GL.GL_ARRAY_BUFFER, 4 * vertex_size, 4 * vertex_size)]
+    # The changed ranges grow to cover each other until the next draw, and then nothing is left to upload.
+    uploads.clear()
+    mesh.set_vertices(1, colors=[gl.Color(0, 255, 0).packed_value])
+    mesh.set_vertices(3, colors=[gl.Color(0, 255, 0).packed_value])
+    clear()
+    mesh.draw()
+    mesh.draw()
+    assert uploads == [(GL.GL_ARRAY_BUFFER, 1 * vertex_size, 3 * vertex_size)]
+    pixels = read_pixels()
+    assert pixels[20, 70].tolist() == BLACK and pixels[70, 70].tolist() == GREEN
+    # The first square is blended from red to green across the changed corners.
+    assert pixels[11, 28][1] > pixels[28, 11][1]
+
+
+def test_set_indices_uploads_only_the_changed_range(gl, mesh, uploads):
+    from OpenGL import GL
+    # Make the second triangle of the green square the same as its first, so only half of it is left.
+    mesh.set_indices(9, [4, 5, 6])
+    assert mesh.indices.tolist() == [0, 1, 2, 1, 3, 2, 4, 5, 6, 4, 5, 6]
+    mesh.draw()
+    assert uploads == [(GL.GL_ELEMENT_ARRAY_BUFFER, 9 * 4, 3 * 4)]
+    pixels = read_pixels()
+    assert pixels[12, 62].tolist() == GREEN and pixels[28, 78].tolist() == BLACK
+
+
+def test_triangle_count(gl, mesh):
+    # Only the first triangle, the top left half of the red square.
+    mesh.draw(triangle_count=1)
+    pixels = read_pixels()
+    assert pixels[12, 12].tolist() == RED and pixels[28, 28].tolist() == BLACK
+    assert pixels[12, 62].tolist() == BLACK
+    # More triangles than the mesh holds draws all of them, and none draws nothing.
+    clear()
+    mesh.draw(triangle_count=100)
+    assert read_pixels()[28, 78].tolist() == GREEN
+    clear()
+    mesh.draw(triangle_count=0)
+    assert (read_pixels() == BLACK).all()
+
+
+def test_bad_meshes_are_errors(gl):
+    with pytest.raises(ValueError):
+        gl.Mesh([], [])
+    with pytest.raises(ValueError):
+        gl.Mesh([0, 0, 1], [0, 0, 0])
+    with pytest.raises(ValueError):
+        gl.Mesh(square(0, 0, 1), [0, 1, 2, 3])
+    with pytest.raises(ValueError):
+        gl.Mesh(square(0, 0, 1), [0, 1, 2], colors=[0, 0])
+    with pytest.raises(IndexError):
+        gl.Mesh(square(0, 0, 1), [0, 1, 4])
+    with pytest.raises(IndexError):
+        gl.Mesh(square(0, 0, 1), [0, 1, -1])
+
+
+def test_bad_changes_are_errors(gl, mesh, uploads):
+    with pytest.raises(IndexError):
+        mesh.set_vertices(6, positions=square(0, 0, 1))
+    with pytest.raises(IndexError):
+        mesh.set_vertices(-1, colors=[0])
+    with pytest.raises(ValueError):
+        mesh.set_vertices(0, positions=[0, 0, 1, 1], colors=[0])
+    with pytest.raises(IndexError):
+        mesh.set_indices(10, [0, 1, 2])
+    with pytest.raises(IndexError):
+        mesh.set_indices(0, [8])
+    with pytest.raises(ValueError):
+        mesh.positions[0] = 5
+    # Nothing was changed.
+    mesh.draw()
+    assert uploads == []
+    assert mesh.positions.reshape(-1).tolist() == square(10, 10, 20) + square(60, 10, 20)
+    assert np.array_equal(mesh.indices, [0, 1, 2, 1, 3, 2, 4, 5, 6, 5, 7, 6])
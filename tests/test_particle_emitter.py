@@ -0,0 +1,104 @@
+import math
+import numpy as np
+
+
+def test_default_position_is_not_shared(backend):
+    first, second = backend.ParticleEmitter(None), backend.ParticleEmitter(None)
+    assert first.position is not second.position
+    first.position += backend.Vector2(100, 0)
+    assert (second.position.x, backend.ParticleEmitter(None).position.x) == (0, 0)
+
+
+def test_given_position_is_copied(backend):
+    position = backend.Vector2(5, 5)
+    emitter = backend.ParticleEmitter(None, position)
+    emitter.position += backend.Vector2(1, 1)
+    assert (position.x, position.y) == (5, 5)
+
+
+class FakeTexture:
+    def __init__(self, backend):
+        self.size = backend.Size(8, 4)
+
+
+class RecordingDrawer:
+    # Stands in for a SpriteDrawer, keeping what draw_many() was called with.
+    def __init__(self):
+        self.calls = []
+
+    def draw_many(self, texture, positions, origins, scales, rotations, colors):
+        self.calls.append([texture] + [np.array(value) for value in (positions, origins, scales, rotations, colors)])
+
+
+def emitter_for(backend, **attributes):
+    # An emitter whose ranges are all single values, so every particle is the same.
+    emitter = backend.ParticleEmitter(FakeTexture(backend), backend.Vector2(10, 20), max_particles=8)
+    emitter.speed, emitter.direction, emitter.life = (100, 100), (0, 0), (2, 2)
+    for name, value in attributes.items():
+        setattr(emitter, name, value)
+    return emitter
+
+
+def drawn(emitter) -> list:
+    drawer = RecordingDrawer()
+    emitter.draw(drawer)
+    return drawer.calls[0] if drawer.calls else None
+
+
+def test_emit_places_particles_at_the_emitter_up_to_the_limit(backend):
+    emitter = emitter_for(backend)
+    emitter.emit(3)
+    assert emitter.count == 3
+    assert drawn(emitter)[1].tolist() == [[10, 20]] * 3
+    emitter.emit(100)
+    assert emitter.count == 8
+    emitter.clear()
+    assert emitter.count == 0 and drawn(emitter) is None
+
+
+def test_update_moves_particles_by_their_velocity_and_gravity(backend):
+    emitter = emitter_for(backend, gravity=backend.Vector2(0, 10), rotation=(1, 1), angular_velocity=(2, 2))
+    emitter.emit(2)
+    emitter.update(0.5)
+    texture, positions, origins, scales, rotations, colors = drawn(emitter)
+    # Gravity is added to the velocity before the particles are moved.
+    assert positions.tolist() == [[60, 22.5]] * 2
+    assert rotations.tolist() == [2, 2]
+    assert origins.tolist() == [[4, 2]] * 2
+
+
+def test_dead_particles_are_removed_and_the_rest_keep_their_order(backend):
+    emitter = emitter_for(backend, life=(1, 1))
+    emitter.emit(2)
+    emitter.life, emitter.direction = (3, 3), (math.pi / 2, math.pi / 2)
+    emitter.emit(1)
+    emitter.life, emitter.direction = (1, 1), (math.pi, math.pi)
+    emitter.emit(1)
+    emitter.life, emitter.direction = (3, 3), (-math.pi / 2, -math.pi / 2)
+    emitter.emit(1)
+    emitter.update(1.5)
+    assert emitter.count == 2
+    # Only the particles moving down and up survive, in the order they were emitted.
+    positions = drawn(emitter)[1]
+    assert np.allclose(positions, [[10, 170], [10, -130]], atol=1e-3)
+    emitter.update(2)
+    assert emitter.count == 0
+
+
+def test_emission_rate_carries_over_fractions_of_a_particle(backend):
+    emitter = emitter_for(backend, emission_rate=10)
+    emitter.update(0.25)
+    assert emitter.count == 2
+    emitter.update(0.25)
+    assert emitter.count == 5
+
+
+def test_color_and_scale_change_over_each_particles_life(backend):
+    emitter = emitter_for(backend, start_scale=1, end_scale=3, start_color=backend.Color(0, 0, 0, 255),
+                          end_color=backend.Color(200, 100, 50, 55))
+    emitter.emit(1)
+    emitter.update(1)
+    texture, positions, origins, scales, rotations, colors = drawn(emitter)
+    assert texture is emitter.texture
+    assert scales.tolist() == [[2, 2]]
+    assert colors.tolist() == [backend.Color(100, 50, 25, 155).packed_value]
@@ -0,0 +1,93 @@
+import pytest
+
+
+@pytest.fixture
+def pool(pgs, monkeypatch):
+    # RenderTargets need a graphics device, so the pool makes these instead.
+    class FakeRenderTarget:
+        def __init__(self, size, format=pgs.RenderTargetFormat.Color):
+            self.size = pgs.Size(int(size.width), int(size.height))
+            self.format = format
+            self.disposed = False
+
+        @property
+        def size_in_bytes(self) -> int:
+            return self.size.width * self.size.height * 4
+
+        def dispose(self):
+            self.disposed = True
+
+    monkeypatch.setattr(pgs, "RenderTarget", FakeRenderTarget)
+    return pgs.RenderTargetPool(idle_frames=2)
+
+
+def test_released_targets_are_reused_in_the_same_frame(pgs, pool):
+    first = pool.get(pgs.Size(64, 32))
+    assert (pool.hits, pool.misses) == (0, 1)
+    pool.release(first)
+    assert pool.get(pgs.Size(64, 32)) is first
+    assert (pool.hits, pool.misses) == (1, 1)
+
+
+def test_targets_are_only_reused_for_the_same_size_and_format(pgs, pool):
+    first = pool.get(pgs.Size(64, 32))
+    pool.release(first)
+    assert pool.get(pgs.Size(32, 64)) is not first
+    assert pool.get(pgs.Size(64, 32), pgs.RenderTargetFormat.Vector4) is not first
+    assert (pool.hits, pool.misses) == (0, 3)
+    assert len(pool) == 3 and pool.free_count == 1
+
+
+def test_targets_in_use_are_never_handed_out_twice(pgs, pool):
+    first, second = pool.get(pgs.Size(16, 16)), pool.get(pgs.Size(16, 16))
+    assert first is not second
+    assert pool.misses == 2
+
+
+def test_targets_are_released_at_the_end_of_the_frame(pgs, pool):
+    target = pool.get(pgs.Size(16, 16))
+    kept = pool.get(pgs.Size(16, 16), keep=True)
+    pgs.RenderTargetPool._end_frames()
+    assert pool.free_count == 1
+    with pytest.raises(ValueError):
+        pool.release(target)
+    assert pool.get(pgs.Size(16, 16)) is target
+    # A kept target stays in use until it's released.
+    pool.release(kept)
+    assert pool.free_count == 1
+
+
+def test_idle_targets_are_trimmed(pgs, pool):
+    target = pool.get(pgs.Size(16, 16))
+    pool.release(target)
+    pgs.RenderTargetPool._end_frames()
+    assert pool.free_count == 1 and not target.disposed
+    pgs.RenderTargetPool._end_frames()
+    assert pool.free_count == 0 and target.disposed
+    assert pool.get(pgs.Size(16, 16)) is not target
+
+
+def test_trim_zero_frees_every_free_target(pgs, pool):
+    in_use = pool.get(pgs.Size(8, 8))
+    free = pool.get(pgs.Size(8, 8))
+    pool.release(free)
+    assert pool.trim(0) == 1
+    assert free.disposed and not in_use.disposed
+    assert len(pool) == 1
+
+
+def test_resident_bytes_counts_targets_in_use_and_free(pgs, pool):
+    pool.get(pgs.Size(10, 10))
+    pool.release(pool.get(pgs.Size(20, 10)))
+    assert pool.resident_bytes == (10 * 10 + 20 * 10) * 4
+    pool.clear()
+    assert pool.resident_bytes == 0 and len(pool) == 0
+
+
+def test_release_must_match_get(pgs, pool):
+    target = pool.get(pgs.Size(8, 8))
+    with pytest.raises(ValueError):
+        pool.release(pgs.RenderTarget(pgs.Size(8, 8)))
+    pool.release(target)
+    with pytest.raises(ValueError):
+        pool.release(target)
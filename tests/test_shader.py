@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+
+VERTEX = """
+#version 330 core
+in vec2 aPosition;
+uniform mat4 uModel;
+uniform vec2 uOffset;
+void main()
+{
+    gl_Position = uModel * vec4(aPosition + uOffset, 0.0, 1.0);
+}"""
+
+FRAGMENT = """
+#version 330 core
+out vec4 out_color;
+uniform sampler2D uTexture;
+uniform vec4 uTint;
+uniform float uAmount;
+uniform float uWeights[3];
+uniform int uMode;
+void main()
+{
+    out_color = texture(uTexture, vec2(0.5)) * uTint * uAmount * (uWeights[0] + uWeights[1] + uWeights[2])
+                + float(uMode);
+}"""
+
+
+@pytest.fixture
+def shader(gl, monkeypatch):
+    monkeypatch.setattr(gl.Shader, "cache_directory", None)
+    shader = gl.Shader(VERTEX, FRAGMENT)
+    yield shader
+    shader.dispose()
+
+
+def uniform_value(shader, name: str, count: int, integer: bool = False) -> list:
+    # Read a uniform back from GL. Setting a uniform makes its program current.
+    from OpenGL import GL
+    shader._use()
+    program = GL.glGetIntegerv(GL.GL_CURRENT_PROGRAM)
+    values = np.zeros(count, np.int32 if integer else np.float32)
+    location = GL.glGetUniformLocation(program, name)
+    (GL.glGetUniformiv if integer else GL.glGetUniformfv)(program, location, values)
+    return values.tolist()
+
+
+def test_uniforms_are_reflected_with_their_types(gl, shader):
+    from OpenGL import GL
+    assert shader.uniforms == {
+        "uModel": (GL.GL_FLOAT_MAT4, 1), "uOffset": (GL.GL_FLOAT_VEC2, 1), "uTexture": (GL.GL_SAMPLER_2D, 1),
+        "uTint": (GL.GL_FLOAT_VEC4, 1), "uAmount": (GL.GL_FLOAT, 1), "uWeights": (GL.GL_FLOAT, 3),
+        "uMode": (GL.GL_INT, 1),
+    }
+
+
+def test_values_are_uploaded_by_type(gl, shader):
+    shader.set_uniform("uAmount", 0.5)
+    shader.set_uniform("uOffset", gl.Vector2(3, 4))
+    shader.set_uniform("uTint", gl.Color(255, 0, 51, 255))
+    shader.set_uniform("uWeights", [1, 2, 3])
+    shader.set_uniform("uMode", 2)
+    assert uniform_value(shader, "uAmount", 1) == [0.5]
+    assert uniform_value(shader, "uOffset", 2) == [3, 4]
+    assert uniform_value(shader, "uTint", 4) == pytest.approx([1, 0, 0.2, 1])
+    assert uniform_value(shader, "uWeights[0]", 1) == [1] and uniform_value(shader, "uWeights[2]", 1) == [3]
+    assert uniform_value(shader, "uMode", 1, integer=True) == [2]
+
+
+def test_matrices_are_uploaded_for_column_vectors(gl, shader):
+    matrix = gl.Matrix.transform(gl.Vector2(10, 20))
+    shader.set_uniform("uModel", matrix)
+    values = uniform_value(shader, "uModel", 16)
+    # GL reads matrices column by column, so the translation is in the last column.
+    assert values[12:14] == [10, 20]
+    assert values[0] == 1 and values[5] == 1 and values[15] == 1
+    shader.set_uniform("uModel", list(range(16)))
+    assert uniform_value(shader, "uModel", 16) == list(range(16))
+
+
+def test_setting_the_same_value_again_uploads_nothing(gl, shader, monkeypatch):
+    uploads = []
+    use_program = gl.RenderState._use_program
+    # Every setter makes its program current right before it uploads, so that counts the uploads.
+    monkeypatch.setattr(gl.RenderState, "_use_program", lambda program: (uploads.append(program),
+                                                                         use_program(program)))
+    set_amount = shader.get_uniform_setter("uAmount")
+    set_amount(0.5)
+    set_amount(0.5)
+    assert len(uploads) == 1
+    set_amount(0.25)
+    assert len(uploads) == 2
+    set_model = shader.get_uniform_setter("uModel")
+    matrix = gl.Matrix.transform(gl.Vector2(1, 2))
+    set_model(matrix)
+    set_model(matrix)
+    # An equal matrix is also skipped.
+    set_model(gl.Matrix.transform(gl.Vector2(1, 2)))
+    assert len(uploads) == 3
+
+
+def test_bad_names_and_values_are_errors(gl, shader):
+    with pytest.raises(Exception, match="not valid"):
+        shader.get_uniform_setter("uMissing")
+    with pytest.raises(ValueError):
+        shader.set_uniform("uWeights", [1, 2])
+    with pytest.raises(ValueError):
+        shader.set_uniform("uOffset", 1)
+    with pytest.raises(ValueError):
+        shader.set_uniform("uModel", [0] * 9)
+
+
+@pytest.fixture
+def compiles(gl, monkeypatch):
+    # Count the GLSL shaders compiled from source.
+    from OpenGL import GL
+    compiled = []
+    compile_shader = GL.glCompileShader
+    monkeypatch.setattr(gl._gl, "glCompileShader", lambda shader: (compiled.append(shader), compile_shader(shader)))
+    return compiled
+
+
+def cached_shader(gl, monkeypatch, directory):
+    from OpenGL import GL
+    if not GL.glGetIntegerv(GL.GL_NUM_PROGRAM_BINARY_FORMATS):
+        pytest.skip("The driver can't save program binaries.")
+    monkeypatch.setattr(gl.Shader, "cache_directory", str(directory))
+    return gl.Shader(VERTEX, FRAGMENT)
+
+
+def test_second_shader_is_loaded_from_the_cache(gl, monkeypatch, tmp_path, compiles):
+    first = cached_shader(gl, monkeypatch, tmp_path)
+    assert len(compiles) == 2
+    assert len(list(tmp_path.glob("*.bin"))) == 1
+    second = cached_shader(gl, monkeypatch, tmp_path)
+    assert len(compiles) == 2
+    # The loaded program works like a compiled one.
+    assert second.uniforms == first.uniforms
+    second.set_uniform("uAmount", 0.75)
+    assert uniform_value(second, "uAmount", 1) == [0.75]
+    first.dispose()
+    second.dispose()
+
+
+def test_corrupt_cache_file_falls_back_to_compiling(gl, monkeypatch, tmp_path, compiles):
+    cached_shader(gl, monkeypatch, tmp_path).dispose()
+    path, = tmp_path.glob("*.bin")
+    data = path.read_bytes()
+    path.write_bytes(data[:4] + bytes(len(data) - 4))
+    shader = cached_shader(gl, monkeypatch, tmp_path)
+    assert len(compiles) == 4
+    shader.set_uniform("uAmount", 0.75)
+    assert uniform_value(shader, "uAmount", 1) == [0.75]
+    shader.dispose()
+    # The corrupt file was replaced with a good one.
+    cached_shader(gl, monkeypatch, tmp_path).dispose()
+    assert len(compiles) == 4
+
+
+def test_truncated_cache_file_falls_back_to_compiling(gl, monkeypatch, tmp_path, compiles):
+    cached_shader(gl, monkeypatch, tmp_path).dispose()
+    path, = tmp_path.glob("*.bin")
+    path.write_bytes(b"\1\2")
+    cached_shader(gl, monkeypatch, tmp_path).dispose()
+    assert len(compiles) == 4
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+
+def pack(backend, width: int, height: int, sizes: list) -> list:
+    packer = backend._SkylinePacker(width, height)
+    return [packer.insert(w, h) for w, h in sizes]
+
+
+def assert_no_overlaps(rectangles: list):
+    for i, (x1, y1, w1, h1) in enumerate(rectangles):
+        for x2, y2, w2, h2 in rectangles[i + 1:]:
+            assert x1 + w1 <= x2 or x2 + w2 <= x1 or y1 + h1 <= y2 or y2 + h2 <= y1, \
+                f"({x1}, {y1}, {w1}, {h1}) overlaps ({x2}, {y2}, {w2}, {h2})"
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_rectangles_all_pack_without_overlapping(backend, seed):
+    generator = random.Random(seed)
+    sizes = [(generator.randint(1, 40), generator.randint(1, 40)) for _ in range(150)]
+    positions = pack(backend, 512, 512, sizes)
+    # 150 rectangles of at most 40x40 cover well under half of the page, so every one of them fits.
+    assert None not in positions
+    rectangles = [(x, y, w, h) for (x, y), (w, h) in zip(positions, sizes)]
+    for x, y, w, h in rectangles:
+        assert 0 <= x and x + w <= 512 and 0 <= y and y + h <= 512
+    assert_no_overlaps(rectangles)
+
+
+def test_exact_fit_fills_the_page(backend):
+    positions = pack(backend, 64, 64, [(32, 32)] * 4 + [(1, 1)])
+    assert sorted(positions[:4]) == [(0, 0), (0, 32), (32, 0), (32, 32)]
+    assert positions[4] is None
+
+
+def test_rectangles_that_do_not_fit_are_rejected(backend):
+    packer = backend._SkylinePacker(100, 50)
+    assert packer.insert(101, 1) is None
+    assert packer.insert(1, 51) is None
+    assert packer.insert(100, 50) == (0, 0)
+    assert packer.insert(1, 1) is None
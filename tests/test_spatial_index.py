@@ -0,0 +1,102 @@
+import math
+import random
+
+import pytest
+
+
+def overlaps(bounds, left: float, top: float, right: float, bottom: float) -> bool:
+    return bounds.x <= right and left <= bounds.right and bounds.y <= bottom and top <= bounds.bottom
+
+
+def distance(bounds, x: float, y: float) -> float:
+    return math.hypot(max(bounds.x - x, 0, x - bounds.right), max(bounds.y - y, 0, y - bounds.bottom))
+
+
+def random_rectangle(backend, generator):
+    return backend.Rectangle(generator.uniform(-2000, 2000), generator.uniform(-2000, 2000),
+                             generator.uniform(0, 300), generator.uniform(0, 300))
+
+
+@pytest.fixture
+def world(backend):
+    # A SpatialIndex with a brute-force copy of what's in it, after a mix of inserts, moves and removes.
+    generator = random.Random(1)
+    index, expected = backend.SpatialIndex(cell_size=128), {}
+    for item in range(400):
+        bounds = random_rectangle(backend, generator)
+        index.insert(item, bounds)
+        expected[item] = bounds
+    for item in generator.sample(sorted(expected), 150):
+        # Half of the moves are small, and stay in the same cells.
+        old = expected[item]
+        bounds = random_rectangle(backend, generator) if item % 2 else \
+            backend.Rectangle(old.x + generator.uniform(-5, 5), old.y + generator.uniform(-5, 5), old.width, old.height)
+        index.move(item, bounds)
+        expected[item] = bounds
+    for item in generator.sample(sorted(expected), 100):
+        index.remove(item)
+        del expected[item]
+    return backend, index, expected, generator
+
+
+def test_contents(world):
+    _, index, expected, _ = world
+    assert len(index) == len(expected)
+    assert set(index) == set(expected)
+    for item, bounds in expected.items():
+        assert item in index
+        stored = index.get_bounds(item)
+        assert (stored.x, stored.y, stored.width, stored.height) == \
+            pytest.approx((bounds.x, bounds.y, bounds.width, bounds.height))
+
+
+def test_query_matches_brute_force(world):
+    backend, index, expected, generator = world
+    areas = [random_rectangle(backend, generator) for _ in range(100)]
+    # Areas much bigger than the cells, and ones outside of everything, take other paths.
+    areas += [backend.Rectangle(-5000, -5000, 10000, 10000), backend.Rectangle(9000, 9000, 10, 10)]
+    for area in areas:
+        found = index.query(area)
+        assert len(found) == len(set(found))
+        assert set(found) == {item for item, bounds in expected.items()
+                              if overlaps(bounds, area.x, area.y, area.right, area.bottom)}
+
+
+def test_query_point_matches_brute_force(world):
+    backend, index, expected, generator = world
+    for _ in range(200):
+        x, y = generator.uniform(-2100, 2400), generator.uniform(-2100, 2400)
+        assert set(index.query_point(backend.Vector2(x, y))) == \
+            {item for item, bounds in expected.items() if overlaps(bounds, x, y, x, y)}
+
+
+def test_nearest_matches_brute_force(world):
+    backend, index, expected, generator = world
+    for _ in range(200):
+        x, y = generator.uniform(-4000, 4000), generator.uniform(-4000, 4000)
+        nearest = index.nearest(backend.Vector2(x, y))
+        # Ties can pick any of the closest items, so compare the distances.
+        assert distance(expected[nearest], x, y) == pytest.approx(min(distance(bounds, x, y)
+                                                                      for bounds in expected.values()))
+
+
+def test_nearest_within_max_distance(world):
+    backend, index, expected, _ = world
+    far_away = backend.Vector2(100000, 100000)
+    assert index.nearest(far_away, max_distance=10) is None
+    assert index.nearest(far_away) is not None
+
+
+def test_errors_and_clear(backend):
+    index = backend.SpatialIndex()
+    index.insert("a", backend.Rectangle(0, 0, 10, 10))
+    with pytest.raises(ValueError):
+        index.insert("a", backend.Rectangle(0, 0, 10, 10))
+    with pytest.raises(KeyError):
+        index.remove("b")
+    with pytest.raises(ValueError):
+        backend.SpatialIndex(cell_size=0)
+    index.clear()
+    assert len(index) == 0
+    assert index.query(backend.Rectangle(-100, -100, 200, 200)) == []
+    assert index.nearest(backend.Vector2(0, 0)) is None
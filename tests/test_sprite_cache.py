@@ -0,0 +1,41 @@
+import math
+
+
+def test_unchanged_sprite_reuses_its_draw_arguments(pgs):
+    sprite = pgs.Sprite(None, pgs.Vector2(10, 20))
+    arguments = sprite._get_draw_arguments()
+    assert sprite._get_draw_arguments() is arguments
+
+
+def test_setters_invalidate_the_draw_arguments(pgs):
+    sprite = pgs.Sprite(None, pgs.Vector2(10, 20))
+    for name, value in (("position", pgs.Vector2(1, 2)), ("origin", pgs.Vector2(3, 4)), ("scale", pgs.Vector2(2, 2)),
+                        ("rotation", math.pi), ("color", pgs.Colors.RED)):
+        arguments = sprite._get_draw_arguments()
+        setattr(sprite, name, value)
+        assert sprite._get_draw_arguments() is not arguments, name
+
+
+def test_changes_in_place_invalidate_the_draw_arguments(pgs):
+    sprite = pgs.Sprite(None, pgs.Vector2(10, 20))
+    arguments = sprite._get_draw_arguments()
+    sprite.position.x += 1
+    assert sprite._get_draw_arguments() is not arguments
+    arguments = sprite._get_draw_arguments()
+    sprite.scale *= 2
+    assert sprite._get_draw_arguments() is not arguments
+    arguments = sprite._get_draw_arguments()
+    sprite.color.a = 128
+    assert sprite._get_draw_arguments() is not arguments
+
+
+def test_sprites_own_their_values(pgs):
+    position = pgs.Vector2(10, 20)
+    sprite = pgs.Sprite(None, position)
+    sprite.position += pgs.Vector2(1, 1)
+    assert (position.x, position.y) == (10, 20)
+    assert (sprite.position.x, sprite.position.y) == (11, 21)
+    # Changing the color in place doesn't change the shared Colors it was set to.
+    sprite.color = pgs.Colors.WHITE
+    sprite.color.r = 0
+    assert pgs.Colors.WHITE.r == 255
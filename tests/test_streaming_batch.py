@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+import pytest
+from conftest import clear, read_pixels
+
+
+RED, GREEN, WHITE, BLACK = [255, 0, 0, 255], [0, 255, 0, 255], [255, 255, 255, 255], [0, 0, 0, 255]
+
+
+def solid_texture(gl, width: int, height: int, rgba: list):
+    texture = gl.Texture.custom(width, height)
+    texture.set_pixels(np.tile(np.array(rgba, np.uint8), (height, width, 1)))
+    return texture
+
+
+@pytest.fixture
+def drawer(gl):
+    sprite_drawer = gl.SpriteDrawer()
+    clear()
+    return sprite_drawer
+
+
+def test_changing_texture_flushes_and_keeps_draw_order(gl, drawer):
+    red, green = solid_texture(gl, 10, 10, RED), solid_texture(gl, 10, 10, GREEN)
+    drawer.start()
+    drawer.draw_texture(red, gl.Vector2(0, 0))
+    drawer.draw_texture(red, gl.Vector2(20, 0))
+    assert drawer.draw_calls == 0
+    drawer.draw_texture(green, gl.Vector2(5, 0))
+    assert drawer.draw_calls == 1
+    drawer.draw_texture(red, gl.Vector2(30, 0))
+    drawer.end()
+    assert drawer.draw_calls == 3
+    pixels = read_pixels()
+    # The green quad was drawn after the first red one, so it's on top where they overlap, and under the last one.
+    assert pixels[5, 2].tolist() == RED
+    assert pixels[5, 7].tolist() == GREEN
+    assert pixels[5, 12].tolist() == GREEN
+    assert pixels[5, 25].tolist() == RED
+    assert pixels[5, 35].tolist() == RED
+
+
+def test_a_full_batch_is_flushed_and_nothing_is_lost(gl, drawer):
+    white = solid_texture(gl, 1, 1, WHITE)
+    count = gl._StreamingBatch.MAX_QUADS + 10
+    drawer.start()
+    for i in range(count):
+        drawer.draw_texture(white, gl.Vector2(i % 300, i // 300 * 2))
+    assert drawer.draw_calls == 1
+    drawer.end()
+    assert drawer.draw_calls == 2
+    pixels = read_pixels()
+    drawn = pixels[0:(count // 300 + 1) * 2:2, :300].reshape(-1, 4)
+    assert (drawn[:count] == WHITE).all()
+    assert (drawn[count:] == BLACK).all()
+    # The rows between the quads are left empty.
+    assert (pixels[1, :300] == BLACK).all()
+
+
+def test_origin_scale_and_rotation(gl, drawer):
+    red = solid_texture(gl, 10, 4, RED)
+    drawer.start()
+    # Scaled to 30x4, centred vertically on its origin, then turned a quarter turn: a bar 30 down from (100, 50).
+    drawer.draw_texture(red, gl.Vector2(100, 50), origin=gl.Vector2(0, 2), scale=gl.Vector2(3, 1),
+                        rotation=math.pi / 2)
+    # Positioned by its centre.
+    drawer.draw_texture(red, gl.Vector2(200, 100), origin=gl.Vector2(5, 2))
+    drawer.end()
+    pixels = read_pixels()
+    assert pixels[52, 100].tolist() == RED and pixels[78, 100].tolist() == RED
+    assert pixels[82, 100].tolist() == BLACK
+    assert pixels[52, 104].tolist() == BLACK and pixels[48, 100].tolist() == BLACK
+    assert pixels[99, 196].tolist() == RED and pixels[100, 203].tolist() == RED
+    assert pixels[100, 194].tolist() == BLACK and pixels[100, 206].tolist() == BLACK
+
+
+def test_colors_flips_and_regions(gl, drawer):
+    texture = gl.Texture.custom(2, 1)
+    texture.set_pixels(np.array([RED, GREEN], np.uint8))
+    drawer.start(pixel_mode=gl.PixelMode.Clamp)
+    drawer.draw_texture(texture, gl.Vector2(0, 0), scale=gl.Vector2(10, 10))
+    drawer.draw_texture(texture, gl.Vector2(0, 20), scale=gl.Vector2(10, 10), flipped=True)
+    drawer.draw_texture(texture.get_region(gl.Rectangle(1, 0, 1, 1)), gl.Vector2(0, 40), scale=gl.Vector2(10, 10))
+    drawer.draw_texture(texture, gl.Vector2(0, 60), gl.Color(255, 0, 0), scale=gl.Vector2(10, 10))
+    drawer.end()
+    pixels = read_pixels()
+    assert pixels[5, 5].tolist() == RED and pixels[5, 15].tolist() == GREEN
+    assert pixels[25, 5].tolist() == GREEN and pixels[25, 15].tolist() == RED
+    assert pixels[45, 5].tolist() == GREEN and pixels[45, 15].tolist() == BLACK
+    # The tint multiplies, so a red tint leaves red alone and turns green black.
+    assert pixels[65, 5].tolist() == RED and pixels[65, 15].tolist() == BLACK
@@ -0,0 +1,88 @@
+import os
+
+import pytest
+from PIL import Image
+
+
+@pytest.fixture
+def paths(tmp_path):
+    # Three 10x10 textures, 400 bytes each.
+    paths = []
+    for name, color in (("a", (255, 0, 0, 255)), ("b", (0, 255, 0, 255)), ("c", (0, 0, 255, 255))):
+        path = str(tmp_path / f"{name}.png")
+        Image.new("RGBA", (10, 10), color).save(path)
+        paths.append(path)
+    return paths
+
+
+def draw_in_order(gl, textures):
+    # Draw each texture on a frame of its own, so the first is the least recently drawn.
+    drawer = gl.SpriteDrawer()
+    for texture in textures:
+        gl.Time._update()
+        drawer.draw_many(texture, [0, 0])
+
+
+def test_get_shares_one_texture_per_file(gl, paths, monkeypatch):
+    cache = gl.TextureCache()
+    first = cache.get(paths[0])
+    monkeypatch.chdir(os.path.dirname(paths[0]))
+    assert cache.get(os.path.basename(paths[0])) is first
+    assert len(cache) == 1
+    assert paths[0] in cache and paths[1] not in cache
+    assert cache.used_bytes == 10 * 10 * 4
+
+
+def test_release_must_match_get(gl, paths):
+    cache = gl.TextureCache()
+    texture = cache.get(paths[0])
+    with pytest.raises(ValueError):
+        cache.release(paths[1])
+    cache.release(texture)
+    with pytest.raises(ValueError):
+        cache.release(paths[0])
+
+
+def test_referenced_textures_are_never_freed(gl, paths):
+    cache = gl.TextureCache(budget=0)
+    textures = [cache.get(path) for path in paths]
+    assert len(cache) == 3 and cache.used_bytes == 1200
+    cache.release(textures[1])
+    # Releasing trims the cache to its budget, which only frees the unreferenced texture.
+    assert len(cache) == 2 and paths[1] not in cache
+    assert cache.trim(0) == 0
+
+
+def test_trim_frees_least_recently_drawn_first(gl, paths):
+    cache = gl.TextureCache()
+    a, b, c = (cache.get(path) for path in paths)
+    draw_in_order(gl, (c, a, b))
+    for path in paths:
+        cache.release(path)
+    assert len(cache) == 3
+    assert cache.trim(800) == 1
+    assert paths[2] not in cache and paths[0] in cache and paths[1] in cache
+    assert cache.used_bytes == 800
+    assert cache.trim(400) == 1
+    assert paths[0] not in cache and paths[1] in cache
+
+
+def test_releasing_over_budget_frees_at_once(gl, paths):
+    cache = gl.TextureCache(budget=800)
+    a, b, c = (cache.get(path) for path in paths)
+    # Over budget, but everything is still referenced.
+    assert len(cache) == 3
+    draw_in_order(gl, (a, b))
+    cache.release(b)
+    assert paths[1] not in cache
+    # Getting a texture again before it's freed reuses it.
+    cache.release(a)
+    assert cache.get(paths[0]) is a
+
+
+def test_clear_frees_everything(gl, paths):
+    cache = gl.TextureCache()
+    for path in paths:
+        cache.get(path)
+    cache.clear()
+    assert len(cache) == 0 and cache.used_bytes == 0
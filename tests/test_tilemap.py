@@ -0,0 +1,138 @@
+import pytest
+
+
+class FakeTexture:
+    def __init__(self, size):
+        self.size = size
+
+
+@pytest.fixture
+def built(pgs, monkeypatch):
+    # StaticQuads need a graphics device, so the map builds these instead, and the whole map is always on screen.
+    built = []
+
+    class FakeStaticQuads:
+        @staticmethod
+        def visible_area(transform_matrix=None):
+            return pgs.Rectangle(-1e6, -1e6, 2e6, 2e6)
+
+        def set_quads(self, groups):
+            built.append((self, groups))
+
+        def draw(self, transform_matrix=None, pixel_mode=None):
+            pass
+
+        def dispose(self):
+            pass
+
+    monkeypatch.setattr(pgs, "StaticQuads", FakeStaticQuads)
+    return built
+
+
+@pytest.fixture
+def tilemap(pgs, built):
+    import Tilemaps
+    tileset = [FakeTexture(pgs.Size(16, 16)), FakeTexture(pgs.Size(16, 16))]
+    # A 10x6 map of 4x4 chunks: chunks (0, 0) to (2, 1).
+    return Tilemaps.TileMap(tileset, 10, 6, pgs.Size(8, 8), pgs.Vector2(100, 50), chunk_size=4)
+
+
+def chunks_built(tilemap, built) -> list:
+    # Draw the map, and get the top left tile of every chunk that was rebuilt (every tile of these maps is filled).
+    built.clear()
+    tilemap.draw()
+    chunks = []
+    for _, groups in built:
+        rectangles = [rectangle for _, group_rectangles, _ in groups for rectangle in group_rectangles]
+        x = min(int((rectangle[0] - 100) // 8) for rectangle in rectangles) if rectangles else None
+        y = min(int((rectangle[1] - 50) // 8) for rectangle in rectangles) if rectangles else None
+        chunks.append((x, y))
+    return chunks
+
+
+def test_every_chunk_is_built_when_first_seen_and_then_reused(tilemap, built):
+    tilemap.set_tiles(0, 0, [[0] * 10] * 6)
+    assert len(chunks_built(tilemap, built)) == 6
+    assert chunks_built(tilemap, built) == []
+
+
+def test_set_tile_rebuilds_only_its_chunk(tilemap, built):
+    tilemap.set_tiles(0, 0, [[0] * 10] * 6)
+    chunks_built(tilemap, built)
+    tilemap.set_tile(5, 4, 1)
+    assert chunks_built(tilemap, built) == [(4, 4)]
+    # Setting a tile to what it already is changes nothing.
+    tilemap.set_tile(5, 4, 1)
+    assert chunks_built(tilemap, built) == []
+
+
+def test_set_tiles_rebuilds_every_chunk_the_block_touches(tilemap, built):
+    tilemap.set_tiles(0, 0, [[0] * 10] * 6)
+    chunks_built(tilemap, built)
+    # Tiles 3 to 4 across and 2 to 4 down touch chunks (0, 0), (1, 0), (0, 1) and (1, 1).
+    tilemap.set_tiles(3, 2, [[1, 1]] * 3)
+    assert sorted(chunks_built(tilemap, built)) == [(0, 0), (0, 4), (4, 0), (4, 4)]
+
+
+def test_tiles_are_built_where_they_are_in_the_world(pgs, tilemap, built):
+    tilemap.set_tile(9, 5, 1)
+    tilemap.draw()
+    groups = [group for _, groups in built for group in groups]
+    assert len(groups) == 1
+    texture, rectangles, sources = groups[0]
+    assert texture is tilemap.tileset[1]
+    assert rectangles.tolist() == [[100 + 9 * 8, 50 + 5 * 8, 8, 8]]
+    assert sources.tolist() == [[0, 0, 16, 16]]
+
+
+def test_tiles_and_tile_at(pgs, tilemap):
+    assert tilemap.get_tile(0, 0) == tilemap.EMPTY
+    tilemap.set_tile(2, 3, 1)
+    assert tilemap.get_tile(2, 3) == 1 and tilemap.tiles[3, 2] == 1
+    with pytest.raises(ValueError):
+        tilemap.tiles[0, 0] = 1
+    assert tilemap.tile_at(pgs.Vector2(100, 50)) == (0, 0)
+    assert tilemap.tile_at(pgs.Vector2(100 + 2 * 8 + 7.9, 50 + 3 * 8)) == (2, 3)
+    assert tilemap.tile_at(pgs.Vector2(99.9, 50)) is None
+    assert tilemap.tile_at(pgs.Vector2(100 + 10 * 8, 50)) is None
+    assert tilemap.tile_at(pgs.Vector2(100, 50 + 6 * 8)) is None
+
+
+def test_bounds_and_indices_are_checked(tilemap):
+    with pytest.raises(IndexError):
+        tilemap.set_tile(10, 0, 0)
+    with pytest.raises(IndexError):
+        tilemap.set_tile(-1, 0, 0)
+    with pytest.raises(IndexError):
+        tilemap.set_tile(0, 0, 2)
+    with pytest.raises(IndexError):
+        tilemap.set_tile(0, 0, -2)
+    with pytest.raises(IndexError):
+        tilemap.set_tiles(9, 0, [[0, 0]])
+    with pytest.raises(IndexError):
+        tilemap.set_tiles(0, 0, [[0, 5]])
+    with pytest.raises(ValueError):
+        tilemap.set_tiles(0, 0, [0, 0])
+    assert (tilemap.tiles == tilemap.EMPTY).all()
+
+
+def test_static_quads_cover_their_rectangles_and_sources(pgs, monkeypatch):
+    vertices = []
+
+    class FakeStaticBatch:
+        def build_vertices(self, groups):
+            vertices.extend(groups)
+
+    monkeypatch.setattr(pgs, "_StaticBatch", FakeStaticBatch)
+    page = FakeTexture(pgs.Size(64, 32))
+    page._texture = object()
+    quads = pgs.StaticQuads()
+    quads.set_quads([(page, [[10, 20, 8, 4]], [[16, 8, 32, 16]]), (page, [], [])])
+    assert len(vertices) == 1
+    texture, corners = vertices[0]
+    assert texture is page._texture
+    # Top left, top right, bottom left, bottom right.
+    assert corners["position"][:, :2].tolist() == [[10, 20], [18, 20], [10, 24], [18, 24]]
+    assert corners["texture_coordinates"].tolist() == [[0.25, 0.25], [0.75, 0.25], [0.25, 0.75], [0.75, 0.75]]
+    with pytest.raises(ValueError):
+        quads.set_quads([(page, [[0, 0, 1, 1]], [])])
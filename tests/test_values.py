@@ -0,0 +1,74 @@
+import pytest
+
+
+def test_in_place_operators_change_the_vector_itself(backend):
+    vector = backend.Vector2(6, 8)
+    same = vector
+    vector += backend.Vector2(2, 2)
+    assert vector is same and (vector.x, vector.y) == (8, 10)
+    vector -= backend.Vector2(4, 2)
+    assert vector is same and (vector.x, vector.y) == (4, 8)
+    vector *= 2
+    assert vector is same and (vector.x, vector.y) == (8, 16)
+    vector *= backend.Vector2(0.5, 0.25)
+    assert vector is same and (vector.x, vector.y) == (4, 4)
+    vector /= 4
+    assert vector is same and (vector.x, vector.y) == (1, 1)
+    vector /= backend.Vector2(2, 4)
+    assert vector is same and (vector.x, vector.y) == (0.5, 0.25)
+
+
+def test_in_place_operators_reject_other_types(backend):
+    vector = backend.Vector2(1, 1)
+    with pytest.raises(TypeError):
+        vector += 1
+    with pytest.raises(TypeError):
+        vector *= "2"
+
+
+def test_set_changes_the_value_itself(backend):
+    vector = backend.Vector2(1, 2)
+    assert vector.set(3, 4) is vector and (vector.x, vector.y) == (3, 4)
+    size = backend.Size(1, 2)
+    assert size.set(5, 6) is size and (size.width, size.height) == (5, 6)
+    color = backend.Color(1, 2, 3)
+    assert color.set(4, 5, 6) is color and (color.r, color.g, color.b, color.a) == (4, 5, 6, 255)
+
+
+def test_copy_is_independent(backend):
+    vector = backend.Vector2(1, 2)
+    copy = vector.copy()
+    copy += backend.Vector2(1, 1)
+    assert (vector.x, vector.y) == (1, 2) and (copy.x, copy.y) == (2, 3)
+
+
+def test_shared_colors_are_frozen(backend):
+    white = backend.Colors.WHITE
+    with pytest.raises(AttributeError):
+        white.r = 0
+    with pytest.raises(AttributeError):
+        white.set(0, 0, 0)
+    assert (white.r, white.g, white.b, white.a) == (255, 255, 255, 255)
+    assert white.packed_value == 0xFFFFFFFF
+
+
+def test_sprites_copy_the_vectors_they_are_given(backend):
+    position, origin = backend.Vector2(10, 20), backend.Vector2(1, 1)
+    sprite = backend.Sprite(None, position)
+    sprite.origin = origin
+    sprite.position += backend.Vector2(5, 5)
+    sprite.origin *= 2
+    assert (position.x, position.y) == (10, 20) and (origin.x, origin.y) == (1, 1)
+    assert (sprite.position.x, sprite.position.y) == (15, 25) and (sprite.origin.x, sprite.origin.y) == (2, 2)
+    position.x = 0
+    assert sprite.position.x == 15
+
+
+def test_sprites_do_not_share_their_values(backend):
+    first = backend.Sprite(None, backend.Vector2(0, 0))
+    second = backend.Sprite.from_sprite(first)
+    second.position.x = 5
+    second.scale *= 3
+    second.color.r = 0
+    assert first.position.x == 0 and first.scale.x == 1 and first.color.r == 255
+    assert backend.Colors.WHITE.r == 255
@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+import pytest
+
+XS = (0.0, 1.5, -3.0, 12.25, 0.0)
+YS = (0.0, -2.0, 4.0, 0.5, 7.0)
+
+
+def make(backend):
+    return backend.Vector2Array.from_arrays(XS, YS, np.float64)
+
+
+def assert_elements(array, expected):
+    assert len(array) == len(expected)
+    for element, (x, y) in zip(array, expected):
+        assert element.x == pytest.approx(x)
+        assert element.y == pytest.approx(y)
+
+
+def test_construction(backend):
+    Vector2, Vector2Array = backend.Vector2, backend.Vector2Array
+    assert_elements(Vector2Array(3), [(0, 0)] * 3)
+    assert_elements(Vector2Array.full(2, Vector2(1, -1)), [(1, -1)] * 2)
+    assert_elements(Vector2Array.from_vectors([Vector2(x, y) for x, y in zip(XS, YS)]), list(zip(XS, YS)))
+    with pytest.raises(ValueError):
+        Vector2Array.from_arrays((1, 2), (1,))
+
+
+def test_arithmetic_matches_each_element(backend):
+    array, offset = make(backend), backend.Vector2(2, -3)
+    pairs = list(zip(XS, YS))
+    assert_elements(array + offset, [(x + 2, y - 3) for x, y in pairs])
+    assert_elements(offset - array, [(2 - x, -3 - y) for x, y in pairs])
+    assert_elements(array * 2, [(x * 2, y * 2) for x, y in pairs])
+    assert_elements(array / offset, [(x / 2, y / -3) for x, y in pairs])
+    assert_elements(-array, [(-x, -y) for x, y in pairs])
+    assert_elements(array + array, [(x * 2, y * 2) for x, y in pairs])
+    # Arrays with one value per element scale each element by its own value.
+    assert_elements(array * np.arange(len(pairs)), [(x * i, y * i) for i, (x, y) in enumerate(pairs)])
+
+
+def test_in_place_operators_keep_the_array(backend):
+    array = make(backend)
+    before = array
+    array += backend.Vector2(1, 1)
+    array *= 2
+    assert array is before
+    assert_elements(array, [((x + 1) * 2, (y + 1) * 2) for x, y in zip(XS, YS)])
+
+
+def test_length_normalize_and_rotate(backend):
+    array = make(backend)
+    assert array.length() == pytest.approx([math.hypot(x, y) for x, y in zip(XS, YS)])
+    assert array.length_squared() == pytest.approx([x * x + y * y for x, y in zip(XS, YS)])
+    normalized = array.normalize()
+    assert_elements(normalized[:1], [(0, 0)])
+    assert normalized.length()[1:] == pytest.approx(1)
+    angle = 0.6
+    assert_elements(array.rotate(angle), [(x * math.cos(angle) - y * math.sin(angle),
+                                           x * math.sin(angle) + y * math.cos(angle)) for x, y in zip(XS, YS)])
+
+
+def test_indexing_reads_and_writes_the_array(backend):
+    array = make(backend)
+    element = array[1]
+    element.x = 100
+    assert array.x[1] == 100
+    array[-1] = backend.Vector2(5, 6)
+    assert (array[4].x, array[4].y) == (5, 6)
+    with pytest.raises(IndexError):
+        array[len(XS)]
+    # Slices share memory, masks are copies.
+    array[1:3] += backend.Vector2(1, 0)
+    assert array.x[2] == XS[2] + 1
+    masked = array[array.x > 1]
+    masked += backend.Vector2(1000, 0)
+    assert array.x.max() < 1000
+
+
+def test_to_interleaved(backend):
+    interleaved = make(backend).to_interleaved()
+    assert interleaved.shape == (len(XS), 2)
+    assert interleaved.flags.c_contiguous
+    assert interleaved.tolist() == [list(pair) for pair in zip(XS, YS)]
+
+
+def test_lerp_and_clamp(backend):
+    Vector2, Vector2Array = backend.Vector2, backend.Vector2Array
+    array = make(backend)
+    assert_elements(Vector2Array.lerp(array, Vector2(10, 10), 0.5), [((x + 10) / 2, (y + 10) / 2) for x, y in zip(XS, YS)])
+    assert_elements(array.clamp(Vector2(-1, -1), Vector2(2, 2)),
+                    [(min(max(x, -1), 2), min(max(y, -1), 2)) for x, y in zip(XS, YS)])
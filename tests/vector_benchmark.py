@@ -0,0 +1,71 @@
+import sys
+import os
+sys.path.append(os.path.dirname("../"))
+import timeit
+import tracemalloc
+from src import *
+
+# A microbenchmark for the hot value types. The old dict-backed Vector2 is kept here as a baseline to compare against.
+# Run it from this folder: python vector_benchmark.py
+
+
+class DictVector2:
+    def __init__(self, x: float, y: float):
+        self.x: float = x
+        self.y: float = y
+
+    def __add__(self, other: 'DictVector2') -> 'DictVector2':
+        return DictVector2(self.x + other.x, self.y + other.y)
+
+    def __mul__(self, other) -> 'DictVector2':
+        if type(other) == DictVector2:
+            return DictVector2(self.x * other.x, self.y * other.y)
+        elif type(other) == float or type(other) == int:
+            return DictVector2(self.x * other, self.y * other)
+        else:
+            raise TypeError(f"unsupported operand type(s) for *: 'Vector2' and '{type(other).__name__}'")
+
+
+SETUP = """
+position = Vector2(10, 20)
+velocity = Vector2(1.5, -2.5)
+dict_position = DictVector2(10, 20)
+dict_velocity = DictVector2(1.5, -2.5)
+delta = 0.016
+"""
+
+
+def time_it(statement: str, number: int = 200000) -> float:
+    # Best of 5, in nanoseconds per run.
+    return min(timeit.repeat(statement, SETUP, globals=globals(), number=number, repeat=5)) / number * 1e9
+
+
+def memory_of(factory, count: int = 100000) -> float:
+    # Bytes allocated per object.
+    tracemalloc.start()
+    objects = [factory(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+if __name__ == "__main__":
+    results = [
+        ("construct", time_it("DictVector2(1.0, 2.0)"), time_it("Vector2(1.0, 2.0)")),
+        ("position = position + velocity * delta",
+         time_it("dict_position = dict_position + dict_velocity * delta"),
+         time_it("position = position + velocity * delta")),
+        ("position += velocity * delta (in place)",
+         time_it("dict_position = dict_position + dict_velocity * delta"),
+         time_it("position += velocity * delta")),
+        ("position.set(x, y) vs new Vector2",
+         time_it("dict_position = DictVector2(1.0, 2.0)"),
+         time_it("position.set(1.0, 2.0)")),
+        ("bytes per instance", memory_of(lambda i: DictVector2(i, i)), memory_of(lambda i: Vector2(i, i))),
+    ]
+
+    print(f"{'benchmark':<45}{'dict-backed':>15}{'slotted':>15}{'speedup':>10}")
+    for name, old, new in results:
+        unit = "B" if name.startswith("bytes") else "ns"
+        print(f"{name:<45}{old:>13.1f}{unit:>2}{new:>13.1f}{unit:>2}{old / new:>9.2f}x")